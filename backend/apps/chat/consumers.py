@@ -6,6 +6,9 @@ import logging
 from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.db import database_sync_to_async
 
+# Django Imports
+from django.core.serializers.json import DjangoJSONEncoder
+
 # App Imports
 from .services.ai_agent_service import AIAgentService
 from .models import ChatSession
@@ -14,22 +17,47 @@ logger = logging.Logger(__name__)
 
 
 class ChatConsumer(AsyncWebsocketConsumer):
-    """Websocket consumer for AI Agent chat streaming"""
+    """
+    Websocket consumer for AI Agent chat streaming.
+
+    The session, its video and the agent service are loaded once on connect
+    and reused for every message. The agent's video context is rebuilt when
+    a `video_context_changed` message reaches the `video_context_<video_id>`
+    group.
+    """
 
     async def connect(self):
 
         self.session_id = self.scope["url_route"]["kwargs"]["session_id"]
         self.room_group_name = f"chat_{self.session_id}"
+        self.video_context_group_name = None
+        # Set once the agent is built, see `receive`
+        self.agent_service = None
 
-        session_obj = await self.get_session()
-        if not session_obj:
+        session = await self.get_session()
+        if not session:
 
             await self.close(code=4001)
             return
 
+        # Accepted first: building the agent may fetch the video's metadata
+        # from YouTube, messages received meanwhile wait for connect to end
+        await self.accept()
+
+        try:
+            self.agent_service = await AIAgentService.create(session=session)
+        except Exception as e:
+            logger.error(f"Error creating agent for {self.session_id}: {e}")
+            await self.close(code=1011)
+            return
+
+        self.video_context_group_name = f"video_context_{session.video_id}"
+
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
+        await self.channel_layer.group_add(
+            self.video_context_group_name, self.channel_name
+        )
 
-        await self.accept()
         logger.info(f"Websocket connection opend for {self.session_id}")
         await self.send(
             text_data=json.dumps(
@@ -42,41 +70,41 @@ class ChatConsumer(AsyncWebsocketConsumer):
             )
         )
 
-    async def disconnect(self):
+    async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
+        if self.video_context_group_name:
+            await self.channel_layer.group_discard(
+                self.video_context_group_name, self.channel_name
+            )
+
     async def receive(self, text_data: str):
         """Hnadle incoming messages from user"""
 
         data = json.loads(text_data)
         message = data.get("message")
 
-        if not message:
+        # Building the agent failed and the socket is closing
+        if not message or self.agent_service is None:
             return
 
-        session = await self.get_session()
-        if not session:
-            await self.send(
-                json.dumps({"type": "error", "message": "Session not found"})
-            )
+        try:
+            async for frame in self.agent_service.stream_message(message):
+                await self.send(json.dumps(frame, cls=DjangoJSONEncoder))
 
-            return
+        except Exception as e:
+            await self.send(json.dumps({"type": "error", "message": str(e)}))
+
+    async def video_context_changed(self, event):
+        """Rebuild the agent's video context after the video was updated"""
 
-        agent_service = await AIAgentService.create(session=session)
+        if self.agent_service is None:
+            return
 
         try:
-            async for chunk in agent_service.stream_message(message):
-                await self.send(json.dumps({"type": "message_chunk", "content": chunk}))
-
-            await self.send(
-                json.dumps(
-                    {
-                        "type": "message_complete",
-                    }
-                )
-            )
+            await self.agent_service.refresh_video_context()
         except Exception as e:
-            await self.send(json.dumps({"type": "error", "message": str(e)}))
+            logger.error(f"Error refreshing video context for {self.session_id}: {e}")
 
     @database_sync_to_async
     def get_session(self):
@@ -0,0 +1,55 @@
+# Python Imports
+import statistics
+import time
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from videos.models import Video
+
+# App Imports
+from chat.services.agent_registry_service import (
+    AgentRegistryService,
+    get_agent_registry,
+)
+from chat.services.ai_agent_tools_service import AIAgentToolsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the per-turn cost of building the LLM client, prompt, tool "
+        "schemas and agent executor for every message against binding a "
+        "conversation to the shared agent registry. No provider calls are made."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=50)
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        video = Video(provider_video_id="benchmark")
+
+        def rebuild():
+            AgentRegistryService()
+
+        def shared():
+            with AIAgentToolsService.bind(video):
+                get_agent_registry().executor
+
+        # Built outside the measurement, as it is once per process
+        get_agent_registry()
+
+        for label, turn in (("rebuild", rebuild), ("shared", shared)):
+            times = []
+
+            for _ in range(iterations):
+                start = time.perf_counter()
+                turn()
+                times.append(time.perf_counter() - start)
+
+            self.stdout.write(
+                f"{label:<8} turns={iterations} "
+                f"median={statistics.median(times) * 1000:.2f}ms "
+                f"max={max(times) * 1000:.2f}ms"
+            )
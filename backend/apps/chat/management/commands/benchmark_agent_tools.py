@@ -0,0 +1,89 @@
+# Python Imports
+from unittest import mock
+import asyncio
+import time
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+# Project Imports
+from videos.models import Video
+from videos.services.video_info_cache_service import VideoInfoCacheService
+
+# App Imports
+from chat.services.ai_agent_tools_service import AIAgentToolsService
+
+
+class Command(BaseCommand):
+    help = (
+        "Run agent tools for many simultaneous chats, one chat at a time and "
+        "then concurrently; each chat calls its tools together. Concurrent "
+        "wall time close to the sequential one means tool calls are "
+        "serialised. The agent tool result and video info caches are bypassed "
+        "so every call runs the tool and reaches the YouTube backend. Uses the configured YouTube backend, replay mode "
+        "serves recorded fixtures"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("video_id", help="Video ID (not the YouTube ID)")
+        parser.add_argument("--chats", type=int, default=20)
+        parser.add_argument(
+            "--tools",
+            nargs="+",
+            default=["get_transcript", "search_transcript"],
+            choices=("get_video_info", "get_transcript", "search_transcript"),
+        )
+        parser.add_argument("--query", default="main topic")
+
+    def handle(self, *args, **options):
+        # Without a TTL the result cache runs every tool call, otherwise all
+        # calls after the warm-up would measure a cache lookup. Video info is
+        # neither read from nor written to its cache for the same reason.
+        # Transcripts are decoded per call, there's no decode cache to bypass
+        tool_cache = {**settings.AGENT_TOOL_CACHE, "TTL": {}}
+
+        with (
+            override_settings(AGENT_TOOL_CACHE=tool_cache),
+            mock.patch.object(VideoInfoCacheService, "get_cached", return_value=None),
+            mock.patch.object(VideoInfoCacheService, "set"),
+        ):
+            asyncio.run(self.run(options))
+
+    async def run(self, options):
+        video = await Video.objects.select_related("content").aget(
+            id=options["video_id"]
+        )
+        tools = AIAgentToolsService()
+        calls = [
+            (
+                getattr(tools, name),
+                {} if name == "get_transcript" else {"query": options["query"]},
+            )
+            for name in options["tools"]
+        ]
+
+        async def chat():
+            with AIAgentToolsService.bind(video):
+                await asyncio.gather(*(tool(**kwargs) for tool, kwargs in calls))
+
+        # Warm connections and the upstream caches so both runs see the same
+        # state
+        await chat()
+
+        start = time.perf_counter()
+        for _ in range(options["chats"]):
+            await chat()
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        await asyncio.gather(*(chat() for _ in range(options["chats"])))
+        concurrent = time.perf_counter() - start
+
+        self.stdout.write(
+            f"tools={','.join(options['tools'])} chats={options['chats']} "
+            f"sequential={sequential * 1000:.1f}ms "
+            f"concurrent={concurrent * 1000:.1f}ms "
+            f"speedup={sequential / concurrent:.1f}x"
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chatsession',
+            name='summary',
+            field=models.TextField(blank=True, default='', verbose_name='summary'),
+        ),
+        migrations.AddField(
+            model_name='chatsession',
+            name='summary_until',
+            field=models.DateTimeField(blank=True, null=True, verbose_name='summary until'),
+        ),
+    ]
@@ -31,6 +31,10 @@ class ChatSession(CreatedAtMixin):
         related_name="chat_sessions",
         related_query_name="chat_session",
     )
+    # Rolling summary of the messages up to `summary_until`, which are no
+    # longer sent to the agent as they are
+    summary = models.TextField("summary", blank=True, default="")
+    summary_until = models.DateTimeField("summary until", null=True, blank=True)
 
     class Meta:
         constraints = [
@@ -0,0 +1,122 @@
+"""
+Process level registry of the chat agent
+"""
+
+# Python Imports
+from functools import lru_cache
+
+# Third Party Imports
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain.agents import AgentExecutor, create_openai_functions_agent
+from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+# Django Imports
+from django.conf import settings
+
+# Project Imports
+from core.rate_limiter import LangChainRateLimiter, get_rate_limiter
+
+# App Imports
+from .ai_agent_tools_service import AIAgentToolsService
+
+
+# Tags the agent's own LLM calls, telling its tokens apart from LLM calls
+# made inside tools
+AGENT_LLM_TAG = "agent_llm"
+
+# Template variables: video_id, video_title, history_summary
+SYSTEM_PROMPT = """ 
+            You are VidBoost AI Agent. an expert video content assistant. You help content creators optimize their YouTube videos by:
+
+            1. Analyzing video content and transcript
+            2. Generating engaging titles, scripts and thumbnails
+            3. Providing insights on video performance
+
+            
+            Specific Enforcement:
+            - When the user asks to generate, suggest, improve, rewrite, or optimize a YouTube **title**, 
+            you MUST call the `generate_title` tool.
+            - Do NOT generate titles directly in your response.
+            - The `generate_title` tool will return only one clean title. 
+            After calling it, respond to the user using that tool’s output.
+            - When the user asks for several titles, alternatives or options, call `generate_titles` once
+            with the number of titles they want instead of calling `generate_title` repeatedly.
+            - When the user mentions **thumbnail** or **image**, call `generate_image`.
+            - When the user asks about a specific topic, moment or detail of the video, call `search_transcript`
+            and cite the returned timestamps. Only call `get_transcript` when the whole content is needed.
+
+            
+            Guidelines:
+            - Be helpful, concise and actionable
+            - Refere to video by it's title
+            - Use emojis to more conversation more engaging
+            - If error occurs, explain it to user and ask them to retry again later.
+            - If the error suggest the user upgrade, explain that they must upgrade to use this feature, tell them to go to 'Manage Plan' in the header and upgrade.
+            - When generating a single title, make it engaging and SEO-friendly (50 - 60 characters)
+            - When creating thumbnails, describe visual elements clearly
+            - Always base suggestions on actual video content when available
+            - If a tool response starts with `cached: true` it was reused from a recent call, tell the user the result is cached and not new, saving their tokens
+            - Don't use cached titles always generate new one.
+            - Always format your responses for notion.
+
+            Video Context:
+            - Video ID: {video_id}
+            - Video Title: {video_title}
+
+            Summary Of Earlier Conversation:
+            {history_summary}
+
+        """
+
+
+class AgentRegistryService:
+    """
+    Builds the chat agent once: the LLM client, the prompt template, the tool
+    schemas and the agent executor. Conversations share it, passing their
+    context as prompt variables and binding their video to the tools:
+
+        registry = get_agent_registry()
+        with AIAgentToolsService.bind(video):
+            await registry.executor.ainvoke({"video_id": ..., ...})
+    """
+
+    def __init__(self):
+        self.llm = ChatGoogleGenerativeAI(
+            model="gemini-2.5-flash",
+            google_api_key=settings.GOOGLE_API_KEY,
+            temperature=0.7,
+            tags=[AGENT_LLM_TAG],
+            rate_limiter=LangChainRateLimiter(
+                get_rate_limiter("gemini:gemini-2.5-flash")
+            ),
+        )
+        self.tools = AIAgentToolsService().get_tool_list()
+        self.prompt = ChatPromptTemplate.from_messages(
+            [
+                ("system", SYSTEM_PROMPT),
+                MessagesPlaceholder(variable_name="chat_history"),
+                ("human", "{input}"),
+                MessagesPlaceholder(variable_name="agent_scratchpad"),
+            ]
+        )
+        self.executor = self.create_executor()
+
+    def create_executor(self) -> AgentExecutor:
+        agent = create_openai_functions_agent(
+            llm=self.llm, tools=self.tools, prompt=self.prompt
+        )
+
+        return AgentExecutor(
+            agent=agent,
+            tools=self.tools,
+            verbose=True,
+            return_intermediate_steps=True,
+            max_iterations=5,
+        )
+
+
+@lru_cache(maxsize=None)
+def get_agent_registry() -> AgentRegistryService:
+    """Return this process's agent registry, built on first use"""
+
+    return AgentRegistryService()
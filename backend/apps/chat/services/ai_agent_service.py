@@ -1,26 +1,24 @@
 # Python Imports
-from typing import List, Optional, Dict
+from typing import AsyncIterator, List, Optional, Dict
+import asyncio
 import logging
+import time
 
 # Third Party Imports
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain.agents import AgentExecutor, create_openai_functions_agent
-from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
-
 from asgiref.sync import sync_to_async
 
-# Django Imports
-from django.conf import settings
-
 # Project Imports
+from core import metrics
 from videos.services.youtube_service import YouTubeService
 from videos.models import Video
 
 # App Imports
-from ..models import ChatSession, ChatMessage
+from ..models import ChatSession
+from ..tasks import persist_chat_messages_task
 from .ai_agent_tools_service import AIAgentToolsService
+from .agent_registry_service import AGENT_LLM_TAG, get_agent_registry
+from .chat_history_service import ChatHistoryService
+from .conversation_cache_service import ConversationCacheService
 from ..constants import ChatMessageRoleChoices
 
 logger = logging.Logger(__name__)
@@ -28,21 +26,15 @@ logger = logging.Logger(__name__)
 
 class AIAgentService:
     """
-    Service for managing AI Agent conversations
+    Service for managing AI Agent conversations. The agent itself is shared,
+    see `AgentRegistryService`; a conversation only holds its session and
+    video context.
     """
 
-    def __init__(self, session: ChatSession, system_prompt: str, video: Video):
+    def __init__(self, session: ChatSession, video: Video, video_title: str):
         self.session = session
         self.video = video
-
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-2.5-flash",
-            google_api_key=settings.GOOGLE_API_KEY,
-            temperature=0.7,
-        )
-
-        self.tools = AIAgentToolsService(self.video)
-        self.system_prompt = system_prompt
+        self.video_title = video_title
 
     @classmethod
     async def create(cls, session: ChatSession):
@@ -53,105 +45,69 @@ class AIAgentService:
             agent_service = await AIAgentService.create(session=session)
         """
 
-        video = await sync_to_async(lambda: session.video)()
-        system_prompt = await cls._create_system_prompt(video)
-        return cls(session=session, video=video, system_prompt=system_prompt)
+        video = await Video.objects.select_related("content").aget(id=session.video_id)
+        video_title = await cls._get_video_title(video)
+        return cls(session=session, video=video, video_title=video_title)
 
-    @staticmethod
-    async def _create_system_prompt(video: Video) -> str:
-        """Create a system prompt based on current video context"""
+    async def refresh_video_context(self):
+        """Reload the video after it changed"""
 
-        video_info = await sync_to_async(YouTubeService.fetch_video_info)(
-            video.provider_video_id
+        self.video = await Video.objects.select_related("content").aget(
+            id=self.video.id
         )
+        self.video_title = await self._get_video_title(self.video)
 
-        base_prompt = f""" 
-            You are VidBoost AI Agent. an expert video content assistant. You help content creators optimize their YouTube videos by:
-
-            1. Analyzing video content and transcript
-            2. Generating engaging titles, scripts and thumbnails
-            3. Providing insights on video performance
-
-            
-            Specific Enforcement:
-            - When the user asks to generate, suggest, improve, rewrite, or optimize a YouTube **title**, 
-            you MUST call the `generate_title` tool.
-            - Do NOT generate titles directly in your response.
-            - The `generate_title` tool will return only one clean title. 
-            After calling it, respond to the user using that tool’s output.
-            - When the user mentions **thumbnail** or **image**, call `generate_image`.
-
-            
-            Guidelines:
-            - Be helpful, concise and actionable
-            - Refere to video by it's title
-            - Use emojis to more conversation more engaging
-            - If error occurs, explain it to user and ask them to retry again later.
-            - If the error suggest the user upgrade, explain that they must upgrade to use this feature, tell them to go to 'Manage Plan' in the header and upgrade.
-            - When generating title, generate only one make it engaging and SEO-friendly (50 - 60 characters)
-            - When creating thumbnails, describe visual elements clearly
-            - Always base suggestions on actual video content when available
-            -  If any tool is used analyze the response and if it contains cache then explain that the result is cached not new one saving user token
-            - Don't use cached titles always generate new one.
-            - Always format your responses for notion.
-
-            Video Context:
-            - Video ID: {video.id}
-            - Video Title: {video_info.get("title")}
-
-        """
-        return base_prompt
+    @staticmethod
+    async def _get_video_title(video: Video) -> Optional[str]:
+        # Not thread sensitive, a slow YouTube call mustn't hold the shared
+        # sync thread other consumers use
+        video_info = video.content.metadata or await sync_to_async(
+            YouTubeService.fetch_video_info, thread_sensitive=False
+        )(video.provider_video_id)
 
-    async def _load_chat_history(self) -> List:
-        """Load messages from database"""
+        return video_info.get("title")
 
-        messages = []
+    async def _agent_input(self, user_message: str) -> Dict:
+        """Variables of the shared prompt template for this conversation"""
 
-        for message in await sync_to_async(list)(
-            ChatMessage.objects.filter(session=self.session)
-        ):
-            if message.role == ChatMessageRoleChoices.USER.value:
-                messages.append(HumanMessage(content=message.content))
-            else:
-                messages.append(AIMessage(content=message.content))
+        summary, chat_history = await ChatHistoryService.load(self.session.id)
 
-        return messages
+        return {
+            "input": user_message,
+            "chat_history": chat_history,
+            "history_summary": summary or "None",
+            "video_id": str(self.video.id),
+            "video_title": self.video_title,
+        }
 
     async def _save_message(
         self, role: str, content: str, tool_calls: Optional[List[str]] = None
-    ) -> ChatMessage:
-        """Save message to database"""
-
-        return await ChatMessage.objects.acreate(
-            role=role,
-            content=content,
-            tools_calls=tool_calls or [],
-            session=self.session,
-        )
+    ) -> Dict:
+        """
+        Append message to the conversation cache, it is written to the
+        database behind by `persist_chat_messages_task`
+        """
 
-    def create_agent(self) -> AgentExecutor:
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                SystemMessage(content=self.system_prompt),
-                MessagesPlaceholder(variable_name="chat_history"),
-                ("human", "{input}"),
-                MessagesPlaceholder(variable_name="agent_scratchpad"),
-            ]
-        )
+        message = ConversationCacheService.message(role, content)
 
-        agent = create_openai_functions_agent(
-            llm=self.llm, tools=self.tools.get_tool_list(), prompt=prompt
+        # Not thread sensitive, chats mustn't queue on one shared sync thread
+        await sync_to_async(self._write_message, thread_sensitive=False)(
+            message | {"tool_calls": tool_calls}
         )
 
-        agent_executor = AgentExecutor(
-            agent=agent,
-            tools=self.tools.get_tool_list(),
-            verbose=True,
-            return_intermediate_steps=True,
-            max_iterations=5,
-        )
+        return message
+
+    def _write_message(self, message: Dict) -> None:
+        session_id = str(self.session.id)
+
+        # Persisted even if the cache is unavailable, the cache is rebuilt
+        # from the database on its next read
+        try:
+            ConversationCacheService.append(session_id, message)
+        except Exception as e:
+            logger.warning(f"Error caching chat message of {session_id}: {str(e)}")
 
-        return agent_executor
+        persist_chat_messages_task.delay(session_id, [message])
 
     async def proccess_message(self, user_message: str) -> Dict:
         """
@@ -167,31 +123,19 @@ class AIAgentService:
             }
         """
 
-        await self._save_message(content=user_message, role="user")
+        # Loaded first, the message itself is the agent's input
+        agent_input = await self._agent_input(user_message)
 
-        chat_history = await self._load_chat_history()
+        await self._save_message(content=user_message, role="user")
 
-        agent = self.create_agent()
+        agent = get_agent_registry().executor
 
         try:
-            result = await agent.ainvoke(
-                {"input": user_message, "chat_history": chat_history}
-            )
+            with AIAgentToolsService.bind(self.video):
+                result = await agent.ainvoke(agent_input)
 
             response_text = result.get("output")
-            intermediate_steps = result.get("intermediate_steps", [])
-
-            tool_calls = []
-            for step in intermediate_steps:
-                if len(step) >= 2:
-                    action, observation = step[0], step[1]
-                    tool_calls.append(
-                        {
-                            "tool": action.tool,
-                            "input": action.tool_input,
-                            "output": observation,
-                        }
-                    )
+            tool_calls = self._get_tool_calls(result)
 
             assistant_message = await self._save_message(
                 role=ChatMessageRoleChoices.ASSISTANT.value,
@@ -202,38 +146,129 @@ class AIAgentService:
             return {
                 "message": response_text,
                 "tool_calls": tool_calls,
-                "message_id": str(assistant_message.id),
+                "message_id": assistant_message["id"],
             }
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             raise Exception(str(e))
 
-    async def stream_message(self, user_message: str):
+    async def stream_message(self, user_message: str) -> AsyncIterator[Dict]:
         """
-        Stream agent response token by token (for WebSocket)
-        Yields chunks of text as they're generated
+        Stream the agent run as WebSocket frames, as it happens:
+
+        - {'type': 'message_chunk', 'content': str}: answer tokens
+        - {'type': 'tool_start', 'tool': str, 'input': dict, 'run_id': str}
+        - {'type': 'tool_end', 'tool': str, 'run_id': str}
+        - {'type': 'message_complete', 'ttft': float | None}: seconds until the
+          first token
+        - {'type': 'error', 'message': str}
+
+        Time to first token and total turn time are recorded as the
+        `chat.ttft_seconds` and `chat.turn_seconds` metrics.
         """
 
-        await self._save_message(content=user_message, role="user")
+        started_at = time.perf_counter()
+        ttft = None
+
+        # Loaded first, the message itself is the agent's input
+        agent_input = await self._agent_input(user_message)
 
-        chat_history = await self._load_chat_history()
+        await self._save_message(content=user_message, role="user")
 
-        agent = self.create_agent()
+        agent = get_agent_registry().executor
 
         full_response = ""
+        result = {}
 
         try:
-            async for chunk in agent.astream(
-                {"input": user_message, "chat_history": chat_history}
-            ):
-                if "output" in chunk:
-                    text = chunk.get("output")
-                    full_response += text
-                    yield text
+            with AIAgentToolsService.bind(self.video):
+                async for event in agent.astream_events(agent_input, version="v2"):
+                    kind = event["event"]
+
+                    if kind == "on_chat_model_stream":
+                        if AGENT_LLM_TAG not in event.get("tags", []):
+                            continue
+
+                        text = self._get_chunk_text(event["data"]["chunk"])
+                        if not text:
+                            continue
+
+                        if ttft is None:
+                            ttft = time.perf_counter() - started_at
+                            await asyncio.to_thread(
+                                metrics.observe, "chat.ttft_seconds", ttft
+                            )
+
+                        full_response += text
+                        yield {"type": "message_chunk", "content": text}
+
+                    elif kind == "on_tool_start":
+                        yield {
+                            "type": "tool_start",
+                            "tool": event["name"],
+                            "input": event["data"].get("input"),
+                            "run_id": event["run_id"],
+                        }
+
+                    elif kind == "on_tool_end":
+                        yield {
+                            "type": "tool_end",
+                            "tool": event["name"],
+                            "run_id": event["run_id"],
+                        }
+
+                    elif kind == "on_chain_end" and not event["parent_ids"]:
+                        result = event["data"].get("output") or {}
+
+            response_text = result.get("output") or full_response
+
+            # Answers that were not generated token by token (e.g. the agent
+            # stopped at its iteration limit)
+            if not full_response and response_text:
+                yield {"type": "message_chunk", "content": response_text}
 
             await self._save_message(
-                role=ChatMessageRoleChoices.ASSISTANT.value, content=full_response
+                role=ChatMessageRoleChoices.ASSISTANT.value,
+                content=response_text,
+                tool_calls=self._get_tool_calls(result),
             )
+
+            await asyncio.to_thread(
+                metrics.observe, "chat.turn_seconds", time.perf_counter() - started_at
+            )
+
+            yield {"type": "message_complete", "ttft": ttft}
+
         except Exception as e:
             logger.error(f"Error streaming message: {e}")
-            yield f"Error: {str(e)}"
+            yield {"type": "error", "message": str(e)}
+
+    @staticmethod
+    def _get_chunk_text(chunk) -> str:
+        """Text of a streamed message chunk, whose content may be a list of parts"""
+
+        if isinstance(chunk.content, str):
+            return chunk.content
+
+        return "".join(
+            part if isinstance(part, str) else part.get("text", "")
+            for part in chunk.content
+        )
+
+    @staticmethod
+    def _get_tool_calls(result: Dict) -> List[Dict]:
+        """Tool calls of an agent run, from its intermediate steps"""
+
+        tool_calls = []
+        for step in result.get("intermediate_steps", []):
+            if len(step) >= 2:
+                action, observation = step[0], step[1]
+                tool_calls.append(
+                    {
+                        "tool": action.tool,
+                        "input": action.tool_input,
+                        "output": observation,
+                    }
+                )
+
+        return tool_calls
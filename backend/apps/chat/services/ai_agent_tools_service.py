@@ -3,45 +3,84 @@ Service defines Tools called by AI Agent
 """
 
 # Python Imports
+import asyncio
 import logging
-from typing import Optional, List, Annotated
-
-# Django Imports
-from django.conf import settings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, List, Annotated
 
 # Third Party Imports
-from requests.exceptions import HTTPError
+from httpx import HTTPError
 from langchain_core.tools import StructuredTool
-from langchain_groq import ChatGroq
-from langchain_core.messages import HumanMessage, SystemMessage
 
 # App Imports
 from .image_generation_service import ImageGenerationService
+from .tool_result_cache_service import ToolResultCacheService
+from .title_generation_service import TitleGenerationService
 
 # Project Imports
-from videos.models import Video, Title
+from core.rate_limiter import RateLimitTimeout
+from videos.models import Video, Transcript
+from videos.transcript_codec import CompactTranscript
+from videos.services.transcript_index_service import (
+    TranscriptIndexService,
+    TranscriptNotIndexedError,
+)
+from videos.utils import seconds_to_timestamp
 from videos.services.youtube_service import YouTubeService
 
 
 logger = logging.Logger(__name__)
 
+# Video of the conversation the agent is currently answering, see `bind`
+_current_video: ContextVar[Video] = ContextVar("agent_tools_video")
+
 
 class AIAgentToolsService:
+    """
+    Tools act on the video bound to the current context, so their schemas
+    are built once and shared by every conversation:
+
+        with AIAgentToolsService.bind(video):
+            await agent.ainvoke(...)
+
+    Tools are coroutines: I/O uses async clients, and the ORM and libraries
+    without async support (yt-dlp, boto3) run in worker threads outside the
+    shared thread-sensitive executor, so concurrent conversations don't wait
+    on each other.
+    """
 
-    def __init__(self, video: Optional[Video] = None):
-        self.video = video
+    def __init__(self):
         self.youtube_service = YouTubeService
         self.image_generation = ImageGenerationService
+        self.result_cache = ToolResultCacheService
+        self.title_generation = TitleGenerationService
 
-    def get_video_info(self, query: str = "") -> str:
-        """Fetch current Youtube video information including title, description, views,likes, comments,channel's name. use this when user asks about video state or metadata."""
+    @property
+    def video(self) -> Video:
+        return _current_video.get()
+
+    @staticmethod
+    @contextmanager
+    def bind(video: Video) -> Iterator[None]:
+        """Run the tools called within this block against `video`"""
 
+        token = _current_video.set(video)
         try:
-            video_info = self.youtube_service.fetch_video_info(
-                self.video.provider_video_id
+            yield
+        finally:
+            _current_video.reset(token)
+
+    async def get_video_info(self, query: str = "") -> str:
+        """Fetch current Youtube video information including title, description, views,likes, comments,channel's name. use this when user asks about video state or metadata."""
+
+        async def fetch():
+            video_info = await asyncio.to_thread(
+                self.youtube_service.fetch_video_info, self.video.provider_video_id
             )
 
-            return f"""
+            return (
+                f"""
                     Video Information:
                     - Title: {video_info.get("title")}
                     - Description: {video_info.get("description")}
@@ -51,34 +90,103 @@ class AIAgentToolsService:
                     - Comments: {video_info.get("comment_count")}
                     - Published: {video_info.get("published_at")}
                     - Channel: {video_info.get("channel").get("name")}
-                    """
+                    """,
+                True,
+            )
+
+        try:
+            return await self.result_cache.get_or_set(
+                str(self.video.id), "get_video_info", {}, fetch
+            )
 
         except Exception as e:
             return f" Error fetching video info: {str(e)}"
 
-    def get_transcript(self) -> str:
-        """Fetch current video transcription. Use this when user asks to analyze content, generate summaries,generate video thumbnail or create script based on the video."""
+    async def get_transcript(self) -> str:
+        """Fetch current video full transcription. Use this when user asks to analyze the whole content, generate summaries,generate video thumbnail or create script based on the video."""
+
+        async def fetch():
+            try:
+                transcript = await self.video.aget_transcript()
+                # Decoding and rendering a long transcript is CPU bound
+                text = await asyncio.to_thread(lambda: transcript.segments.to_text())
+                is_complete = transcript.is_complete
+            except Transcript.DoesNotExist:
+                transcript_data = await asyncio.to_thread(
+                    self.youtube_service.fetch_transcript, self.video.provider_video_id
+                )
+                text = CompactTranscript.from_segments(
+                    transcript_data.get("transcript")
+                ).to_text()
+                is_complete = True
+
+            if not is_complete:
+                return (
+                    f"Partial Transcript, still being fetched: (en:\n\n {text})",
+                    False,
+                )
+
+            return f"Full Transcript: (en:\n\n {text})", True
 
         try:
-            if self.video.related_transcript:
-                video_transcript = self.video.related_transcript.transcript
-            else:
-                video_transcript = self.youtube_service.fetch_transcript(
-                    self.video.provider_video_id
-                ).get("transcript")
-
-            return f"Full Transcript: (en:\n\n {video_transcript})"
+            return await self.result_cache.get_or_set(
+                str(self.video.id), "get_transcript", {}, fetch
+            )
 
         except Exception as e:
             return f" Error fetching video transcript: {str(e)}"
 
-    def generate_image(
+    async def search_transcript(
+        self,
+        query: Annotated[str, "What to look for in the video transcript"],
+        top_k: Annotated[int, "Number of transcript passages to return"] = 5,
+    ) -> str:
+        """Search the current video transcript and return only the most relevant timestamped passages. Use this when user asks about a specific topic, moment or detail in the video instead of fetching the full transcript."""
+
+        async def fetch():
+            transcript = await self.video.aget_transcript()
+            if not transcript.is_complete:
+                return (
+                    " Error searching video transcript: transcript is still being fetched, retry shortly",
+                    False,
+                )
+
+            chunks = await TranscriptIndexService.asearch(
+                transcript, query, top_k=top_k
+            )
+
+            passages = "\n\n".join(
+                f"[{seconds_to_timestamp(chunk.start)} - {seconds_to_timestamp(chunk.end)}] {chunk.text}"
+                for chunk in chunks
+            )
+            return f"Relevant Transcript Passages (en):\n\n{passages}", True
+
+        try:
+            return await self.result_cache.get_or_set(
+                str(self.video.id),
+                "search_transcript",
+                {"query": query, "top_k": top_k},
+                fetch,
+            )
+
+        except Transcript.DoesNotExist:
+            return " Error searching video transcript: transcript not available yet"
+
+        except TranscriptNotIndexedError:
+            return " Error searching video transcript: transcript is still being indexed, retry shortly or use get_transcript"
+
+        except Exception as e:
+            return f" Error searching video transcript: {str(e)}"
+
+    async def generate_image(
         self, prompt: Annotated[str, "Detailed description about the desired image.ed "]
     ) -> dict:
         """Generating YouTube video thumbnail using AI. Use this tool when user asks to generate video thumbnails."""
 
         try:
-            img_url = self.image_generation.generate_with_hugginface(prompt, self.video)
+            img_url = await self.image_generation.agenerate_with_hugginface(
+                prompt, self.video
+            )
 
             return {
                 "image_url": img_url,
@@ -89,8 +197,10 @@ class AIAgentToolsService:
 
         except HTTPError as e:
             return f" Error generating video's thumbnail : {str(e)}"
+        except RateLimitTimeout as e:
+            return f"Image generation is busy, try again shortly: {str(e)}"
 
-    def generate_title(
+    async def generate_title(
         self,
         summary: Annotated[
             str, "Short summary of the video content to inspire the title"
@@ -100,77 +210,58 @@ class AIAgentToolsService:
         ] = None,
     ) -> str:
         """Generate an engaging YouTube title based on the video summary and optional user considerations. Use this tool when user asks to generate video title and return just title without any addition because is gonna be cached in database."""
-        groq_llm = ChatGroq(
-            model="llama-3.3-70b-versatile",
-            temperature=0.7,
-            groq_api_key=settings.GROQ_API_KEY,
-            max_tokens=100,
-        )
-
-        messages: List = [
-            SystemMessage(
-                content="You are an expert YouTube title strategist who crafts highly clickable, SEO-optimized titles. "
-                "Each title should be emotionally engaging, under 100 characters, and directly relevant to the video content. "
-                "Avoid quotes, emojis, or unnecessary punctuation. Focus on clarity, curiosity, and emotional pull."
-            ),
-            HumanMessage(
-                content=f"""
-                    Video Summary:
-                    {summary}
-
-                    User Considerations:
-                    {considerations or "N/A"}
-
-                    Task:
-                    Write one YouTube title only (no explanation, no list). It must:
-                    - Be under 100 characters.
-                    - Use strong keywords that boost search visibility.
-                    - Spark curiosity or emotion (e.g., fear of missing out, surprise, insight).
-                    - Avoid clickbait or misleading claims.
-
-                    Examples:
-                    ✅ "Why Most People Fail at Productivity (and How to Fix It)"
-                    ✅ "The Hidden Science Behind Perfect Sleep"
-                    ✅ "How I Doubled My YouTube Views in 30 Days"
-                    ❌ "My Thoughts on This Video..."
-                    ❌ "Click Here to See!"
-
-                    Now return ONLY the final title, with no quotes or extra text.
-                """
-            ),
-        ]
 
         try:
-            response = groq_llm.invoke(messages)
-            title = response.content
-            print("=" * 20)
-            print(response.content)
-            print("=" * 20)
-
-            Title.objects.create(title=title, video=self.video)
+            titles = await self.title_generation.generate(
+                self.video, summary, considerations, count=1
+            )
+            if not titles:
+                return "Error generating video title: no valid title was generated, retry"
 
-            return f"title generated successfully!, Title: {title}"
+            return f"title generated successfully!, Title: {titles[0]}"
 
         except Exception as e:
             logger.error(f"Error while trying to generate title: {str(e)}")
             return f"Error generating video title: {str(e)}"
 
+    async def generate_titles(
+        self,
+        summary: Annotated[
+            str, "Short summary of the video content to inspire the titles"
+        ],
+        count: Annotated[int, "Number of titles to generate (max 10)"] = 5,
+        considerations: Annotated[
+            Optional[str], "User requirements for the titles, if any"
+        ] = None,
+    ) -> str:
+        """Generate several alternative YouTube titles at once, ranked best first. Use this tool when user asks for multiple titles, alternatives or options instead of calling generate_title repeatedly."""
+
+        try:
+            titles = await self.title_generation.generate(
+                self.video, summary, considerations, count=count
+            )
+            if not titles:
+                return "Error generating video titles: no valid title was generated, retry"
+
+            ranked = "\n".join(f"{rank}. {title}" for rank, title in enumerate(titles, 1))
+            return f"{len(titles)} titles generated successfully, best first:\n{ranked}"
+
+        except Exception as e:
+            logger.error(f"Error while trying to generate titles: {str(e)}")
+            return f"Error generating video titles: {str(e)}"
+
     def get_tool_list(self) -> List[StructuredTool]:
-        """Return list of LangChain tools"""
-        StructuredTool.from_function(
-            self.get_video_info, name="get_video_info", infer_schema=True
-        )
+        """Return list of LangChain tools, as coroutine tools"""
         return [
             StructuredTool.from_function(
-                self.get_video_info, name="get_video_info", infer_schema=True
-            ),
-            StructuredTool.from_function(
-                self.get_transcript, name="get_transcript", infer_schema=True
-            ),
-            StructuredTool.from_function(
-                self.generate_image, name="generate_image", infer_schema=True
-            ),
-            StructuredTool.from_function(
-                self.generate_title, name="generate_title", infer_schema=True
-            ),
+                coroutine=getattr(self, name), name=name, infer_schema=True
+            )
+            for name in (
+                "get_video_info",
+                "get_transcript",
+                "search_transcript",
+                "generate_image",
+                "generate_title",
+                "generate_titles",
+            )
         ]
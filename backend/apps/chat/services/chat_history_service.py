@@ -0,0 +1,236 @@
+"""
+Token budgeted chat history with a rolling summary
+"""
+
+# Python Imports
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
+import logging
+import math
+
+# Third Party Imports
+from asgiref.sync import sync_to_async
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_groq import ChatGroq
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Project Imports
+from core.rate_limiter import LangChainRateLimiter, get_rate_limiter
+
+# App Imports
+from ..constants import ChatMessageRoleChoices
+from ..models import ChatMessage, ChatSession
+from .conversation_cache_service import ConversationCacheService
+
+
+logger = logging.getLogger(__name__)
+
+# {'id', 'role', 'content', 'created_at'}
+HistoryRow = Dict
+
+
+class ChatHistoryService:
+    """
+    The agent receives the session's summary plus its latest messages that fit
+    in `CHAT_HISTORY["TOKEN_BUDGET"]`, both read from the conversation cache
+    (see `ConversationCacheService`). Messages falling out of that window are
+    folded into `ChatSession.summary` in the background by
+    `summarize_chat_history_task`; `summary_until` marks the last one folded.
+
+    Token counts are estimated (~4 characters per token), the budget is a
+    bound on prompt growth rather than an exact limit.
+    """
+
+    LOCK_KEY_PREFIX = "chat_history:summarize"
+
+    @classmethod
+    async def load(cls, session_id: str) -> Tuple[str, List[BaseMessage]]:
+        """
+        Returns:
+        (summary, messages within the token budget, oldest first)
+        """
+
+        # Not thread sensitive, chats mustn't queue on one shared sync thread
+        summary, rows = await sync_to_async(
+            ConversationCacheService.get, thread_sensitive=False
+        )(session_id)
+        window, overflow = cls.split_window(rows[::-1])
+
+        # Older messages than the cached ones may still be unsummarized
+        if overflow or len(rows) == settings.CHAT_HISTORY["MAX_MESSAGES"]:
+            await cls.schedule_summary(session_id)
+
+        return summary, [cls._to_message(row["role"], row["content"]) for row in window]
+
+    @classmethod
+    def split_window(cls, rows: List[HistoryRow]) -> Tuple[List, List]:
+        """
+        Split rows, newest first, into the window within the token budget and
+        the older overflow. The latest message is always kept.
+
+        Returns:
+        (window, overflow), both oldest first
+        """
+
+        budget = settings.CHAT_HISTORY["TOKEN_BUDGET"]
+        used = 0
+
+        for index, row in enumerate(rows):
+            used += cls.estimate_tokens(row["content"])
+            if used > budget and index > 0:
+                return rows[:index][::-1], rows[index:][::-1]
+
+        return rows[::-1], []
+
+    @classmethod
+    async def schedule_summary(cls, session_id: str) -> None:
+        """Queue a summary refresh unless one is already queued or running"""
+
+        # Imported lazily, tasks import this module
+        from ..tasks import summarize_chat_history_task
+
+        if await cache.aadd(
+            cls._lock_key(session_id),
+            True,
+            settings.CHAT_HISTORY["SUMMARY_LOCK_TTL"],
+        ):
+            await sync_to_async(
+                summarize_chat_history_task.delay, thread_sensitive=False
+            )(str(session_id))
+
+    @classmethod
+    def release_summary_lock(cls, session_id: str) -> None:
+        cache.delete(cls._lock_key(session_id))
+
+    @classmethod
+    def summarize(cls, session_id: str) -> None:
+        """Fold every message older than the current window into the summary"""
+
+        session = ChatSession.objects.only("summary", "summary_until").get(
+            id=session_id
+        )
+
+        window, _ = cls.split_window(
+            list(cls._recent_rows(session_id, session.summary_until))
+        )
+        if not window:
+            return
+
+        older = (
+            cls._unsummarized(session_id, session.summary_until)
+            .filter(created_at__lt=window[0]["created_at"])
+            .order_by("created_at")
+            .values("role", "content", "created_at")
+        )
+
+        summary, summary_until = session.summary, session.summary_until
+        for batch in cls._batches(older.iterator()):
+            summary = cls._fold(summary, batch)
+            summary_until = batch[-1]["created_at"]
+
+        if summary_until == session.summary_until:
+            return
+
+        # Skipped if another run already moved the summary forward
+        if ChatSession.objects.filter(
+            id=session_id, summary_until=session.summary_until
+        ).update(summary=summary, summary_until=summary_until):
+            ConversationCacheService.set_summary(session_id, summary, summary_until)
+
+        logger.info(
+            "Chat history summarized",
+            extra={"chat_session_id": session_id, "summary_until": summary_until},
+        )
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
+        return math.ceil(len(text or "") / 4)
+
+    @classmethod
+    def _batches(cls, rows: Iterable[HistoryRow]) -> Iterator[List[HistoryRow]]:
+        """Group rows so each summary request stays within the token budget"""
+
+        budget = settings.CHAT_HISTORY["TOKEN_BUDGET"]
+        batch, used = [], 0
+
+        for row in rows:
+            tokens = cls.estimate_tokens(row["content"])
+            if batch and used + tokens > budget:
+                yield batch
+                batch, used = [], 0
+
+            batch.append(row)
+            used += tokens
+
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _fold(summary: str, rows: List[HistoryRow]) -> str:
+        conversation = "\n\n".join(f"{row['role']}: {row['content']}" for row in rows)
+
+        response = get_summary_llm().invoke(
+            [
+                SystemMessage(
+                    content="You maintain a running summary of a conversation between "
+                    "a YouTube creator and an AI assistant about one of their videos. "
+                    "Merge the new messages into the current summary. Keep facts, "
+                    "decisions, generated titles, scripts and thumbnails, and open "
+                    "requests; drop small talk. Reply with the updated summary only."
+                ),
+                HumanMessage(
+                    content=f"Current summary:\n{summary or 'None'}\n\n"
+                    f"New messages:\n{conversation}"
+                ),
+            ]
+        )
+
+        return response.content.strip()
+
+    @classmethod
+    def _recent_rows(cls, session_id: str, summary_until):
+        """Latest unsummarized messages, newest first"""
+
+        return (
+            cls._unsummarized(session_id, summary_until)
+            .order_by("-created_at")
+            .values("role", "content", "created_at")[
+                : settings.CHAT_HISTORY["MAX_MESSAGES"]
+            ]
+        )
+
+    @staticmethod
+    def _unsummarized(session_id: str, summary_until):
+        messages = ChatMessage.objects.filter(session_id=session_id)
+
+        if summary_until:
+            messages = messages.filter(created_at__gt=summary_until)
+
+        return messages
+
+    @staticmethod
+    def _to_message(role: str, content: str) -> BaseMessage:
+        if role == ChatMessageRoleChoices.USER.value:
+            return HumanMessage(content=content)
+
+        return AIMessage(content=content)
+
+    @classmethod
+    def _lock_key(cls, session_id: str) -> str:
+        return f"{cls.LOCK_KEY_PREFIX}:{session_id}"
+
+
+@lru_cache(maxsize=None)
+def get_summary_llm() -> ChatGroq:
+    model = settings.CHAT_HISTORY["SUMMARY_MODEL"]
+
+    return ChatGroq(
+        model=model,
+        temperature=0,
+        groq_api_key=settings.GROQ_API_KEY,
+        max_tokens=settings.CHAT_HISTORY["SUMMARY_MAX_TOKENS"],
+        rate_limiter=LangChainRateLimiter(get_rate_limiter(f"groq:{model}")),
+    )
@@ -0,0 +1,234 @@
+"""
+Redis copy of the latest messages of each chat session
+"""
+
+# Python Imports
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import logging
+import uuid
+
+# Django Imports
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+# Project Imports
+from core.redis import get_redis_client
+
+# App Imports
+from ..models import ChatMessage, ChatSession
+
+
+logger = logging.getLogger(__name__)
+
+# Append only to conversations that are cached, others are rebuilt first
+APPEND_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return 0
+end
+
+for i = 3, #ARGV do
+    redis.call("rpush", KEYS[2], ARGV[i])
+end
+redis.call("ltrim", KEYS[2], -tonumber(ARGV[1]), -1)
+redis.call("expire", KEYS[1], ARGV[2])
+redis.call("expire", KEYS[2], ARGV[2])
+
+return 1
+"""
+
+SET_SUMMARY_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return 0
+end
+
+return redis.call("hset", KEYS[1], "summary", ARGV[1], "summary_until", ARGV[2])
+"""
+
+
+class ConversationCacheService:
+    """
+    Read path of the chat history. Per session:
+
+    - `chat:conversation:<session_id>:messages`: the latest
+      `CHAT_HISTORY["MAX_MESSAGES"]` messages as JSON, oldest first
+    - `chat:conversation:<session_id>:meta`: the session's summary and
+      `summary_until`; its presence marks the conversation as cached
+
+    Messages are appended here as they happen and written to the database
+    behind, by `persist_chat_messages_task`. Both keys expire after
+    `CHAT_HISTORY["CACHE_TTL"]` of inactivity and are rebuilt from the
+    database on the next read.
+
+    Messages are dicts: {'id', 'role', 'content', 'created_at'}, `created_at`
+    being an ISO 8601 string. Their tool calls are persisted but not cached.
+    """
+
+    KEY_PREFIX = "chat:conversation"
+
+    @classmethod
+    def get(cls, session_id: str) -> Tuple[str, List[Dict]]:
+        """
+        Returns:
+        (summary, cached messages not folded into the summary, oldest first)
+        """
+
+        with get_redis_client().pipeline() as pipe:
+            pipe.hgetall(cls._meta_key(session_id))
+            pipe.lrange(cls._messages_key(session_id), 0, -1)
+            meta, messages = pipe.execute()
+
+        if not meta:
+            return cls.rebuild(session_id)
+
+        return meta.get("summary", ""), cls._unsummarized(
+            [json.loads(message) for message in messages], meta.get("summary_until")
+        )
+
+    @classmethod
+    def append(cls, session_id: str, *messages: Dict) -> None:
+        """Append messages, rebuilding the conversation first if it expired"""
+
+        config = settings.CHAT_HISTORY
+
+        appended = get_redis_client().eval(
+            APPEND_SCRIPT,
+            2,
+            cls._meta_key(session_id),
+            cls._messages_key(session_id),
+            config["MAX_MESSAGES"],
+            config["CACHE_TTL"],
+            *[cls._dump(message) for message in messages],
+        )
+
+        if not appended:
+            cls.rebuild(session_id, pending=messages)
+
+    @classmethod
+    def rebuild(
+        cls, session_id: str, pending: Iterable[Dict] = ()
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Load the conversation from the database into the cache, followed by
+        `pending` messages not persisted yet
+
+        Returns:
+        Same as `get`
+        """
+
+        config = settings.CHAT_HISTORY
+
+        summary, summary_until = (
+            ChatSession.objects.filter(id=session_id)
+            .values_list("summary", "summary_until")
+            .get()
+        )
+        rows = (
+            ChatMessage.objects.filter(session_id=session_id)
+            .order_by("-created_at")
+            .values("id", "role", "content", "created_at")[
+                : config["MAX_MESSAGES"]
+            ]
+        )
+
+        messages = [
+            cls.message(
+                row["role"],
+                row["content"],
+                id=str(row["id"]),
+                created_at=row["created_at"],
+            )
+            for row in reversed(rows)
+        ]
+        persisted = {message["id"] for message in messages}
+        messages += [
+            {key: message[key] for key in ("id", "role", "content", "created_at")}
+            for message in pending
+            if message["id"] not in persisted
+        ]
+        messages = messages[-config["MAX_MESSAGES"] :]
+
+        summary_until = summary_until.isoformat() if summary_until else ""
+
+        meta_key, messages_key = cls._meta_key(session_id), cls._messages_key(
+            session_id
+        )
+
+        with get_redis_client().pipeline() as pipe:
+            pipe.delete(messages_key)
+            if messages:
+                pipe.rpush(messages_key, *[cls._dump(message) for message in messages])
+            pipe.hset(
+                meta_key, mapping={"summary": summary, "summary_until": summary_until}
+            )
+            pipe.expire(meta_key, config["CACHE_TTL"])
+            pipe.expire(messages_key, config["CACHE_TTL"])
+            pipe.execute()
+
+        return summary, cls._unsummarized(messages, summary_until)
+
+    @classmethod
+    def set_summary(
+        cls, session_id: str, summary: str, summary_until: datetime
+    ) -> None:
+        """Update the cached summary, if the conversation is cached"""
+
+        try:
+            get_redis_client().eval(
+                SET_SUMMARY_SCRIPT,
+                1,
+                cls._meta_key(session_id),
+                summary,
+                summary_until.isoformat(),
+            )
+        except Exception as e:
+            logger.warning(f"Error caching summary of {session_id}: {str(e)}")
+
+    @staticmethod
+    def message(
+        role: str,
+        content: str,
+        id: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+    ) -> Dict:
+        """
+        Build a message as cached and persisted. IDs and timestamps are
+        assigned here, before the database row exists.
+        """
+
+        return {
+            "id": id or str(uuid.uuid4()),
+            "role": role,
+            "content": content,
+            "created_at": (created_at or timezone.now()).isoformat(),
+        }
+
+    @staticmethod
+    def _dump(message: Dict) -> str:
+        return json.dumps(
+            {key: value for key, value in message.items() if key != "tool_calls"},
+            cls=DjangoJSONEncoder,
+        )
+
+    @staticmethod
+    def _unsummarized(messages: List[Dict], summary_until: Optional[str]) -> List[Dict]:
+        if not summary_until:
+            return messages
+
+        summary_until = datetime.fromisoformat(summary_until)
+
+        return [
+            message
+            for message in messages
+            if datetime.fromisoformat(message["created_at"]) > summary_until
+        ]
+
+    @classmethod
+    def _meta_key(cls, session_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{session_id}:meta"
+
+    @classmethod
+    def _messages_key(cls, session_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{session_id}:messages"
@@ -1,81 +1,93 @@
 """Service for AI image generation"""
 
 # Python Imports
+import asyncio
 import logging
 import mimetypes
 
 # Third Party Imports
-import requests
-from requests.exceptions import HTTPError
+from asgiref.sync import sync_to_async
+import httpx
 
 # Django Imports
 from django.conf import settings
 from django.core.files.base import ContentFile
 
 # Project Imports
+from core.rate_limiter import get_rate_limiter
 from videos.models import Image, Video
 from videos.services.s3_service import S3Service
 
 logger = logging.Logger(__name__)
 
+HUGGINGFACE_IMAGE_MODEL_URL = "https://api-inference.huggingface.co/models/stabilityai/stable-diffusion-xl-base-1.0"
+
 
 class ImageGenerationService:
     """Handle image generation using HuggingFace(Replicate)"""  # Other Image Generation models could be supported in future
 
     @staticmethod
-    def generate_with_hugginface(prompt: str, video: Video) -> str:
+    async def agenerate_with_hugginface(prompt: str, video: Video) -> str:
         """Generate video thumbnail using HugginFace
 
         Args:
         prompt: Image Generation Prompt
+
+        Raises:
+        httpx.HTTPError: The generation request failed
         """
-        try:
-            response = requests.post(
-                "https://api-inference.huggingface.co/models/stabilityai/stable-diffusion-xl-base-1.0",
+
+        await get_rate_limiter("huggingface:stable-diffusion-xl-base-1.0").aacquire()
+
+        async with httpx.AsyncClient(timeout=120) as client:
+            response = await client.post(
+                HUGGINGFACE_IMAGE_MODEL_URL,
                 json={"inputs": prompt},
                 headers={
                     "Content-Type": "application/json",
                     "Authorization": f"Bearer {settings.HUGGINGFACE_API_KEY}",
                 },
             )
+
+        try:
             response.raise_for_status()
 
-            image_bytes = response.content
-            content_type = response.headers.get("Content-Type")
-            ext = mimetypes.guess_extension(content_type)
-            filename = f"generated_image{ext or '.jpg'}"
-
-            image_content = ContentFile(image_bytes, name=filename)
-            image_obj = Image(video=video)
-            image_obj.image.save(
-                filename,
-                image_content,
-                save=True,
+        except httpx.HTTPStatusError:
+            logger.error(
+                "Error Generating video image",
+                extra={"user_id": video.user_id, "video_id": video.id},
             )
+            raise
 
-            s3_service = S3Service()
-            url = s3_service.generate_presigned_url(
-                image_obj.image.name,
-            )
+        content_type = response.headers.get("Content-Type")
+        ext = mimetypes.guess_extension(content_type) if content_type else None
+        filename = f"generated_image{ext or '.jpg'}"
+
+        # Storage, boto3 and ORM calls are blocking, they run in worker threads
+        image_obj = Image(video=video)
+        await asyncio.to_thread(
+            image_obj.image.save,
+            filename,
+            ContentFile(response.content, name=filename),
+            save=False,
+        )
+        await sync_to_async(image_obj.save, thread_sensitive=False)()
+
+        url = await asyncio.to_thread(
+            lambda: S3Service().generate_presigned_url(image_obj.image.name)
+        )
 
-            if not url:
-                logger.error(
-                    "Error presigning url to S3 object for generated image",
-                    extra={
-                        "user_id": video.user.id,
-                        "video_id": video.id,
-                        "image_id": image_obj.id,
-                    },
-                )
-                raise Exception(
-                    f"Error while trying to presign url to S3 object for generated image:{image_obj.id}"
-                )
-
-            return url
-
-        except HTTPError as e:
+        if not url:
             logger.error(
-                "Error Generating video image",
-                extra={"user_id": video.user.id, "video_id": video.id},
+                "Error presigning url to S3 object for generated image",
+                extra={
+                    "user_id": video.user_id,
+                    "video_id": video.id,
+                    "image_id": image_obj.id,
+                },
             )
-            raise Exception(f"Error Generating video image: {response.text()}")
+            raise Exception(
+                f"Error while trying to presign url to S3 object for generated image:{image_obj.id}"
+            )
+
+        return url
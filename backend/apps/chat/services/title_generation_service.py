@@ -0,0 +1,231 @@
+"""
+Service for generating, ranking and storing YouTube title candidates
+"""
+
+# Python Imports
+from functools import lru_cache
+from typing import List, Optional
+import logging
+import re
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+from asgiref.sync import sync_to_async
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_groq import ChatGroq
+from pydantic import BaseModel, Field
+
+# Project Imports
+from core.rate_limiter import LangChainRateLimiter, get_rate_limiter
+from videos.models import Title, Video
+
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+CLICKBAIT_PHRASES = ("click here", "you won't believe", "must see", "gone wrong")
+CURIOSITY_WORDS = {"how", "why", "what", "secret", "mistakes"}
+STOP_WORDS = set(
+    "a an and are as at be by for from how i in is it my of on or that the this "
+    "to was what why with you your".split()
+)
+
+
+class TitleCandidates(BaseModel):
+    titles: List[str] = Field(description="Distinct YouTube title candidates")
+
+
+class TitleGenerationService:
+    """
+    Generates several titles with one structured LLM call. Candidates are
+    cleaned, validated (length, duplicates, titles already generated for the
+    video), ranked with a local heuristic and stored with one bulk insert.
+    """
+
+    @classmethod
+    async def generate(
+        cls,
+        video: Video,
+        summary: str,
+        considerations: Optional[str] = None,
+        count: int = 1,
+    ) -> List[str]:
+        """
+        Generate `count` titles for `video`, best first
+
+        Args:
+        video: Video the titles are for
+        summary: Short summary of the video content
+        considerations: Optional user requirements
+        count: Number of titles, capped at `TITLE_GENERATION["MAX_COUNT"]`
+
+        Returns:
+        Stored titles, fewer than `count` if not enough candidates were valid
+        """
+
+        config = settings.TITLE_GENERATION
+        count = max(1, min(count, config["MAX_COUNT"]))
+
+        # A few spare candidates make up for the ones rejected below
+        candidates = await cls._generate_candidates(
+            summary, considerations, count + config["EXTRA_CANDIDATES"]
+        )
+
+        # ORM calls run outside the shared thread-sensitive executor, so
+        # concurrent chats don't queue behind each other
+        existing = await sync_to_async(cls._existing_titles, thread_sensitive=False)(
+            video
+        )
+        titles = cls._validate(candidates, existing)
+
+        keywords = cls._keywords(f"{summary} {considerations or ''}")
+        titles = sorted(
+            titles, key=lambda title: cls.score(title, keywords), reverse=True
+        )[:count]
+
+        await sync_to_async(Title.objects.bulk_create, thread_sensitive=False)(
+            [Title(title=title, video=video) for title in titles]
+        )
+
+        logger.info(
+            f"Generated {len(titles)} of {count} requested titles",
+            extra={"video_id": video.id, "candidates": len(candidates)},
+        )
+
+        return titles
+
+    @staticmethod
+    def score(title: str, keywords: set) -> float:
+        """
+        Cheap local ranking: length close to the ideal range, overlap with the
+        video's keywords, curiosity cues and no shouting or clickbait
+        """
+
+        config = settings.TITLE_GENERATION
+        ideal_min, ideal_max = config["IDEAL_LENGTH"]
+        lowered = title.lower()
+        words = set(WORD_PATTERN.findall(lowered))
+
+        score = 0.0
+
+        distance = max(ideal_min - len(title), len(title) - ideal_max, 0)
+        score += max(0.0, 3 - distance / 10)
+
+        score += 2 * min(len(words & keywords), 3)
+
+        if any(char.isdigit() for char in title):
+            score += 1
+        if words & CURIOSITY_WORDS or title.endswith("?"):
+            score += 1
+
+        shouted = [word for word in title.split() if len(word) > 3 and word.isupper()]
+        score -= len(shouted)
+        score -= 3 * sum(phrase in lowered for phrase in CLICKBAIT_PHRASES)
+        score -= max(0, sum(title.count(mark) for mark in "!?") - 1)
+
+        return score
+
+    @classmethod
+    async def _generate_candidates(
+        cls, summary: str, considerations: Optional[str], count: int
+    ) -> List[str]:
+        config = settings.TITLE_GENERATION
+
+        messages = [
+            SystemMessage(
+                content="You are an expert YouTube title strategist who crafts highly clickable, SEO-optimized titles. "
+                f"Each title should be emotionally engaging, under {config['MAX_LENGTH']} characters, and directly relevant to the video content. "
+                "Avoid quotes, emojis, or unnecessary punctuation. Focus on clarity, curiosity, and emotional pull."
+            ),
+            HumanMessage(
+                content=f"""
+                    Video Summary:
+                    {summary}
+
+                    User Considerations:
+                    {considerations or "N/A"}
+
+                    Task:
+                    Write {count} distinct YouTube titles. Each must:
+                    - Be under {config['MAX_LENGTH']} characters, ideally {config['IDEAL_LENGTH'][0]} - {config['IDEAL_LENGTH'][1]}.
+                    - Use strong keywords that boost search visibility.
+                    - Spark curiosity or emotion (e.g., fear of missing out, surprise, insight).
+                    - Avoid clickbait or misleading claims.
+                    - Take a different angle than the other titles.
+
+                    Examples:
+                    ✅ "Why Most People Fail at Productivity (and How to Fix It)"
+                    ✅ "The Hidden Science Behind Perfect Sleep"
+                    ✅ "How I Doubled My YouTube Views in 30 Days"
+                    ❌ "My Thoughts on This Video..."
+                    ❌ "Click Here to See!"
+                """
+            ),
+        ]
+
+        result = await get_title_llm().ainvoke(messages)
+
+        return result.titles if result else []
+
+    @classmethod
+    def _existing_titles(cls, video: Video) -> set:
+        return {
+            cls._normalize(title)
+            for title in Title.objects.filter(video=video).values_list(
+                "title", flat=True
+            )
+        }
+
+    @classmethod
+    def _validate(cls, candidates: List[str], existing: set) -> List[str]:
+        config = settings.TITLE_GENERATION
+        seen = set(existing)
+        titles = []
+
+        for candidate in candidates:
+            title = " ".join(candidate.split()).strip("\"'“”‘’ ")
+            normalized = cls._normalize(title)
+
+            if not config["MIN_LENGTH"] <= len(title) <= config["MAX_LENGTH"]:
+                continue
+            if normalized in seen:
+                continue
+
+            seen.add(normalized)
+            titles.append(title)
+
+        return titles
+
+    @staticmethod
+    def _normalize(title: str) -> str:
+        return " ".join(WORD_PATTERN.findall(title.lower()))
+
+    @staticmethod
+    def _keywords(text: str) -> set:
+        return {
+            word
+            for word in WORD_PATTERN.findall(text.lower())
+            if len(word) > 2 and word not in STOP_WORDS
+        }
+
+
+@lru_cache(maxsize=None)
+def get_title_llm():
+    """Structured output Groq client shared by every title request"""
+
+    config = settings.TITLE_GENERATION
+
+    llm = ChatGroq(
+        model=config["MODEL"],
+        temperature=0.9,
+        groq_api_key=settings.GROQ_API_KEY,
+        # Room for the largest batch of candidates
+        max_tokens=40 * (config["MAX_COUNT"] + config["EXTRA_CANDIDATES"]),
+        rate_limiter=LangChainRateLimiter(
+            get_rate_limiter(f"groq:{config['MODEL']}")
+        ),
+    )
+
+    return llm.with_structured_output(TitleCandidates)
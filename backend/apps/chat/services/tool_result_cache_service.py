@@ -0,0 +1,89 @@
+"""
+Short lived cache of agent tool results
+"""
+
+# Python Imports
+from typing import Awaitable, Callable, Dict, Tuple
+import asyncio
+import hashlib
+import json
+import logging
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Project Imports
+from core import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class ToolResultCacheService:
+    """
+    Caches tool results per video and tool arguments, for the tool's TTL in
+    `AGENT_TOOL_CACHE["TTL"]`; tools without a TTL always run. Cached results
+    are returned prefixed with `cached: true` so the agent can tell the user.
+    Hits and misses are recorded as `agent_tool_cache.<tool>.hit|miss`.
+    """
+
+    KEY_PREFIX = "agent_tool"
+    CACHED_FLAG = "cached: true"
+
+    @classmethod
+    async def get_or_set(
+        cls,
+        video_id: str,
+        tool: str,
+        arguments: Dict,
+        fetch: Callable[[], Awaitable[Tuple[str, bool]]],
+    ) -> str:
+        """
+        Return the cached result of `tool` or run `fetch`
+
+        Args:
+        video_id: Video the tool runs against
+        tool: Tool name
+        arguments: Tool arguments, part of the cache key
+        fetch: Returns (result, cacheable); e.g. partial transcripts aren't
+        """
+
+        ttl = settings.AGENT_TOOL_CACHE["TTL"].get(tool)
+        if not ttl:
+            result, _ = await fetch()
+            return result
+
+        key = cls._key(video_id, tool, arguments)
+
+        # Django's cache has no native async Redis client, its `aget`/`aset`
+        # would run on the shared thread-sensitive executor
+        try:
+            result = await asyncio.to_thread(cache.get, key)
+        except Exception as e:
+            logger.warning(f"Tool result cache unavailable for {tool}: {str(e)}")
+            result = None
+
+        if result is not None:
+            await asyncio.to_thread(metrics.increment, f"agent_tool_cache.{tool}.hit")
+            return f"{cls.CACHED_FLAG}\n{result}"
+
+        await asyncio.to_thread(metrics.increment, f"agent_tool_cache.{tool}.miss")
+
+        result, cacheable = await fetch()
+
+        if cacheable:
+            try:
+                await asyncio.to_thread(cache.set, key, result, timeout=ttl)
+            except Exception as e:
+                logger.warning(f"Error caching {tool} result: {str(e)}")
+
+        return result
+
+    @classmethod
+    def _key(cls, video_id: str, tool: str, arguments: Dict) -> str:
+        digest = hashlib.sha1(
+            json.dumps(arguments, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        return f"{cls.KEY_PREFIX}:{video_id}:{tool}:{digest}"
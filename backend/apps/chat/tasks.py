@@ -0,0 +1,78 @@
+"""
+Celery tasks for chat sessions
+"""
+
+# Python Imports
+from typing import Dict, List
+import logging
+
+# Django Imports
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+
+# Third Party Imports
+from celery import shared_task
+
+# App Imports
+from .models import ChatMessage
+from .services.chat_history_service import ChatHistoryService
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(ignore_result=True)
+def summarize_chat_history_task(session_id: str):
+    """
+    Fold the messages that fell out of the session's history window into its
+    summary
+
+    Args:
+        session_id: ChatSession ID
+    """
+
+    try:
+        ChatHistoryService.summarize(session_id)
+
+    except Exception as e:
+        logger.error(f"Error summarizing chat history of {session_id}: {str(e)}")
+
+    finally:
+        ChatHistoryService.release_summary_lock(session_id)
+
+
+@shared_task(bind=True, ignore_result=True, max_retries=5, default_retry_delay=5)
+def persist_chat_messages_task(self, session_id: str, messages: List[Dict]):
+    """
+    Write behind messages already appended to the conversation cache (see
+    `ConversationCacheService`). Idempotent: messages keep the IDs and
+    timestamps they were cached with.
+
+    Args:
+        session_id: ChatSession ID
+        messages: [{'id', 'role', 'content', 'created_at', 'tool_calls'}]
+    """
+
+    chat_messages = [
+        ChatMessage(
+            id=message["id"],
+            session_id=session_id,
+            role=message["role"],
+            content=message["content"],
+            tools_calls=message.get("tool_calls") or [],
+        )
+        for message in messages
+    ]
+
+    try:
+        with transaction.atomic():
+            ChatMessage.objects.bulk_create(chat_messages, ignore_conflicts=True)
+
+            # created_at is auto_now_add, restore the time messages were sent
+            for chat_message, message in zip(chat_messages, messages):
+                chat_message.created_at = parse_datetime(message["created_at"])
+            ChatMessage.objects.bulk_update(chat_messages, ["created_at"])
+
+    except Exception as e:
+        logger.error(f"Error persisting chat messages of {session_id}: {str(e)}")
+        raise self.retry(exc=e)
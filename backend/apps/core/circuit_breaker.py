@@ -0,0 +1,156 @@
+"""
+Cross-process circuit breaker backed by Redis
+"""
+
+# Python Imports
+from typing import Callable, TypeVar
+import logging
+
+# Third Party Imports
+from redis.exceptions import RedisError
+
+# App Imports
+from . import metrics
+from .redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Fail fast while an upstream keeps failing. State is shared by every
+    ASGI and Celery process:
+
+    - closed: calls go through; `failure_threshold` failures within
+      `failure_window` seconds open the circuit
+    - open: calls raise CircuitOpenError for `recovery_timeout` seconds
+    - half-open: a single trial call goes through; success closes the
+      circuit, failure opens it again
+
+    Only exceptions accepted by `is_failure` count as failures, so callers
+    can ignore errors that are the upstream's correct answer (e.g. a deleted
+    video). The state is exposed as the `circuit_breaker.<name>.state` gauge
+    (0 closed, 1 half-open, 2 open).
+
+    Usage:
+
+        youtube_circuit = CircuitBreaker("youtube")
+        youtube_circuit.call(lambda: fetch(video_id))
+    """
+
+    KEY_PREFIX = "circuit_breaker"
+
+    CLOSED, HALF_OPEN, OPEN = 0, 1, 2
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        failure_window: int = 60,
+        recovery_timeout: int = 60,
+        is_failure: Callable[[Exception], bool] = lambda e: True,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.failure_window = failure_window
+        self.recovery_timeout = recovery_timeout
+        self.is_failure = is_failure
+
+    def call(self, fn: Callable[[], T]) -> T:
+        client = get_redis_client()
+
+        try:
+            self._before_call(client)
+        except RedisError as e:
+            logger.warning(f"Circuit breaker unavailable for {self.name}: {str(e)}")
+            return fn()
+
+        try:
+            result = fn()
+
+        except Exception as e:
+            if self.is_failure(e):
+                self._safely(self._record_failure, client)
+            else:
+                self._safely(self._record_success, client)
+            raise
+
+        self._safely(self._record_success, client)
+        return result
+
+    def retry_after(self) -> int:
+        """Seconds until the circuit may let a trial call through"""
+
+        try:
+            return max(get_redis_client().ttl(self._key("open")), 0)
+        except RedisError:
+            return 0
+
+    def _before_call(self, client) -> None:
+        if client.exists(self._key("open")):
+            self._reject()
+
+        if client.exists(self._key("half_open")):
+            # Only one caller probes the upstream while half-open
+            if not client.set(
+                self._key("trial"), 1, nx=True, ex=self.recovery_timeout
+            ):
+                self._reject()
+
+            metrics.set_gauge(self._gauge(), self.HALF_OPEN)
+
+    def _reject(self) -> None:
+        metrics.increment(f"circuit_breaker.{self.name}.rejected")
+        raise CircuitOpenError(f"Circuit {self.name} is open, try again later")
+
+    def _record_failure(self, client) -> None:
+        if client.exists(self._key("half_open")):
+            self._open(client)
+            return
+
+        failures_key = self._key("failures")
+        failures = client.incr(failures_key)
+
+        if failures == 1:
+            client.expire(failures_key, self.failure_window)
+
+        if failures >= self.failure_threshold:
+            self._open(client)
+
+    def _record_success(self, client) -> None:
+        # Failures expire with their window, a success only ends a trial
+        if client.delete(self._key("half_open")):
+            client.delete(self._key("failures"), self._key("trial"))
+            metrics.set_gauge(self._gauge(), self.CLOSED)
+            logger.info(f"Circuit {self.name} closed")
+
+    def _open(self, client) -> None:
+        with client.pipeline() as pipe:
+            pipe.set(self._key("open"), 1, ex=self.recovery_timeout)
+            # Outlives the open key so the circuit goes half-open, not closed
+            pipe.set(self._key("half_open"), 1, ex=self.recovery_timeout * 10)
+            pipe.delete(self._key("failures"), self._key("trial"))
+            pipe.execute()
+
+        metrics.increment(f"circuit_breaker.{self.name}.opened")
+        metrics.set_gauge(self._gauge(), self.OPEN)
+        logger.warning(f"Circuit {self.name} opened for {self.recovery_timeout}s")
+
+    def _safely(self, fn: Callable, client) -> None:
+        try:
+            fn(client)
+        except RedisError as e:
+            logger.warning(f"Error updating circuit {self.name}: {str(e)}")
+
+    def _gauge(self) -> str:
+        return f"circuit_breaker.{self.name}.state"
+
+    def _key(self, suffix: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.name}:{suffix}"
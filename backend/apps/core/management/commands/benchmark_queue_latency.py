@@ -0,0 +1,62 @@
+# Python Imports
+import statistics
+import time
+
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from core.tasks import queue_load_task, queue_probe_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure interactive queue latency with an idle bulk queue and again "
+        "while a bulk backlog is being drained. Requires running workers for "
+        "both queues."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--probes", type=int, default=20)
+        parser.add_argument(
+            "--interval", type=float, default=0.5, help="Seconds between probes"
+        )
+        parser.add_argument("--bulk-tasks", type=int, default=1000)
+        parser.add_argument(
+            "--bulk-duration", type=float, default=0.5, help="Seconds per bulk task"
+        )
+        parser.add_argument("--interactive-queue", default="interactive")
+        parser.add_argument("--bulk-queue", default="bulk")
+
+    def handle(self, *args, **options):
+        self.report("idle", self.probe(options))
+
+        for _ in range(options["bulk_tasks"]):
+            queue_load_task.apply_async(
+                (options["bulk_duration"],), queue=options["bulk_queue"]
+            )
+
+        self.report("bulk_backlog", self.probe(options))
+
+    def probe(self, options):
+        results = []
+
+        for _ in range(options["probes"]):
+            results.append(
+                queue_probe_task.apply_async(
+                    (time.time(),), queue=options["interactive_queue"], priority=0
+                )
+            )
+            time.sleep(options["interval"])
+
+        return [result.get(timeout=300) for result in results]
+
+    def report(self, label, latencies):
+        latencies = sorted(latencies)
+
+        self.stdout.write(
+            f"{label:<13} probes={len(latencies)} "
+            f"median={statistics.median(latencies) * 1000:.1f}ms "
+            f"p95={latencies[max(int(len(latencies) * 0.95) - 1, 0)] * 1000:.1f}ms "
+            f"max={latencies[-1] * 1000:.1f}ms"
+        )
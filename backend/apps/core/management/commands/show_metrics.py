@@ -0,0 +1,24 @@
+# Django Imports
+from django.core.management.base import BaseCommand
+
+# Project Imports
+from core import metrics
+
+
+class Command(BaseCommand):
+    help = "Print the shared counters and gauges recorded in Redis"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--prefix", default="", help="Only show metrics with this prefix"
+        )
+
+    def handle(self, *args, **options):
+        prefix = options["prefix"]
+
+        for group, values in metrics.snapshot().items():
+            self.stdout.write(f"{group}:")
+
+            for name in sorted(values):
+                if name.startswith(prefix):
+                    self.stdout.write(f"  {name} = {values[name]}")
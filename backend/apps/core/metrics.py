@@ -0,0 +1,63 @@
+"""
+Counters, gauges and timings shared by every ASGI and Celery process
+"""
+
+# Python Imports
+from typing import Dict
+import logging
+
+# App Imports
+from .redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+COUNTERS_KEY = "metrics:counters"
+GAUGES_KEY = "metrics:gauges"
+
+
+def increment(name: str, amount: int = 1) -> None:
+    """Increase counter `name` by `amount`"""
+
+    try:
+        get_redis_client().hincrby(COUNTERS_KEY, name, amount)
+    except Exception as e:
+        logger.warning(f"Error recording metric {name}: {str(e)}")
+
+
+def set_gauge(name: str, value: float) -> None:
+    """Set gauge `name` to its current `value`"""
+
+    try:
+        get_redis_client().hset(GAUGES_KEY, name, value)
+    except Exception as e:
+        logger.warning(f"Error recording metric {name}: {str(e)}")
+
+
+def observe(name: str, value: float) -> None:
+    """Record one observation of `name`, kept as `<name>.count` and `<name>.sum`"""
+
+    try:
+        pipeline = get_redis_client().pipeline(transaction=False)
+        pipeline.hincrby(COUNTERS_KEY, f"{name}.count", 1)
+        pipeline.hincrbyfloat(COUNTERS_KEY, f"{name}.sum", value)
+        pipeline.execute()
+    except Exception as e:
+        logger.warning(f"Error recording metric {name}: {str(e)}")
+
+
+def snapshot() -> Dict[str, Dict[str, str]]:
+    """
+    Returns:
+    {
+        'counters': {name: value},
+        'gauges': {name: value},
+    }
+    """
+
+    client = get_redis_client()
+
+    return {
+        "counters": client.hgetall(COUNTERS_KEY),
+        "gauges": client.hgetall(GAUGES_KEY),
+    }
@@ -0,0 +1,213 @@
+"""
+Coalescing publisher for progress updates sent from Celery workers to
+WebSocket groups
+"""
+
+# Python Imports
+from collections import defaultdict
+from typing import Dict, List, Optional
+import asyncio
+import atexit
+import logging
+import os
+import threading
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+from celery.signals import worker_process_shutdown
+from channels.layers import get_channel_layer
+
+# App Imports
+from . import metrics
+
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressPublisher:
+    """
+    Sends channel layer messages from synchronous code through one event
+    loop running in a background thread, so the channel layer keeps its
+    Redis connections for the lifetime of the process.
+
+    Events published within `window` seconds of each other are coalesced:
+    each group receives one `progress_batch` message carrying its events in
+    order (or the event itself when it is alone). Consumers handle the
+    batch with a `progress_batch` handler. Bulky events (e.g. transcript
+    chunks) are published with `coalesce=False` and always sent as their
+    own message, in order with the group's other events, so batches stay
+    small and bulky events are delivered one by one.
+
+    Usage:
+
+        get_progress_publisher().publish(group, {"type": "task_update", ...})
+    """
+
+    def __init__(self, window: float = 0.05, max_batch: int = 200):
+        self.window = window
+        self.max_batch = max_batch
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+
+    def publish(
+        self, group: str, event: Dict, flush: bool = False, coalesce: bool = True
+    ) -> None:
+        """
+        Queue `event` for `group` without blocking
+
+        Args:
+        group: Channel layer group name
+        event: Channel layer message, with a consumer handler `type`
+        flush: Send the pending batch right away (e.g. terminal updates)
+        coalesce: False to never merge `event` into a `progress_batch`
+        """
+
+        loop = self._ensure_started()
+        loop.call_soon_threadsafe(
+            self._queue.put_nowait, (group, event, flush, coalesce)
+        )
+
+    def flush(self, timeout: float = 5.0) -> None:
+        """Block until every queued event has been sent"""
+
+        if self._loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop).result(
+                timeout
+            )
+        except Exception as e:
+            logger.warning(f"Error flushing progress updates: {str(e)}")
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    self._queue = asyncio.Queue()
+                    loop.create_task(self._run())
+                    started.set()
+                    loop.run_forever()
+
+                threading.Thread(
+                    target=run, name="progress-publisher", daemon=True
+                ).start()
+                started.wait()
+
+                self._loop = loop
+
+        return self._loop
+
+    async def _run(self) -> None:
+        channel_layer = get_channel_layer()
+
+        while True:
+            batch = [await self._queue.get()]
+            deadline = asyncio.get_running_loop().time() + self.window
+
+            # Collect what arrives within the window, unless asked to flush
+            while not batch[-1][2] and len(batch) < self.max_batch:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), remaining)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._send(channel_layer, batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _send(self, channel_layer, batch: List) -> None:
+        events_by_group = defaultdict(list)
+        for group, event, _, coalesce in batch:
+            events_by_group[group].append((event, coalesce))
+
+        # Metrics go to Redis synchronously, keep them off this loop
+        asyncio.get_running_loop().run_in_executor(
+            None, metrics.observe, "progress_publisher.batch_size", len(batch)
+        )
+
+        for group, events in events_by_group.items():
+            pending = []
+
+            for event, coalesce in events:
+                if coalesce:
+                    pending.append(event)
+                    continue
+
+                await self._send_group(channel_layer, group, pending)
+                await self._send_group(channel_layer, group, [event])
+                pending = []
+
+            await self._send_group(channel_layer, group, pending)
+
+    @staticmethod
+    async def _send_group(channel_layer, group: str, events: List[Dict]) -> None:
+        if not events:
+            return
+
+        message = (
+            events[0]
+            if len(events) == 1
+            else {"type": "progress_batch", "events": events}
+        )
+
+        try:
+            await channel_layer.group_send(group, message)
+        except Exception as e:
+            logger.warning(f"Error sending progress to {group}: {str(e)}")
+
+
+_publisher: Optional[ProgressPublisher] = None
+_publisher_lock = threading.Lock()
+
+
+def get_progress_publisher() -> ProgressPublisher:
+    """Return this process's publisher, created on first use"""
+
+    global _publisher
+
+    if _publisher is None:
+        with _publisher_lock:
+            if _publisher is None:
+                _publisher = ProgressPublisher(
+                    window=settings.PROGRESS_PUBLISHER["WINDOW"],
+                    max_batch=settings.PROGRESS_PUBLISHER["MAX_BATCH"],
+                )
+
+    return _publisher
+
+
+def _reset_publisher() -> None:
+    # Forked children (Celery prefork) must not share the parent's loop thread
+    global _publisher, _publisher_lock
+    _publisher = None
+    _publisher_lock = threading.Lock()
+
+
+@worker_process_shutdown.connect
+def _flush_publisher(**kwargs) -> None:
+    if _publisher is not None:
+        _publisher.flush()
+
+
+os.register_at_fork(after_in_child=_reset_publisher)
+atexit.register(_flush_publisher)
@@ -0,0 +1,250 @@
+"""
+Cross-process token bucket rate limiting backed by Redis
+"""
+
+# Python Imports
+from functools import lru_cache
+from typing import List, Optional, Tuple
+import asyncio
+import logging
+import time
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+from langchain_core.rate_limiters import BaseRateLimiter
+from redis.exceptions import RedisError
+
+# App Imports
+from . import metrics
+from .redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+# Reserve tokens from every bucket in KEYS at once, letting balances go
+# negative so callers queue in arrival order: each one sleeps until its tokens
+# have been refilled in the slowest bucket. ARGV holds the request followed by
+# a rate and capacity per key. Returns {reserved (0/1), seconds to wait}. Uses
+# Redis time so every process shares one clock.
+RESERVE_SCRIPT = """
+local requested = tonumber(ARGV[1])
+local max_wait = tonumber(ARGV[2])
+
+local time = redis.call("time")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local balances = {}
+local wait = 0
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local capacity = tonumber(ARGV[i * 2 + 2])
+
+    local bucket = redis.call("hmget", key, "tokens", "updated_at")
+    local tokens = tonumber(bucket[1]) or capacity
+    local updated_at = tonumber(bucket[2]) or now
+
+    tokens = math.min(capacity, tokens + math.max(now - updated_at, 0) * rate)
+    tokens = tokens - requested
+    balances[i] = tokens
+
+    if tokens < 0 then
+        wait = math.max(wait, -tokens / rate)
+    end
+end
+
+if max_wait >= 0 and wait > max_wait then
+    return {0, tostring(wait)}
+end
+
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 + 1])
+    local capacity = tonumber(ARGV[i * 2 + 2])
+
+    redis.call("hset", key, "tokens", tostring(balances[i]), "updated_at", tostring(now))
+    redis.call("expire", key, math.ceil((capacity - balances[i]) / rate) + 1)
+end
+
+return {1, tostring(wait)}
+"""
+
+
+class RateLimitTimeout(Exception):
+    """Raised when tokens would not be available within the timeout"""
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every ASGI and Celery process: `rate` tokens per
+    second refill a bucket holding at most `capacity` (the allowed burst).
+
+    Callers wait in arrival order. `timeout` bounds the wait (None waits as
+    long as needed, 0 never waits); if it would be exceeded nothing is
+    consumed and RateLimitTimeout is raised. Waits are recorded as the
+    `rate_limiter.<name>.wait_seconds` metric.
+
+    Usage:
+
+        get_rate_limiter("youtube").acquire()
+        await get_rate_limiter("gemini:gemini-2.5-flash").aacquire()
+    """
+
+    KEY_PREFIX = "rate_limiter"
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.timeout = timeout
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = -1) -> float:
+        """
+        Block until `tokens` are available
+
+        Args:
+        tokens: Tokens to consume
+        timeout: Maximum wait in seconds, defaults to the limiter's timeout
+
+        Returns:
+        Seconds waited
+        """
+
+        wait = self._reserve(tokens, timeout)
+        if wait > 0:
+            time.sleep(wait)
+
+        return wait
+
+    async def aacquire(
+        self, tokens: float = 1, timeout: Optional[float] = -1
+    ) -> float:
+        """Async version of `acquire`"""
+
+        wait = await asyncio.to_thread(self._reserve, tokens, timeout)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        return wait
+
+    def _buckets(self) -> List[Tuple[str, float, float]]:
+        return [(f"{self.KEY_PREFIX}:{self.name}", self.rate, self.capacity)]
+
+    def _reserve(self, tokens: float, timeout: Optional[float]) -> float:
+        timeout = self.timeout if timeout == -1 else timeout
+        buckets = self._buckets()
+
+        try:
+            reserved, wait = get_redis_client().eval(
+                RESERVE_SCRIPT,
+                len(buckets),
+                *(key for key, _, _ in buckets),
+                tokens,
+                -1 if timeout is None else timeout,
+                *(arg for _, rate, capacity in buckets for arg in (rate, capacity)),
+            )
+        except RedisError as e:
+            logger.warning(f"Rate limiter unavailable for {self.name}: {str(e)}")
+            return 0.0
+
+        wait = float(wait)
+
+        if not reserved:
+            metrics.increment(f"rate_limiter.{self.name}.timeout")
+            raise RateLimitTimeout(
+                f"Rate limit for {self.name} exceeded, retry in {wait:.1f}s"
+            )
+
+        metrics.observe(f"rate_limiter.{self.name}.wait_seconds", wait)
+
+        return wait
+
+
+class CompositeRateLimiter(RateLimiter):
+    """
+    Takes tokens from every one of `limiters` atomically, waiting for the
+    slowest bucket. Named after, and timing out like, the last (most
+    specific) limiter.
+    """
+
+    def __init__(self, limiters: List[RateLimiter]):
+        limiter = limiters[-1]
+        super().__init__(
+            limiter.name,
+            rate=limiter.rate,
+            capacity=limiter.capacity,
+            timeout=limiter.timeout,
+        )
+        self.limiters = limiters
+
+    def _buckets(self) -> List[Tuple[str, float, float]]:
+        return [bucket for limiter in self.limiters for bucket in limiter._buckets()]
+
+
+class LangChainRateLimiter(BaseRateLimiter):
+    """
+    Adapts a RateLimiter to LangChain chat models:
+
+        ChatGroq(..., rate_limiter=LangChainRateLimiter(limiter))
+    """
+
+    def __init__(self, limiter: RateLimiter):
+        self.limiter = limiter
+
+    # Blocking calls raise RateLimitTimeout past the limiter's timeout, chat
+    # models ignore the returned flag and would call the provider anyway
+
+    def acquire(self, *, blocking: bool = True) -> bool:
+        if blocking:
+            self.limiter.acquire()
+            return True
+
+        try:
+            self.limiter.acquire(timeout=0)
+            return True
+        except RateLimitTimeout:
+            return False
+
+    async def aacquire(self, *, blocking: bool = True) -> bool:
+        if blocking:
+            await self.limiter.aacquire()
+            return True
+
+        try:
+            await self.limiter.aacquire(timeout=0)
+            return True
+        except RateLimitTimeout:
+            return False
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter(name: str) -> RateLimiter:
+    """
+    Return the limiter configured in `RATE_LIMITS` for `name`. Names are
+    "<provider>" or "<provider>:<model>"; a model's limiter draws from its
+    provider's bucket and from its own, sized by its provider's budget
+    unless it has one of its own.
+    """
+
+    budgets = settings.RATE_LIMITS
+    provider = name.split(":", 1)[0]
+    budget = budgets.get(name) or budgets[provider]
+
+    limiter = RateLimiter(
+        name,
+        rate=budget["RATE"],
+        capacity=budget.get("BURST"),
+        timeout=budget.get("TIMEOUT"),
+    )
+
+    if name == provider:
+        return limiter
+
+    return CompositeRateLimiter([get_rate_limiter(provider), limiter])
@@ -0,0 +1,15 @@
+# Python Imports
+from functools import lru_cache
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+import redis
+
+
+@lru_cache(maxsize=None)
+def get_redis_client() -> redis.Redis:
+    """Process-wide Redis client used for cross-process coordination"""
+
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
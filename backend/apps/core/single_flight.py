@@ -0,0 +1,192 @@
+"""
+Cross-process request coalescing backed by Redis
+"""
+
+# Python Imports
+from typing import Any, Callable, Dict, Optional, TypeVar
+import json
+import logging
+import time
+import uuid
+
+# Django Imports
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.module_loading import import_string
+
+# Third Party Imports
+from redis.exceptions import RedisError
+
+# App Imports
+from . import metrics
+from .redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Delete the lock only if it is still held by this caller
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time across every ASGI and Celery
+    process. The first caller (leader) takes a Redis lock and runs the call;
+    concurrent callers for the same key (followers) wait for the leader's
+    result to be published instead of repeating the work. Followers fall back
+    to running the call themselves if no result arrives within `wait_timeout`.
+
+    Results must be JSON serializable. Exceptions raised by the leader are
+    re-raised in followers with the same type when it can be imported.
+
+    Usage:
+
+        video_info_flight = SingleFlight("youtube_video_info")
+        video_info_flight.do(video_id, lambda: fetch(video_id))
+    """
+
+    KEY_PREFIX = "single_flight"
+
+    def __init__(
+        self,
+        name: str,
+        lock_timeout: int = 120,
+        wait_timeout: int = 60,
+        result_ttl: int = 30,
+    ):
+        self.name = name
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.result_ttl = result_ttl
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        client = get_redis_client()
+        lock_key = f"{self.KEY_PREFIX}:{self.name}:{key}:lock"
+        token = uuid.uuid4().hex
+
+        try:
+            is_leader = client.set(lock_key, token, nx=True, ex=self.lock_timeout)
+            leader_token = None if is_leader else client.get(lock_key)
+
+            if not is_leader and leader_token is None:
+                # Leader finished between our attempts, try to lead once more
+                is_leader = client.set(lock_key, token, nx=True, ex=self.lock_timeout)
+                leader_token = None if is_leader else client.get(lock_key)
+
+        except RedisError as e:
+            logger.warning(f"Single-flight unavailable for {self.name}: {str(e)}")
+            return fn()
+
+        if is_leader:
+            return self._lead(client, lock_key, token, fn)
+
+        metrics.increment(f"single_flight.{self.name}.coalesced")
+
+        try:
+            outcome = (
+                self._wait(client, lock_key, leader_token) if leader_token else None
+            )
+        except RedisError as e:
+            logger.warning(f"Error waiting for single-flight result: {str(e)}")
+            outcome = None
+
+        if outcome is None:
+            metrics.increment(f"single_flight.{self.name}.wait_timeout")
+            logger.warning(
+                f"No single-flight result for {self.name}:{key}, calling directly"
+            )
+            return fn()
+
+        if "error" in outcome:
+            raise self._build_error(outcome)
+
+        return outcome["result"]
+
+    def _lead(self, client, lock_key: str, token: str, fn: Callable[[], T]) -> T:
+        metrics.increment(f"single_flight.{self.name}.executed")
+
+        try:
+            result = fn()
+
+        except Exception as e:
+            self._publish(
+                client,
+                token,
+                {
+                    "error": str(e),
+                    "error_type": f"{type(e).__module__}.{type(e).__qualname__}",
+                },
+            )
+            raise
+
+        else:
+            self._publish(client, token, {"result": result})
+            return result
+
+        finally:
+            try:
+                client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+            except RedisError as e:
+                logger.warning(f"Error releasing single-flight lock: {str(e)}")
+
+    def _publish(self, client, token: str, outcome: Dict) -> None:
+        try:
+            payload = json.dumps(outcome, cls=DjangoJSONEncoder)
+            client.set(self._result_key(token), payload, ex=self.result_ttl)
+            client.publish(self._channel(token), payload)
+
+        except Exception as e:
+            logger.warning(f"Error publishing single-flight result: {str(e)}")
+
+    def _wait(self, client, lock_key: str, token: str) -> Optional[Dict[str, Any]]:
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        deadline = time.monotonic() + self.wait_timeout
+
+        try:
+            pubsub.subscribe(self._channel(token))
+
+            # The leader may have published before we subscribed
+            payload = client.get(self._result_key(token))
+
+            while payload is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+
+                message = pubsub.get_message(timeout=min(remaining, 1.0))
+                if message and message["type"] == "message":
+                    payload = message["data"]
+
+                elif client.get(lock_key) != token:
+                    # Leader gone without publishing (e.g. killed worker)
+                    payload = client.get(self._result_key(token))
+                    if payload is None:
+                        return None
+
+            return json.loads(payload)
+
+        finally:
+            pubsub.close()
+
+    @staticmethod
+    def _build_error(outcome: Dict) -> Exception:
+        try:
+            error_cls = import_string(outcome.get("error_type", ""))
+            if isinstance(error_cls, type) and issubclass(error_cls, Exception):
+                return error_cls(outcome["error"])
+        except Exception:
+            pass
+
+        return Exception(outcome["error"])
+
+    def _result_key(self, token: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.name}:result:{token}"
+
+    def _channel(self, token: str) -> str:
+        return f"{self.KEY_PREFIX}:{self.name}:channel:{token}"
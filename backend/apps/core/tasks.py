@@ -0,0 +1,39 @@
+"""
+Celery tasks used to measure queue latency
+"""
+
+# Python Imports
+import time
+
+# Third Party Imports
+from celery import shared_task
+
+# App Imports
+from . import metrics
+
+
+@shared_task(bind=True)
+def queue_probe_task(self, sent_at: float) -> float:
+    """
+    Report how long this task waited in its queue
+
+    Args:
+        sent_at: Unix timestamp the task was sent at
+
+    Returns:
+        Queue latency in seconds
+    """
+
+    latency = time.time() - sent_at
+    queue = self.request.delivery_info.get("routing_key", "unknown")
+
+    metrics.observe(f"celery.queue_latency.{queue}", latency)
+
+    return latency
+
+
+@shared_task(ignore_result=True)
+def queue_load_task(duration: float):
+    """Occupy a worker for `duration` seconds"""
+
+    time.sleep(duration)
@@ -0,0 +1,2 @@
+# Dimensions of transcript chunk embeddings (Gemini text-embedding-004)
+TRANSCRIPT_EMBEDDING_DIMENSIONS = 768
@@ -4,25 +4,60 @@ import logging
 
 # Third Party Imports
 from channels.generic.websocket import AsyncWebsocketConsumer
+from asgiref.sync import sync_to_async
 
 
 # App Imports
+from .models import Transcript
 from .tasks import fetch_video_info_task
+from .services.ingestion_registry_service import IngestionRegistryService
+from .services.video_import_service import VideoImportService
 
 
 logger = logging.Logger(__name__)
 
 
-class VideoWebsocketConsumer(AsyncWebsocketConsumer):
+class ProgressBatchMixin:
+    """
+    Forwards coalesced `progress_batch` messages (see
+    `core.progress_publisher`) as one frame:
+    {'type': 'batch', 'events': [...]}. Every event type needs a matching
+    `<type>_payload` method.
+    """
+
+    async def progress_batch(self, event):
+        """Receive a batch of progress updates from Celery via channel layer"""
+
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "batch",
+                    "events": [
+                        getattr(self, f'{batched["type"]}_payload')(batched)
+                        for batched in event["events"]
+                    ],
+                }
+            )
+        )
+
+
+class VideoWebsocketConsumer(ProgressBatchMixin, AsyncWebsocketConsumer):
     """Websocket consumer for real-time Fetch Video Info Celery task updates"""
 
     async def connect(self):
         """Handle Websocket connections"""
 
-        task = fetch_video_info_task.delay(
-            self.scope["url_route"]["kwargs"]["video_id"]
+        video_id = self.scope["url_route"]["kwargs"]["video_id"]
+
+        # Join the task already ingesting this video, if any
+        self.task_id, created = await sync_to_async(
+            IngestionRegistryService.get_or_start
+        )(
+            video_id,
+            lambda task_id: fetch_video_info_task.apply_async(
+                (video_id,), task_id=task_id
+            ),
         )
-        self.task_id = task.id
         self.room_group_name = f"task_{self.task_id}"
 
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
@@ -42,6 +77,9 @@ class VideoWebsocketConsumer(AsyncWebsocketConsumer):
             )
         )
 
+        if not created:
+            await self.replay_task_updates(video_id)
+
     async def disconnect(self, close_code):
         """Handles Websocket disconnection"""
 
@@ -51,17 +89,96 @@ class VideoWebsocketConsumer(AsyncWebsocketConsumer):
 
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
+    async def replay_task_updates(self, video_id: str):
+        """Bring a late joiner up to date with the task's progress so far"""
+
+        events = await sync_to_async(IngestionRegistryService.get_events)(
+            self.task_id
+        )
+
+        for event in events:
+            await self.task_update(event)
+
+        last_status = events[-1]["status"] if events else None
+        if last_status in IngestionRegistryService.TERMINAL_STATUSES:
+            return
+
+        # Transcripts are persisted once fully streamed, send it whole if the
+        # transcript step finished before we joined
+        transcript = await Transcript.objects.filter(
+            content__video__id=video_id, language="en", segment_count__gt=0
+        ).afirst()
+
+        if transcript:
+            await self.transcript_chunk(
+                {"offset": 0, "segments": transcript.segments.to_list()}
+            )
+
     async def task_update(self, event):
         """Receive task updates from Celery via channel layer"""
 
-        await self.send(
-            text_data=json.dumps(
-                {
-                    "type": "task_update",
-                    "task_id": self.task_id,
-                    "message": f'{event.get("message")}',
-                    "status": f'{event.get("status")}',
-                    "data": event.get("data"),
-                }
+        await self.send(text_data=json.dumps(self.task_update_payload(event)))
+
+    async def transcript_chunk(self, event):
+        """Receive streamed transcript segments from Celery via channel layer"""
+
+        await self.send(text_data=json.dumps(self.transcript_chunk_payload(event)))
+
+    def task_update_payload(self, event) -> dict:
+        return {
+            "type": "task_update",
+            "task_id": self.task_id,
+            "message": f'{event.get("message")}',
+            "status": f'{event.get("status")}',
+            "data": event.get("data"),
+            "step": event.get("step"),
+        }
+
+    def transcript_chunk_payload(self, event) -> dict:
+        return {
+            "type": "transcript_chunk",
+            "task_id": self.task_id,
+            "offset": event.get("offset"),
+            "segments": event.get("segments"),
+        }
+
+
+class VideoImportWebsocketConsumer(ProgressBatchMixin, AsyncWebsocketConsumer):
+    """Websocket consumer for real-time progress of a channel/playlist import"""
+
+    async def connect(self):
+        """Handle Websocket connections"""
+
+        self.import_id = self.scope["url_route"]["kwargs"]["import_id"]
+
+        state = await sync_to_async(VideoImportService.get_state)(self.import_id)
+        if not state or state["user_id"] != str(self.scope["user"].id):
+            await self.close(code=4004)
+            return
+
+        self.room_group_name = f"video_import_{self.import_id}"
+
+        await self.channel_layer.group_add(self.room_group_name, self.channel_name)
+
+        await self.accept()
+
+        logger.info(f"Websocket connection opend for import {self.import_id}")
+
+        # Current state first, updates follow as videos are ingested
+        await self.import_update({"state": state})
+
+    async def disconnect(self, close_code):
+        """Handles Websocket disconnection"""
+
+        if hasattr(self, "room_group_name"):
+            await self.channel_layer.group_discard(
+                self.room_group_name, self.channel_name
             )
-        )
+
+    async def import_update(self, event):
+        """Receive import progress from Celery via channel layer"""
+
+        await self.send(text_data=json.dumps(self.import_update_payload(event)))
+
+    def import_update_payload(self, event) -> dict:
+        return {"type": "import_update", **event.get("state")}
@@ -0,0 +1,103 @@
+"""
+Typed errors for YouTube lookups
+"""
+
+# Third Party Imports
+from youtube_transcript_api import (
+    AgeRestricted,
+    InvalidVideoId,
+    NoTranscriptFound,
+    RequestBlocked,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    VideoUnplayable,
+)
+
+# Project Imports
+from core.rate_limiter import RateLimitTimeout
+
+
+class YouTubeError(Exception):
+    """Base error for YouTube lookups"""
+
+    # Permanent errors won't change on retry and are negatively cached
+    permanent = False
+
+
+class VideoUnavailableError(YouTubeError):
+    """Video is private, deleted, age restricted or doesn't exist"""
+
+    permanent = True
+
+
+class TranscriptUnavailableError(YouTubeError):
+    """Transcripts are disabled or missing for the requested languages"""
+
+    permanent = True
+
+
+class YouTubeThrottledError(YouTubeError):
+    """YouTube is rate limiting or blocking our requests"""
+
+
+class YouTubeTransientError(YouTubeError):
+    """Network, upstream or unknown failure worth retrying"""
+
+
+YOUTUBE_ERRORS = {
+    error_cls.__name__: error_cls
+    for error_cls in (
+        VideoUnavailableError,
+        TranscriptUnavailableError,
+        YouTubeThrottledError,
+        YouTubeTransientError,
+    )
+}
+
+# Lowercased yt-dlp error message fragments. Kept specific: generic phrases
+# such as "is not available" also match transient errors ("Requested format
+# is not available") that must not be cached as permanent.
+VIDEO_UNAVAILABLE_MESSAGES = (
+    "private video",
+    "video unavailable",
+    "this video has been removed",
+    "this video is not available",
+    "this video is no longer available",
+    "not made this video available in your country",
+    "confirm your age",
+    "members-only",
+)
+THROTTLED_MESSAGES = (
+    "http error 429",
+    "too many requests",
+    "not a bot",
+)
+
+
+def classify_youtube_error(error: Exception) -> YouTubeError:
+    """Map a raw yt-dlp or transcript API error to a typed YouTubeError"""
+
+    if isinstance(error, YouTubeError):
+        return error
+
+    if isinstance(error, (TranscriptsDisabled, NoTranscriptFound)):
+        return TranscriptUnavailableError(str(error))
+
+    if isinstance(
+        error, (VideoUnavailable, VideoUnplayable, InvalidVideoId, AgeRestricted)
+    ):
+        return VideoUnavailableError(str(error))
+
+    # Our own limiter's budget is exhausted, handled like YouTube's 429s
+    if isinstance(error, (RequestBlocked, RateLimitTimeout)):
+        return YouTubeThrottledError(str(error))
+
+    message = str(error).lower()
+
+    if any(fragment in message for fragment in THROTTLED_MESSAGES):
+        return YouTubeThrottledError(str(error))
+
+    if any(fragment in message for fragment in VIDEO_UNAVAILABLE_MESSAGES):
+        return VideoUnavailableError(str(error))
+
+    return YouTubeTransientError(str(error))
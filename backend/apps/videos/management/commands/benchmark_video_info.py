@@ -0,0 +1,82 @@
+# Python Imports
+import statistics
+import time
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandError
+
+# App Imports
+from videos.services.youtube_backends import (
+    FixtureStore,
+    LiveYouTubeBackend,
+    ReplayYouTubeBackend,
+    get_youtube_backend,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare per-call latency and CPU time of the full yt-dlp extraction "
+        "against the pooled metadata-only path. Calls yt-dlp directly, without "
+        "the video info cache, rate limiter or circuit breaker. In replay mode "
+        "reports the upstream latencies recorded with "
+        "`record_youtube_fixtures --full-info` instead"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("video_ids", nargs="+", help="YouTube video IDs")
+        parser.add_argument("--iterations", type=int, default=3)
+
+    def handle(self, *args, **options):
+        backend = get_youtube_backend()
+
+        if isinstance(backend, ReplayYouTubeBackend):
+            self.report_recorded(options["video_ids"], backend.fixtures)
+            return
+
+        self.measure(options["video_ids"], options["iterations"])
+
+    def measure(self, video_ids, iterations):
+        backend = LiveYouTubeBackend()
+
+        # Warm the extractor pool so it is measured in steady state
+        backend._extract_info(video_ids[0], metadata_only=True)
+
+        for label, metadata_only in (("full", False), ("metadata_only", True)):
+            wall_times, cpu_times = [], []
+
+            for _ in range(iterations):
+                for video_id in video_ids:
+                    wall_start, cpu_start = time.perf_counter(), time.process_time()
+                    backend._extract_info(video_id, metadata_only)
+                    wall_times.append(time.perf_counter() - wall_start)
+                    cpu_times.append(time.process_time() - cpu_start)
+
+            self.stdout.write(
+                f"{label:<14} calls={len(wall_times)} "
+                f"wall_median={statistics.median(wall_times) * 1000:.1f}ms "
+                f"wall_max={max(wall_times) * 1000:.1f}ms "
+                f"cpu_median={statistics.median(cpu_times) * 1000:.1f}ms"
+            )
+
+    def report_recorded(self, video_ids, fixtures: FixtureStore):
+        for label, metadata_only in (("full", False), ("metadata_only", True)):
+            wall_times = []
+
+            for video_id in video_ids:
+                name = FixtureStore.video_info_name(video_id, metadata_only)
+                fixture = fixtures.read("video_info", name) or {}
+
+                if FixtureStore.ELAPSED_FIELD not in fixture:
+                    raise CommandError(
+                        f"No recorded {label} latency for {video_id}, record it "
+                        "with `record_youtube_fixtures --full-info`"
+                    )
+
+                wall_times.append(fixture[FixtureStore.ELAPSED_FIELD])
+
+            self.stdout.write(
+                f"{label:<14} recorded calls={len(wall_times)} "
+                f"wall_median={statistics.median(wall_times) * 1000:.1f}ms "
+                f"wall_max={max(wall_times) * 1000:.1f}ms"
+            )
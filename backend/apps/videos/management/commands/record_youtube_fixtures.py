@@ -0,0 +1,57 @@
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# App Imports
+from videos.services.youtube_backends import (
+    LiveYouTubeBackend,
+    RecordingYouTubeBackend,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Record live video info and transcript responses to fixtures replayable "
+        "with YOUTUBE_BACKEND_MODE=replay"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("video_ids", nargs="+", help="YouTube video IDs")
+        parser.add_argument(
+            "--fixtures-dir", default=settings.YOUTUBE_BACKEND["FIXTURES_DIR"]
+        )
+        parser.add_argument("--languages", nargs="+", default=["en"])
+        parser.add_argument(
+            "--full-info",
+            action="store_true",
+            help="Also record the full (not metadata-only) extraction, replayed "
+            "by benchmark_video_info",
+        )
+
+    def handle(self, *args, **options):
+        backend = RecordingYouTubeBackend(
+            LiveYouTubeBackend(), options["fixtures_dir"]
+        )
+
+        for video_id in options["video_ids"]:
+            recordings = [
+                ("video info", lambda: backend.extract_info(video_id)),
+                (
+                    "transcript",
+                    lambda: backend.fetch_transcript(video_id, options["languages"]),
+                ),
+            ]
+            if options["full_info"]:
+                recordings.append(
+                    (
+                        "full video info",
+                        lambda: backend.extract_info(video_id, metadata_only=False),
+                    )
+                )
+
+            for label, record in recordings:
+                try:
+                    record()
+                    self.stdout.write(f"Recorded {label} for {video_id}")
+                except Exception as e:
+                    self.stdout.write(f"Recorded {label} failure for {video_id}: {e}")
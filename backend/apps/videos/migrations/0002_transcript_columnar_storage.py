@@ -0,0 +1,178 @@
+from array import array
+import sys
+
+import django.core.serializers.json
+from django.conf import settings
+from django.db import migrations, models
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+# Frozen copy of the transcript codec as of this migration, so later changes
+# to videos.transcript_codec don't change what it writes or reads
+DELIMITER = "\x1f"
+COMPRESSION_ZSTD = "zstd"
+
+
+def timestamp_to_seconds(timestamp):
+    seconds = 0.0
+    for part in timestamp.strip().split(":"):
+        seconds = seconds * 60 + float(part)
+
+    return seconds
+
+
+def seconds_to_timestamp(seconds):
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+
+    if hours == 0:
+        if minutes == 0:
+            return f"00:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def encode_segments(segments, compression, level, min_size):
+    """Legacy [{'text', 'timestamp'}] to (starts, durations, text, compression)"""
+
+    starts, durations, texts = array("f"), array("f"), []
+
+    for segment in segments:
+        starts.append(timestamp_to_seconds(segment.get("timestamp") or "0"))
+        durations.append(0.0)
+        texts.append((segment.get("text") or "").replace(DELIMITER, " "))
+
+    # Legacy segments have no durations, derive them from the next start
+    for i in range(len(starts) - 1):
+        durations[i] = max(starts[i + 1] - starts[i], 0.0)
+
+    if sys.byteorder == "big":
+        starts.byteswap()
+        durations.byteswap()
+
+    text = DELIMITER.join(texts).encode("utf-8")
+
+    if (
+        compression == COMPRESSION_ZSTD
+        and zstandard is not None
+        and len(text) >= min_size
+    ):
+        text = zstandard.ZstdCompressor(level=level).compress(text)
+    else:
+        compression = ""
+
+    return starts.tobytes(), durations.tobytes(), text, compression, len(texts)
+
+
+def decode_segments(starts, text, compression):
+    """Blobs back to legacy [{'text', 'timestamp'}]"""
+
+    starts_column = array("f")
+    starts_column.frombytes(bytes(starts))
+    if sys.byteorder == "big":
+        starts_column.byteswap()
+
+    text = bytes(text)
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to decode this transcript")
+        text = zstandard.ZstdDecompressor().decompress(text)
+
+    texts = text.decode("utf-8").split(DELIMITER) if starts_column else []
+
+    return [
+        {"text": text, "timestamp": seconds_to_timestamp(start)}
+        for start, text in zip(starts_column, texts)
+    ]
+
+
+def encode_transcripts(apps, schema_editor):
+    Transcript = apps.get_model("videos", "Transcript")
+    config = settings.TRANSCRIPT_STORAGE
+
+    for transcript in Transcript.objects.iterator(chunk_size=200):
+        (
+            transcript.starts,
+            transcript.durations,
+            transcript.text,
+            transcript.compression,
+            transcript.segment_count,
+        ) = encode_segments(
+            transcript.transcript or [],
+            compression=config["COMPRESSION"],
+            level=config["COMPRESSION_LEVEL"],
+            min_size=config["MIN_COMPRESS_BYTES"],
+        )
+        transcript.save(
+            update_fields=[
+                "starts",
+                "durations",
+                "text",
+                "compression",
+                "segment_count",
+            ]
+        )
+
+
+def decode_transcripts(apps, schema_editor):
+    Transcript = apps.get_model("videos", "Transcript")
+
+    for transcript in Transcript.objects.iterator(chunk_size=200):
+        transcript.transcript = decode_segments(
+            transcript.starts, transcript.text, transcript.compression
+        )
+        transcript.save(update_fields=["transcript"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="transcript",
+            name="transcript",
+            field=models.JSONField(
+                encoder=django.core.serializers.json.DjangoJSONEncoder, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="starts",
+            field=models.BinaryField(default=b"", verbose_name="starts"),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="durations",
+            field=models.BinaryField(default=b"", verbose_name="durations"),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="text",
+            field=models.BinaryField(default=b"", verbose_name="text"),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="compression",
+            field=models.CharField(
+                blank=True, default="", max_length=10, verbose_name="compression"
+            ),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="segment_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="segment count"),
+        ),
+        migrations.RunPython(encode_transcripts, decode_transcripts),
+        migrations.RemoveField(
+            model_name="transcript",
+            name="transcript",
+        ),
+    ]
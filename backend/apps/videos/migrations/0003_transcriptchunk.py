@@ -0,0 +1,67 @@
+import django.db.models.deletion
+import pgvector.django
+from django.db import migrations, models
+
+
+# No approximate (HNSW/IVFFlat) index on `embedding`: searches are scoped to
+# one transcript's few dozen chunks, found through the unique constraint's
+# index and ranked exactly. A global ANN index would filter to the transcript
+# after taking its nearest candidates and could return fewer than `top_k`.
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0002_transcript_columnar_storage"),
+    ]
+
+    operations = [
+        pgvector.django.VectorExtension(),
+        migrations.CreateModel(
+            name="TranscriptChunk",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                ("index", models.PositiveIntegerField(verbose_name="index")),
+                ("start", models.FloatField(verbose_name="start")),
+                ("end", models.FloatField(verbose_name="end")),
+                ("text", models.TextField(verbose_name="text")),
+                (
+                    "embedding",
+                    pgvector.django.VectorField(
+                        dimensions=768, verbose_name="embedding"
+                    ),
+                ),
+                (
+                    "transcript",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="chunks",
+                        related_query_name="chunk",
+                        to="videos.transcript",
+                        verbose_name="transcript",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "transcript chunk",
+                "verbose_name_plural": "transcript chunks",
+                "ordering": ("transcript", "index"),
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="transcriptchunk",
+            constraint=models.UniqueConstraint(
+                fields=("transcript", "index"), name="unique_transcript_chunk_index"
+            ),
+        ),
+    ]
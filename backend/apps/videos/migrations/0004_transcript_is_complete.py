@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0003_transcriptchunk"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="transcript",
+            name="is_complete",
+            field=models.BooleanField(default=True, verbose_name="is complete"),
+        ),
+    ]
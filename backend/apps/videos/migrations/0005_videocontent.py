@@ -0,0 +1,122 @@
+import django.core.serializers.json
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def link_video_contents(apps, schema_editor):
+    Video = apps.get_model("videos", "Video")
+    VideoContent = apps.get_model("videos", "VideoContent")
+    Transcript = apps.get_model("videos", "Transcript")
+
+    provider_video_ids = Video.objects.values_list(
+        "provider_video_id", flat=True
+    ).distinct()
+    VideoContent.objects.bulk_create(
+        [
+            VideoContent(provider_video_id=provider_video_id)
+            for provider_video_id in provider_video_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+    content_ids = dict(VideoContent.objects.values_list("provider_video_id", "id"))
+    for provider_video_id, content_id in content_ids.items():
+        Video.objects.filter(provider_video_id=provider_video_id).update(
+            content_id=content_id
+        )
+
+    # Keep one transcript per video content, preferring complete and recent ones
+    seen_content_ids = set()
+    for transcript in Transcript.objects.select_related("video").order_by(
+        "-is_complete", "-updated_at"
+    ):
+        content_id = content_ids[transcript.video.provider_video_id]
+
+        if content_id in seen_content_ids:
+            transcript.delete()
+            continue
+
+        seen_content_ids.add(content_id)
+        transcript.content_id = content_id
+        transcript.save(update_fields=["content"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0004_transcript_is_complete"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="VideoContent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created at"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="updated at"),
+                ),
+                (
+                    "provider_video_id",
+                    models.CharField(
+                        max_length=36, unique=True, verbose_name="provider video ID"
+                    ),
+                ),
+                (
+                    "metadata",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="metadata",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "video content",
+                "verbose_name_plural": "video contents",
+            },
+        ),
+        migrations.AddField(
+            model_name="video",
+            name="content",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="videos",
+                related_query_name="video",
+                to="videos.videocontent",
+                verbose_name="content",
+            ),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="content",
+            field=models.ForeignKey(
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transcripts",
+                related_query_name="transcript",
+                to="videos.videocontent",
+                verbose_name="content",
+            ),
+        ),
+        migrations.AddField(
+            model_name="transcript",
+            name="language",
+            field=models.CharField(default="en", max_length=10, verbose_name="language"),
+        ),
+        migrations.RunPython(link_video_contents),
+    ]
@@ -0,0 +1,45 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("videos", "0005_videocontent"),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="transcript",
+            name="video",
+        ),
+        migrations.AlterField(
+            model_name="video",
+            name="content",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="videos",
+                related_query_name="video",
+                to="videos.videocontent",
+                verbose_name="content",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="transcript",
+            name="content",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="transcripts",
+                related_query_name="transcript",
+                to="videos.videocontent",
+                verbose_name="content",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="transcript",
+            constraint=models.UniqueConstraint(
+                fields=("content", "language"),
+                name="unique_content_transcript_language",
+            ),
+        ),
+    ]
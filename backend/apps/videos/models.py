@@ -3,14 +3,35 @@ import uuid
 
 # Django Imports
 from django.db import models
+from django.conf import settings
+from django.utils.functional import cached_property
 from django.core.serializers.json import DjangoJSONEncoder
 
+# Third Party Imports
+from asgiref.sync import sync_to_async
+from pgvector.django import VectorField
+
 # Project Imports
-from core.models import TimeStampMixin
+from core.models import CreatedAtMixin, TimeStampMixin
 from authentication.models import User
 
 # App Imports
 from .utils import get_generated_video_image_path
+from .transcript_codec import CompactTranscript
+from .constants import TRANSCRIPT_EMBEDDING_DIMENSIONS
+
+
+class VideoContent(TimeStampMixin):
+    """YouTube video data shared by every user's Video of that video"""
+
+    provider_video_id = models.CharField("provider video ID", max_length=36, unique=True)
+    metadata = models.JSONField(
+        "metadata", encoder=DjangoJSONEncoder, null=True, blank=True
+    )
+
+    class Meta:
+        verbose_name = "video content"
+        verbose_name_plural = "video contents"
 
 
 class Video(TimeStampMixin):
@@ -23,6 +44,27 @@ class Video(TimeStampMixin):
         related_name="videos",
         related_query_name="video",
     )
+    content = models.ForeignKey(
+        VideoContent,
+        verbose_name="content",
+        on_delete=models.PROTECT,
+        related_name="videos",
+        related_query_name="video",
+    )
+
+    def get_transcript(self, language: str = "en") -> "Transcript":
+        """Shared transcript of this video, raises Transcript.DoesNotExist"""
+
+        return Transcript.objects.get(content_id=self.content_id, language=language)
+
+    async def aget_transcript(self, language: str = "en") -> "Transcript":
+        """Async version of `get_transcript`"""
+
+        # Off the shared thread-sensitive executor, so concurrent chats don't
+        # queue behind each other
+        return await sync_to_async(self.get_transcript, thread_sensitive=False)(
+            language
+        )
 
     class Meta:
         verbose_name = "video"
@@ -52,15 +94,47 @@ class Meta:
 
 
 class Transcript(TimeStampMixin):
-    transcript = models.JSONField(encoder=DjangoJSONEncoder)
-
-    video = models.OneToOneField(
-        Video,
-        verbose_name="video",
+    # Columnar storage, see `CompactTranscript`
+    starts = models.BinaryField("starts", default=b"")
+    durations = models.BinaryField("durations", default=b"")
+    text = models.BinaryField("text", default=b"")
+    compression = models.CharField("compression", max_length=10, blank=True, default="")
+    segment_count = models.PositiveIntegerField("segment count", default=0)
+    # False while segments are still being streamed in
+    is_complete = models.BooleanField("is complete", default=True)
+
+    content = models.ForeignKey(
+        VideoContent,
+        verbose_name="content",
         on_delete=models.CASCADE,
-        related_name="related_transcript",
+        related_name="transcripts",
         related_query_name="transcript",
     )
+    language = models.CharField("language", max_length=10, default="en")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=("content", "language"),
+                name="unique_content_transcript_language",
+            ),
+        ]
+
+    @cached_property
+    def segments(self) -> CompactTranscript:
+        return CompactTranscript.decode(
+            self.starts, self.durations, self.text, self.compression
+        )
+
+    def set_segments(self, segments: CompactTranscript) -> None:
+        config = settings.TRANSCRIPT_STORAGE
+        self.starts, self.durations, self.text, self.compression = segments.encode(
+            compression=config["COMPRESSION"],
+            level=config["COMPRESSION_LEVEL"],
+            min_size=config["MIN_COMPRESS_BYTES"],
+        )
+        self.segment_count = len(segments)
+        self.__dict__["segments"] = segments
 
 
 class Meta:
@@ -68,6 +142,37 @@ class Meta:
     verbose_name_plural = "transcripts"
 
 
+class TranscriptChunk(CreatedAtMixin):
+    transcript = models.ForeignKey(
+        Transcript,
+        verbose_name="transcript",
+        on_delete=models.CASCADE,
+        related_name="chunks",
+        related_query_name="chunk",
+    )
+    index = models.PositiveIntegerField("index")
+    start = models.FloatField("start")
+    end = models.FloatField("end")
+    text = models.TextField("text")
+    embedding = VectorField("embedding", dimensions=TRANSCRIPT_EMBEDDING_DIMENSIONS)
+
+    class Meta:
+        verbose_name = "transcript chunk"
+        verbose_name_plural = "transcript chunks"
+        ordering = ("transcript", "index")
+        # Vector search is scoped to one transcript: its few dozen chunks are
+        # found through this constraint's index and ranked exactly. There is
+        # deliberately no approximate (HNSW) index on `embedding`, it would
+        # filter to the transcript after picking candidates across all of them
+        # and could return fewer than `top_k` chunks.
+        constraints = [
+            models.UniqueConstraint(
+                fields=("transcript", "index"),
+                name="unique_transcript_chunk_index",
+            ),
+        ]
+
+
 class Image(TimeStampMixin):
     image = models.ImageField(upload_to=get_generated_video_image_path)
     video = models.ForeignKey(
@@ -2,8 +2,12 @@
 from django.urls import re_path
 
 # App Imports
-from .consumers import VideoWebsocketConsumer
+from .consumers import VideoWebsocketConsumer, VideoImportWebsocketConsumer
 
 websocket_urlpatterns = [
-    re_path(r"^ws/videos/(?P<video_id>[\w-]+)/$", VideoWebsocketConsumer.as_asgi())
+    re_path(
+        r"^ws/videos/imports/(?P<import_id>\w+)/$",
+        VideoImportWebsocketConsumer.as_asgi(),
+    ),
+    re_path(r"^ws/videos/(?P<video_id>[\w-]+)/$", VideoWebsocketConsumer.as_asgi()),
 ]
@@ -2,6 +2,9 @@
 import re
 from typing import Optional
 
+# Django Imports
+from django.conf import settings
+
 # REST Framework Imports
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -49,6 +52,52 @@ class CreateVideoSerializer(serializers.Serializer):
         return attrs
 
 
+class ImportVideosSerializer(serializers.Serializer):
+    """
+    Serializer for importing the videos of a YouTube channel or playlist.
+    Normalizes the URL to what yt-dlp's flat extraction expects
+    """
+
+    url = serializers.URLField()
+    limit = serializers.IntegerField(
+        min_value=1, max_value=settings.VIDEO_IMPORT["MAX_VIDEOS"], required=False
+    )
+
+    PLAYLIST_PATTERN = r"(?:https?:\/\/)?(?:www\.)?youtube\.com\/.*[?&]list=([\w-]+)"
+    CHANNEL_PATTERNS = [
+        r"(?:https?:\/\/)?(?:www\.)?youtube\.com\/(@[\w.-]+)",
+        r"(?:https?:\/\/)?(?:www\.)?youtube\.com\/(channel\/[\w-]+)",
+        r"(?:https?:\/\/)?(?:www\.)?youtube\.com\/(c\/[\w.-]+)",
+        r"(?:https?:\/\/)?(?:www\.)?youtube\.com\/(user\/[\w.-]+)",
+    ]
+
+    def validate(self, attrs: dict) -> dict:
+
+        url = attrs.get("url")
+        attrs.setdefault("limit", settings.VIDEO_IMPORT["MAX_VIDEOS"])
+
+        match = re.search(self.PLAYLIST_PATTERN, url)
+        if match:
+            attrs["source_type"] = "playlist"
+            attrs["source_url"] = (
+                f"https://www.youtube.com/playlist?list={match.group(1)}"
+            )
+            return attrs
+
+        for pattern in self.CHANNEL_PATTERNS:
+            match = re.search(pattern, url)
+
+            if match:
+                # The videos tab, not the channel's tab list
+                attrs["source_type"] = "channel"
+                attrs["source_url"] = f"https://www.youtube.com/{match.group(1)}/videos"
+                return attrs
+
+        raise serializers.ValidationError(
+            "Invalid YouTube URL. Please provide a YouTube channel or playlist link."
+        )
+
+
 class VideoSerializer(serializers.ModelSerializer):
     class Meta:
         model = Video
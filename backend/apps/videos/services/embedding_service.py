@@ -0,0 +1,115 @@
+"""
+Pluggable text embedding providers
+"""
+
+# Python Imports
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import List
+import asyncio
+import hashlib
+import math
+import re
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+# Project Imports
+from core.rate_limiter import get_rate_limiter
+
+# App Imports
+from ..constants import TRANSCRIPT_EMBEDDING_DIMENSIONS
+
+
+class EmbeddingService(ABC):
+    """Base class for embedding providers"""
+
+    def __init__(self, dimensions: int = TRANSCRIPT_EMBEDDING_DIMENSIONS):
+        self.dimensions = dimensions
+
+    @abstractmethod
+    def embed_documents(self, texts: List[str]) -> List[List[float]]: ...
+
+    @abstractmethod
+    def embed_query(self, text: str) -> List[float]: ...
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.to_thread(self.embed_query, text)
+
+
+class GeminiEmbeddingService(EmbeddingService):
+    """Embeddings using Google Generative AI, one rate limited request per call"""
+
+    def __init__(self, dimensions: int = TRANSCRIPT_EMBEDDING_DIMENSIONS):
+        super().__init__(dimensions)
+
+        model = settings.TRANSCRIPT_EMBEDDINGS["MODEL"]
+
+        self.client = GoogleGenerativeAIEmbeddings(
+            model=model,
+            google_api_key=settings.GOOGLE_API_KEY,
+        )
+        self.rate_limiter = get_rate_limiter(f"gemini:{model}")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.rate_limiter.acquire()
+        return self.client.embed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        self.rate_limiter.acquire()
+        return self.client.embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        await self.rate_limiter.aacquire()
+        return await self.client.aembed_query(text)
+
+
+class HashEmbeddingService(EmbeddingService):
+    """
+    Deterministic local stand-in using signed feature hashing of word tokens.
+    No network access; similar texts share tokens and therefore directions.
+    """
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return self._embed(text)
+
+    def _embed(self, text: str) -> List[float]:
+        vector = [0.0] * self.dimensions
+
+        for token in self.TOKEN_PATTERN.findall(text.lower()):
+            digest = int.from_bytes(
+                hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            vector[digest % self.dimensions] += 1.0 if digest >> 63 else -1.0
+
+        norm = math.sqrt(sum(value * value for value in vector))
+        return [value / norm for value in vector] if norm else vector
+
+
+EMBEDDING_PROVIDERS = {
+    "gemini": GeminiEmbeddingService,
+    "hash": HashEmbeddingService,
+}
+
+
+@lru_cache(maxsize=None)
+def get_embedding_service() -> EmbeddingService:
+    """Return the embedding provider configured in `TRANSCRIPT_EMBEDDINGS`"""
+
+    provider = settings.TRANSCRIPT_EMBEDDINGS["PROVIDER"]
+
+    try:
+        return EMBEDDING_PROVIDERS[provider]()
+    except KeyError:
+        raise ValueError(f"Unknown embedding provider: {provider}")
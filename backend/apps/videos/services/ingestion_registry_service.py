@@ -0,0 +1,242 @@
+"""
+Registry of in-flight and completed video ingestion tasks
+"""
+
+# Python Imports
+from typing import Callable, Dict, List, Optional, Tuple
+import json
+import logging
+import uuid
+
+# Django Imports
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Project Imports
+from core.redis import get_redis_client
+
+
+logger = logging.getLogger(__name__)
+
+# Replace the registered task only if it is still the one we inspected
+REPLACE_TASK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("set", KEYS[1], ARGV[2], "EX", ARGV[3])
+end
+return false
+"""
+
+# Unregister the task only if it is still the registered one
+RELEASE_TASK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+class IngestionRegistryService:
+    """
+    Maps a Video to the `fetch_video_info_task` ingesting it, so every
+    WebSocket connection for the video (page refreshes, other tabs,
+    reconnects) joins the same task instead of starting a new one.
+
+    Only interactive tasks are registered: a bulk task would make a user
+    opening the video wait behind the bulk backlog. Imports join registered
+    tasks without registering their own and `watch` them to count them once
+    they finish.
+
+    Task updates are recorded per task and replayed to late joiners. A
+    failed task is replaced by a new one on the next connection, as is a
+    task no worker picked up (no update at all) within
+    `INGESTION_REGISTRY["START_GRACE"]` seconds of its registration, as
+    happens when its message is lost. A task that can't be started is
+    unregistered right away.
+    """
+
+    VIDEO_KEY_PREFIX = "ingestion:video"
+    TASK_KEY_PREFIX = "ingestion:task"
+
+    TERMINAL_STATUSES = ("COMPLETED", "FAILURE")
+
+    @classmethod
+    def get_or_start(
+        cls, video_id: str, start: Callable[[str], None]
+    ) -> Tuple[str, bool]:
+        """
+        Return the task registered for `video_id`, registering and starting a
+        new one when there is none or the registered one failed or is dead
+
+        Args:
+        video_id: Video model ID
+        start: Callable starting the task with the given task ID
+
+        Returns:
+        (task_id, created)
+        """
+
+        client = get_redis_client()
+        video_key = cls._video_key(video_id)
+        ttl = settings.INGESTION_REGISTRY["TTL"]
+
+        task_id = uuid.uuid4().hex
+        registered_task_id = None
+
+        # Retried once in case the registered task expires or is replaced
+        for _ in range(2):
+            if client.set(video_key, task_id, nx=True, ex=ttl):
+                cls._start(client, video_key, task_id, start)
+                return task_id, True
+
+            registered_task_id = client.get(video_key)
+            if registered_task_id is None:
+                continue
+
+            if cls._is_alive(client, video_key, registered_task_id):
+                return registered_task_id, False
+
+            if client.eval(
+                REPLACE_TASK_SCRIPT, 1, video_key, registered_task_id, task_id, ttl
+            ):
+                cls._start(client, video_key, task_id, start)
+                return task_id, True
+
+        if registered_task_id is None:
+            # Redis keeps dropping the key, don't leave the client waiting
+            start(task_id)
+            return task_id, True
+
+        return registered_task_id, False
+
+    @classmethod
+    def get_alive(cls, video_id: str) -> Optional[str]:
+        """Return the task registered for `video_id` if it may still finish"""
+
+        client = get_redis_client()
+        task_id = client.get(cls._video_key(video_id))
+
+        if task_id and cls._is_alive(client, cls._video_key(video_id), task_id):
+            return task_id
+
+        return None
+
+    @classmethod
+    def watch(cls, task_id: str, watcher: str) -> Optional[str]:
+        """
+        Register `watcher` to be returned by `pop_watchers` when `task_id`
+        finishes
+
+        Returns:
+        The task's terminal status if it already finished, in which case the
+        watcher isn't registered
+        """
+
+        client = get_redis_client()
+        watchers_key = cls._watchers_key(task_id)
+
+        with client.pipeline() as pipe:
+            pipe.sadd(watchers_key, watcher)
+            pipe.expire(watchers_key, settings.INGESTION_REGISTRY["TTL"])
+            pipe.execute()
+
+        # The task may have finished before we were added. Whoever removes
+        # the watcher, us or `pop_watchers`, reports the outcome.
+        status = cls._last_event(client, task_id).get("status")
+        if status in cls.TERMINAL_STATUSES and client.srem(watchers_key, watcher):
+            return status
+
+        return None
+
+    @classmethod
+    def pop_watchers(cls, task_id: str) -> List[str]:
+        """Remove and return the watchers of a task that just finished"""
+
+        watchers_key = cls._watchers_key(task_id)
+
+        try:
+            with get_redis_client().pipeline() as pipe:
+                pipe.smembers(watchers_key)
+                pipe.delete(watchers_key)
+                watchers, _ = pipe.execute()
+
+        except Exception as e:
+            logger.warning(f"Error reading watchers of {task_id}: {str(e)}")
+            return []
+
+        return list(watchers)
+
+    @classmethod
+    def record_event(cls, task_id: str, event: Dict) -> None:
+        """Append a task update to the replay log of `task_id`"""
+
+        config = settings.INGESTION_REGISTRY
+        events_key = cls._events_key(task_id)
+
+        try:
+            with get_redis_client().pipeline() as pipe:
+                pipe.rpush(events_key, json.dumps(event, cls=DjangoJSONEncoder))
+                pipe.ltrim(events_key, -config["MAX_EVENTS"], -1)
+                pipe.expire(events_key, config["TTL"])
+                pipe.execute()
+
+        except Exception as e:
+            logger.warning(f"Error recording ingestion event for {task_id}: {str(e)}")
+
+    @classmethod
+    def get_events(cls, task_id: str) -> List[Dict]:
+        """Return the recorded task updates of `task_id`, oldest first"""
+
+        try:
+            events = get_redis_client().lrange(cls._events_key(task_id), 0, -1)
+        except Exception as e:
+            logger.warning(f"Error reading ingestion events for {task_id}: {str(e)}")
+            return []
+
+        return [json.loads(event) for event in events]
+
+    @classmethod
+    def _start(
+        cls, client, video_key: str, task_id: str, start: Callable[[str], None]
+    ) -> None:
+        try:
+            start(task_id)
+
+        except Exception:
+            # e.g. broker down: don't leave later connections joining a task
+            # that will never run
+            try:
+                client.eval(RELEASE_TASK_SCRIPT, 1, video_key, task_id)
+            except Exception as e:
+                logger.warning(f"Error unregistering task {task_id}: {str(e)}")
+            raise
+
+    @classmethod
+    def _is_alive(cls, client, video_key: str, task_id: str) -> bool:
+        last_event = cls._last_event(client, task_id)
+
+        if last_event:
+            return last_event.get("status") != "FAILURE"
+
+        # The key is (re)set with the full TTL on registration, what has
+        # elapsed of it is the time since the task was started
+        config = settings.INGESTION_REGISTRY
+        registered_for = config["TTL"] - client.ttl(video_key)
+
+        return registered_for < config["START_GRACE"]
+
+    @classmethod
+    def _last_event(cls, client, task_id: str) -> Dict:
+        event = client.lindex(cls._events_key(task_id), -1)
+        return json.loads(event) if event else {}
+
+    @classmethod
+    def _video_key(cls, video_id: str) -> str:
+        return f"{cls.VIDEO_KEY_PREFIX}:{video_id}"
+
+    @classmethod
+    def _events_key(cls, task_id: str) -> str:
+        return f"{cls.TASK_KEY_PREFIX}:{task_id}:events"
+
+    @classmethod
+    def _watchers_key(cls, task_id: str) -> str:
+        return f"{cls.TASK_KEY_PREFIX}:{task_id}:watchers"
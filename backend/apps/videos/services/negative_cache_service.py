@@ -0,0 +1,72 @@
+"""
+Shared cache of permanent YouTube lookup failures
+"""
+
+# Python Imports
+import logging
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+
+# Project Imports
+from core import metrics
+
+# App Imports
+from ..exceptions import YOUTUBE_ERRORS, YouTubeError
+
+
+logger = logging.getLogger(__name__)
+
+
+class NegativeCacheService:
+    """
+    Remembers permanent failures (private or deleted videos, missing
+    transcripts) so repeated lookups fail immediately instead of going back
+    to YouTube. Entries expire after `YOUTUBE_RESILIENCE['NEGATIVE_CACHE_TTL']`.
+    """
+
+    KEY_PREFIX = "youtube:negative"
+
+    @classmethod
+    def check(cls, kind: str, key: str) -> None:
+        """
+        Raise the cached error for `kind`/`key`, if any
+
+        Args:
+        kind: Lookup kind, e.g. "video_info" or "transcript"
+        key: Lookup key, e.g. the YouTube Video ID
+        """
+
+        try:
+            entry = cache.get(cls._key(kind, key))
+        except Exception as e:
+            logger.warning(f"Negative cache unavailable for {kind}/{key}: {str(e)}")
+            return
+
+        if entry is None:
+            return
+
+        metrics.increment(f"youtube.negative_cache.{kind}.hit")
+
+        raise YOUTUBE_ERRORS[entry["error_type"]](entry["error"])
+
+    @classmethod
+    def remember(cls, kind: str, key: str, error: YouTubeError) -> None:
+        """Cache `error` for `kind`/`key` if it is permanent"""
+
+        if not error.permanent:
+            return
+
+        try:
+            cache.set(
+                cls._key(kind, key),
+                {"error_type": type(error).__name__, "error": str(error)},
+                timeout=settings.YOUTUBE_RESILIENCE["NEGATIVE_CACHE_TTL"],
+            )
+        except Exception as e:
+            logger.warning(f"Error caching failure for {kind}/{key}: {str(e)}")
+
+    @classmethod
+    def _key(cls, kind: str, key: str) -> str:
+        return f"{cls.KEY_PREFIX}:{kind}:{key}"
@@ -0,0 +1,198 @@
+"""
+Business logic for transcript chunking, embedding and retrieval
+"""
+
+# Python Imports
+from typing import Dict, List
+import logging
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+# Third Party Imports
+from asgiref.sync import sync_to_async
+from pgvector.django import CosineDistance
+
+# App Imports
+from ..models import Transcript, TranscriptChunk
+from ..transcript_codec import CompactTranscript
+from .embedding_service import get_embedding_service
+
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptNotIndexedError(Exception):
+    """Transcript has no embedded chunks yet, indexing has been scheduled"""
+
+
+class TranscriptIndexService:
+
+    LOCK_KEY_PREFIX = "transcript_index:schedule"
+
+    @staticmethod
+    def build_chunks(segments: CompactTranscript, window_seconds: int) -> List[Dict]:
+        """
+        Split a transcript into time-aligned chunks of roughly `window_seconds`
+
+        Returns:
+        [
+            {'index': int, 'start': float, 'end': float, 'text': str},
+        ]
+        """
+
+        chunks = []
+        texts = []
+        chunk_start = None
+        chunk_end = 0.0
+
+        for i in range(len(segments)):
+            segment = segments[i]
+
+            if chunk_start is None:
+                chunk_start = segment["start"]
+
+            elif segment["start"] - chunk_start >= window_seconds:
+                chunks.append(
+                    {
+                        "index": len(chunks),
+                        "start": chunk_start,
+                        "end": chunk_end,
+                        "text": " ".join(texts),
+                    }
+                )
+                texts = []
+                chunk_start = segment["start"]
+
+            texts.append(segment["text"])
+            chunk_end = segment["start"] + segment["duration"]
+
+        if texts:
+            chunks.append(
+                {
+                    "index": len(chunks),
+                    "start": chunk_start,
+                    "end": chunk_end,
+                    "text": " ".join(texts),
+                }
+            )
+
+        return chunks
+
+    @classmethod
+    def index(cls, transcript: Transcript) -> int:
+        """
+        (Re)build the embedded chunks of a transcript
+
+        Returns:
+        Number of chunks stored
+        """
+
+        config = settings.TRANSCRIPT_EMBEDDINGS
+        chunks = cls.build_chunks(transcript.segments, config["CHUNK_SECONDS"])
+
+        embeddings = []
+        texts = [chunk["text"] for chunk in chunks]
+        for i in range(0, len(texts), config["BATCH_SIZE"]):
+            embeddings.extend(
+                get_embedding_service().embed_documents(
+                    texts[i : i + config["BATCH_SIZE"]]
+                )
+            )
+
+        with transaction.atomic():
+            TranscriptChunk.objects.filter(transcript=transcript).delete()
+            TranscriptChunk.objects.bulk_create(
+                [
+                    TranscriptChunk(transcript=transcript, embedding=embedding, **chunk)
+                    for chunk, embedding in zip(chunks, embeddings)
+                ]
+            )
+
+        logger.info(
+            f"Indexed {len(chunks)} chunks",
+            extra={"transcript_id": transcript.id},
+        )
+
+        return len(chunks)
+
+    @classmethod
+    def search(
+        cls, transcript: Transcript, query: str, top_k: int = None
+    ) -> List[TranscriptChunk]:
+        """
+        Return the `top_k` chunks most similar to `query`, in playback order.
+
+        Raises:
+        TranscriptNotIndexedError: The transcript has no chunks yet, indexing
+        is scheduled in the background instead of running inline
+        """
+
+        top_k = top_k or settings.TRANSCRIPT_EMBEDDINGS["TOP_K"]
+
+        if not TranscriptChunk.objects.filter(transcript=transcript).exists():
+            cls.schedule_index(transcript.id)
+            raise TranscriptNotIndexedError(transcript.id)
+
+        query_embedding = get_embedding_service().embed_query(query)
+
+        return cls._nearest_chunks(transcript, query_embedding, top_k)
+
+    @classmethod
+    async def asearch(
+        cls, transcript: Transcript, query: str, top_k: int = None
+    ) -> List[TranscriptChunk]:
+        """Async version of `search`"""
+
+        top_k = top_k or settings.TRANSCRIPT_EMBEDDINGS["TOP_K"]
+
+        # ORM calls run outside the shared thread-sensitive executor, so
+        # searches from concurrent chats don't queue behind each other
+        is_indexed = await sync_to_async(
+            TranscriptChunk.objects.filter(transcript=transcript).exists,
+            thread_sensitive=False,
+        )()
+        if not is_indexed:
+            await sync_to_async(cls.schedule_index, thread_sensitive=False)(
+                transcript.id
+            )
+            raise TranscriptNotIndexedError(transcript.id)
+
+        query_embedding = await get_embedding_service().aembed_query(query)
+
+        return await sync_to_async(cls._nearest_chunks, thread_sensitive=False)(
+            transcript, query_embedding, top_k
+        )
+
+    @staticmethod
+    def _nearest_chunks(
+        transcript: Transcript, query_embedding: List[float], top_k: int
+    ) -> List[TranscriptChunk]:
+        chunks = list(
+            TranscriptChunk.objects.filter(transcript=transcript)
+            .defer("embedding")
+            .order_by(CosineDistance("embedding", query_embedding))[:top_k]
+        )
+
+        return sorted(chunks, key=lambda chunk: chunk.start)
+
+    @classmethod
+    def schedule_index(cls, transcript_id: int) -> None:
+        """
+        Index a transcript found without chunks at search time, e.g. one
+        stored before indexing existed or whose indexing task failed. Queued
+        at most once per `TRANSCRIPT_EMBEDDINGS["INDEX_LOCK_TTL"]`.
+        """
+
+        # Imported lazily, tasks module depends on this service
+        from ..tasks import index_transcript_task
+
+        if cache.add(
+            f"{cls.LOCK_KEY_PREFIX}:{transcript_id}",
+            True,
+            timeout=settings.TRANSCRIPT_EMBEDDINGS["INDEX_LOCK_TTL"],
+        ):
+            # A user is waiting on it, don't queue it behind bulk indexing
+            index_transcript_task.apply_async((transcript_id,), queue="interactive")
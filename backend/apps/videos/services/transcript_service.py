@@ -0,0 +1,119 @@
+"""
+Business logic for Video's Transcript operations
+"""
+
+# Python Imports
+from datetime import datetime
+from functools import lru_cache
+import logging
+
+# Django Imports
+from django.conf import settings
+from django.http import HttpRequest
+
+# Third Party Imports
+from asgiref.sync import sync_to_async
+
+# REST Framework Imports
+from rest_framework import status
+
+# Project Imports
+from core.response import JsonResponse
+
+# App Imports
+from videos.models import Video, Transcript
+from videos.transcript_codec import CompactTranscript
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptService:
+
+    @staticmethod
+    async def list(request: HttpRequest, video_id: str) -> JsonResponse:
+        """
+        GET /api/videos/video_id/transcript/?offset=0&limit=500&language=en
+
+        Returns:
+        {
+            'segments': [
+                {'text':str, 'timestamp':str, 'start':float, 'duration':float},
+            ],
+            'language': str,
+            'is_complete': bool, # False while the transcript is being fetched
+            'offset': int,
+            'limit': int,
+            'total': int,
+            'next_offset': int | None,
+        }
+        """
+
+        config = settings.TRANSCRIPT_API
+
+        try:
+            offset = max(int(request.GET.get("offset", 0)), 0)
+            limit = min(
+                max(int(request.GET.get("limit", config["PAGE_SIZE"])), 1),
+                config["MAX_PAGE_SIZE"],
+            )
+        except ValueError:
+            return JsonResponse(
+                data={"detail": "'offset' and 'limit' must be integers"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        language = request.GET.get("language", "en")
+
+        try:
+            video = await Video.objects.aget(id=video_id, user=request.user)
+            transcript = await Transcript.objects.only(
+                "id", "language", "is_complete", "segment_count", "updated_at"
+            ).aget(content_id=video.content_id, language=language)
+
+        except (Video.DoesNotExist, Transcript.DoesNotExist):
+            logger.error(
+                "Error fetching Video's transcript",
+                extra={
+                    "user_id": request.user.id,
+                    "video_id": video_id,
+                },
+            )
+            return JsonResponse(
+                data={"detail": "Transcript not found"},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        total = transcript.segment_count
+        segments = []
+
+        if offset < total:
+            decoded = await sync_to_async(_decode_segments, thread_sensitive=False)(
+                transcript.id, transcript.updated_at
+            )
+            segments = decoded[offset : offset + limit].to_list()
+
+        next_offset = offset + len(segments)
+
+        return JsonResponse(
+            data={
+                "segments": segments,
+                "language": transcript.language,
+                "is_complete": transcript.is_complete,
+                "offset": offset,
+                "limit": limit,
+                "total": total,
+                "next_offset": next_offset if next_offset < total else None,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+@lru_cache(maxsize=settings.TRANSCRIPT_API["DECODE_CACHE_SIZE"])
+def _decode_segments(transcript_id: int, updated_at: datetime) -> CompactTranscript:
+    # Paging through a transcript would otherwise load and decompress the
+    # whole blob once per page. `updated_at` keys out rewritten transcripts.
+    starts, durations, text, compression = Transcript.objects.values_list(
+        "starts", "durations", "text", "compression"
+    ).get(id=transcript_id)
+
+    return CompactTranscript.decode(starts, durations, text, compression)
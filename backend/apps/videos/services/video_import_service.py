@@ -0,0 +1,155 @@
+"""
+Business logic for channel and playlist imports
+"""
+
+# Python Imports
+from typing import Dict, Optional
+import logging
+import uuid
+
+# Django Imports
+from django.conf import settings
+
+# REST Framework Imports
+from rest_framework.request import Request
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+
+# Project Imports
+from core.redis import get_redis_client
+from core.response import Response
+
+# App Imports
+from ..serializer import ImportVideosSerializer
+
+
+logger = logging.getLogger(__name__)
+
+
+class VideoImportService:
+    """
+    Imports are tracked in a Redis hash `video_import:<import_id>` holding
+    the owner, source and progress counters:
+
+    - total: videos found in the channel/playlist
+    - dispatched: videos whose ingestion was started or joined
+    - joined: videos already being ingested by an interactive task
+    - completed / failed: finished ingestions, joined ones included once
+      the joined task finished
+    """
+
+    KEY_PREFIX = "video_import"
+    COUNTERS = ("total", "dispatched", "joined", "completed", "failed")
+
+    @classmethod
+    def create(cls, request: Request) -> Response:
+        """
+        POST /api/videos/import/
+        {
+            "url":"https://www.youtube.com/@channel",
+            "limit": 100 (optional)
+        }
+        """
+        # Imported lazily, tasks import this module
+        from ..tasks import import_videos_task
+
+        serializer = ImportVideosSerializer(data=request.data)
+
+        try:
+            serializer.is_valid(raise_exception=True)
+
+        except ValidationError as e:
+            logger.error(
+                "Error importing videos",
+                extra={
+                    "user_id": request.user.id,
+                    "request_data": request.data,
+                    "error": str(e),
+                },
+            )
+            return Response(
+                data=e.detail,
+                status_code=status.HTTP_400_BAD_REQUEST,
+                status_text="BAD_REQUEST",
+            )
+
+        import_id = uuid.uuid4().hex
+        data = serializer.validated_data
+
+        cls.update(
+            import_id,
+            user_id=str(request.user.id),
+            url=data["source_url"],
+            source_type=data["source_type"],
+            status="PENDING",
+            message="Import queued",
+            **{counter: 0 for counter in cls.COUNTERS},
+        )
+        import_videos_task.apply_async(
+            (import_id, data["source_url"], str(request.user.id), data["limit"]),
+            task_id=import_id,
+        )
+
+        logger.info(
+            "Video import requested",
+            extra={"user_id": request.user.id, "import_id": import_id},
+        )
+
+        return Response(
+            data={
+                "import_id": import_id,
+                "websocket_path": f"/ws/videos/imports/{import_id}/",
+            },
+            status_code=status.HTTP_202_ACCEPTED,
+            status_text="ACCEPTED",
+        )
+
+    @classmethod
+    def get_state(cls, import_id: str) -> Optional[Dict]:
+        """Return the import's state, None if unknown or expired"""
+
+        state = get_redis_client().hgetall(cls._key(import_id))
+
+        return cls._parse(import_id, state) if state else None
+
+    @classmethod
+    def update(cls, import_id: str, **fields) -> None:
+        key = cls._key(import_id)
+
+        with get_redis_client().pipeline() as pipe:
+            pipe.hset(key, mapping=fields)
+            pipe.expire(key, settings.VIDEO_IMPORT["STATE_TTL"])
+            pipe.execute()
+
+    @classmethod
+    def increment(cls, import_id: str, **amounts: int) -> Dict:
+        """Atomically increment counters, returning the resulting state"""
+
+        key = cls._key(import_id)
+
+        with get_redis_client().pipeline() as pipe:
+            for counter, amount in amounts.items():
+                pipe.hincrby(key, counter, amount)
+            pipe.hgetall(key)
+            state = pipe.execute()[-1]
+
+        return cls._parse(import_id, state)
+
+    @classmethod
+    def is_finished(cls, state: Dict) -> bool:
+        return state["completed"] + state["failed"] >= state["total"]
+
+    @classmethod
+    def _parse(cls, import_id: str, state: Dict) -> Dict:
+        state = dict(state)
+
+        for counter in cls.COUNTERS:
+            state[counter] = int(state.get(counter, 0))
+
+        state["import_id"] = import_id
+
+        return state
+
+    @classmethod
+    def _key(cls, import_id: str) -> str:
+        return f"{cls.KEY_PREFIX}:{import_id}"
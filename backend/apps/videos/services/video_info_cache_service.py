@@ -0,0 +1,164 @@
+"""
+Shared cache for YouTube video metadata
+"""
+
+# Python Imports
+from typing import Callable, Dict, Optional
+import logging
+import time
+
+# Django Imports
+from django.conf import settings
+from django.core.cache import cache
+
+
+logger = logging.getLogger(__name__)
+
+
+class VideoInfoCacheService:
+    """
+    Two-tier cache for `YouTubeService.fetch_video_info` results keyed by
+    `provider_video_id`.
+
+    Static fields (title, description, channel, ...) and volatile counters
+    (views, likes, comments) are stored as separate entries with their own
+    TTLs. An entry older than its TTL is still served right away while a
+    background refresh is scheduled; it is only dropped after `MAX_STALE`.
+    """
+
+    KEY_PREFIX = "youtube:video_info"
+
+    STATIC_FIELDS = (
+        "title",
+        "description",
+        "thumbnail",
+        "thumbnail_high_res",
+        "duration",
+        "published_at",
+        "channel",
+    )
+    VOLATILE_FIELDS = (
+        "view_count",
+        "like_count",
+        "comment_count",
+    )
+
+    @classmethod
+    def get(cls, video_id: str, loader: Callable[[str], Dict]) -> Dict:
+        """
+        Return cached video info, falling back to `loader` on a miss
+
+        Args:
+        video_id: YouTube Video ID
+        loader: Callable fetching fresh video info for `video_id`
+
+        Returns:
+        Video info dict (see `YouTubeService.fetch_video_info`)
+        """
+
+        video_info = cls.get_cached(video_id)
+
+        if video_info is None:
+            video_info = loader(video_id)
+            cls.set(video_id, video_info)
+
+        return video_info
+
+    @classmethod
+    def get_cached(cls, video_id: str) -> Optional[Dict]:
+        """
+        Return cached video info without hitting YouTube, scheduling a
+        background refresh for stale entries. None on a miss.
+        """
+
+        static_key, volatile_key = cls._keys(video_id)
+
+        try:
+            entries = cache.get_many([static_key, volatile_key])
+        except Exception as e:
+            logger.warning(f"Video info cache unavailable for {video_id}: {str(e)}")
+            return None
+
+        static_entry = entries.get(static_key)
+        volatile_entry = entries.get(volatile_key)
+
+        if static_entry is None or volatile_entry is None:
+            return None
+
+        config = settings.YOUTUBE_VIDEO_INFO_CACHE
+        if cls._is_stale(static_entry, config["STATIC_TTL"]) or cls._is_stale(
+            volatile_entry, config["VOLATILE_TTL"]
+        ):
+            cls._schedule_refresh(video_id)
+
+        return {**static_entry["data"], **volatile_entry["data"]}
+
+    @classmethod
+    def set(cls, video_id: str, video_info: Dict) -> None:
+        """Store both tiers of `video_info`"""
+
+        static_key, volatile_key = cls._keys(video_id)
+        fetched_at = time.time()
+
+        try:
+            cache.set_many(
+                {
+                    static_key: {
+                        "data": {
+                            field: video_info.get(field) for field in cls.STATIC_FIELDS
+                        },
+                        "fetched_at": fetched_at,
+                    },
+                    volatile_key: {
+                        "data": {
+                            field: video_info.get(field)
+                            for field in cls.VOLATILE_FIELDS
+                        },
+                        "fetched_at": fetched_at,
+                    },
+                },
+                timeout=settings.YOUTUBE_VIDEO_INFO_CACHE["MAX_STALE"],
+            )
+        except Exception as e:
+            logger.warning(f"Error caching video info for {video_id}: {str(e)}")
+
+    @classmethod
+    def release_refresh_lock(cls, video_id: str) -> None:
+        try:
+            cache.delete(f"{cls.KEY_PREFIX}:refresh:{video_id}")
+        except Exception as e:
+            logger.warning(f"Error releasing refresh lock for {video_id}: {str(e)}")
+
+    @classmethod
+    def _schedule_refresh(cls, video_id: str) -> None:
+        """Enqueue a single background refresh per video"""
+
+        # Imported lazily, tasks module depends on YouTubeService
+        from videos.tasks import refresh_video_info_cache_task
+
+        locked = False
+
+        # A stale entry is still served if the refresh can't be scheduled
+        try:
+            locked = cache.add(
+                f"{cls.KEY_PREFIX}:refresh:{video_id}",
+                True,
+                timeout=settings.YOUTUBE_VIDEO_INFO_CACHE["REFRESH_LOCK_TTL"],
+            )
+            if locked:
+                refresh_video_info_cache_task.delay(video_id)
+        except Exception as e:
+            logger.warning(f"Error scheduling video info refresh for {video_id}: {e}")
+            if locked:
+                cls.release_refresh_lock(video_id)
+
+    @staticmethod
+    def _is_stale(entry: Dict, ttl: int) -> bool:
+        return time.time() - entry["fetched_at"] > ttl
+
+    @classmethod
+    def _keys(cls, video_id: str):
+        return (
+            f"{cls.KEY_PREFIX}:static:{video_id}",
+            f"{cls.KEY_PREFIX}:volatile:{video_id}",
+        )
@@ -3,7 +3,7 @@ Business logic for video operations
 """
 
 # Python Imports
-from typing import List, Union
+from typing import Dict, List, Union
 import logging
 
 # REST Framework Imports
@@ -18,7 +18,7 @@ from core.response import Response
 
 # App Imports
 from ..serializer import CreateVideoSerializer, VideoSerializer
-from videos.models import Video
+from videos.models import Video, VideoContent
 
 
 logger = logging.getLogger(__name__)
@@ -97,7 +97,10 @@ class VideoService:
 
         if not video:
 
-            video = Video.objects.create(provider_video_id=video_id, user=user)
+            content, _ = VideoContent.objects.get_or_create(provider_video_id=video_id)
+            video = Video.objects.create(
+                provider_video_id=video_id, user=user, content=content
+            )
 
             result = [
                 video,
@@ -107,3 +110,51 @@ class VideoService:
             result = [video, False]
 
         return result
+
+    @staticmethod
+    def bulk_get_or_create_videos(
+        provider_video_ids: List[str], user_id: str
+    ) -> Dict[str, str]:
+        """
+        Get or create many videos of a user with one insert per table,
+        skipping those that already exist
+
+        Args:
+            provider_video_ids: YouTube video IDs
+            user_id: User ID
+
+        Returns:
+            {provider_video_id: video_id}
+        """
+
+        VideoContent.objects.bulk_create(
+            [
+                VideoContent(provider_video_id=provider_video_id)
+                for provider_video_id in provider_video_ids
+            ],
+            ignore_conflicts=True,
+        )
+        content_ids = dict(
+            VideoContent.objects.filter(
+                provider_video_id__in=provider_video_ids
+            ).values_list("provider_video_id", "id")
+        )
+
+        Video.objects.bulk_create(
+            [
+                Video(
+                    provider_video_id=provider_video_id,
+                    user_id=user_id,
+                    content_id=content_ids[provider_video_id],
+                )
+                for provider_video_id in provider_video_ids
+            ],
+            ignore_conflicts=True,
+        )
+
+        return {
+            provider_video_id: str(video_id)
+            for provider_video_id, video_id in Video.objects.filter(
+                user_id=user_id, provider_video_id__in=provider_video_ids
+            ).values_list("provider_video_id", "id")
+        }
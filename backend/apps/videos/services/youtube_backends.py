@@ -0,0 +1,342 @@
+"""
+Pluggable backends performing the raw YouTube calls behind YouTubeService
+"""
+
+# Python Imports
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TypeVar
+import hashlib
+import json
+import logging
+import random
+import time
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+import yt_dlp
+from youtube_transcript_api import YouTubeTranscriptApi
+
+# Project Imports
+from core.rate_limiter import get_rate_limiter
+
+# App Imports
+from ..exceptions import (
+    YOUTUBE_ERRORS,
+    YouTubeError,
+    YouTubeTransientError,
+    classify_youtube_error,
+)
+from .youtube_extractor_pool import get_extractor_pool
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class YouTubeBackend(ABC):
+    """
+    Base class for YouTube backends
+
+    Failures are raised as `YouTubeError` subclasses (see `videos.exceptions`).
+    `extract_info` returns the raw yt-dlp info dict (at least `INFO_FIELDS`),
+    `extract_flat_entries` returns [{'id': str, 'title': str}] and
+    `fetch_transcript` returns:
+    {
+        'segments': [{'text': str, 'start': float, 'duration': float}],
+        'language': str,
+        'is_auto_generated': bool,
+    }
+    """
+
+    # yt-dlp info fields read by YouTubeService
+    INFO_FIELDS = (
+        "title",
+        "description",
+        "thumbnail",
+        "thumbnails",
+        "duration",
+        "view_count",
+        "like_count",
+        "comment_count",
+        "upload_date",
+        "channel_id",
+        "channel",
+        "channel_thumbnail_url",
+        "channel_follower_count",
+    )
+
+    @abstractmethod
+    def extract_info(self, video_id: str, metadata_only: bool = True) -> Dict: ...
+
+    @abstractmethod
+    def extract_flat_entries(self, url: str, limit: int) -> List[Dict]: ...
+
+    @abstractmethod
+    def fetch_transcript(self, video_id: str, languages: List[str]) -> Dict: ...
+
+
+class LiveYouTubeBackend(YouTubeBackend):
+    """
+    Calls YouTube through yt-dlp and the transcript API, within the shared
+    "youtube" rate limit
+    """
+
+    def extract_info(self, video_id: str, metadata_only: bool = True) -> Dict:
+        return self._call(lambda: self._extract_info(video_id, metadata_only))
+
+    def extract_flat_entries(self, url: str, limit: int) -> List[Dict]:
+        return self._call(lambda: self._extract_flat_entries(url, limit))
+
+    def fetch_transcript(self, video_id: str, languages: List[str]) -> Dict:
+        return self._call(lambda: self._fetch_transcript(video_id, languages))
+
+    @staticmethod
+    def _call(fn: Callable[[], T]) -> T:
+        # Limiter timeouts are classified too, as throttling like a 429
+        try:
+            get_rate_limiter("youtube").acquire()
+            return fn()
+        except Exception as e:
+            raise classify_youtube_error(e) from e
+
+    def _extract_info(self, video_id: str, metadata_only: bool) -> Dict:
+        url = f"https://www.youtube.com/watch?v={video_id}"
+
+        if metadata_only:
+            with get_extractor_pool().extractor(
+                timeout=settings.YOUTUBE_EXTRACTOR_POOL["ACQUIRE_TIMEOUT"]
+            ) as ydl:
+                return ydl.extract_info(url, download=False)
+
+        ydl_opts = {"quiet": True, "no_warnings": True, "extract_flat": False}
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
+    def _extract_flat_entries(self, url: str, limit: int) -> List[Dict]:
+        # Lists the playlist's entries without resolving each video
+        ydl_opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "extract_flat": "in_playlist",
+            "playlistend": limit,
+        }
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            info = ydl.extract_info(url, download=False)
+
+        return [
+            {"id": entry["id"], "title": entry.get("title")}
+            for entry in info.get("entries") or []
+            if entry and entry.get("ie_key") == "Youtube" and entry.get("id")
+        ][:limit]
+
+    def _fetch_transcript(self, video_id: str, languages: List[str]) -> Dict:
+        youtube_transcript_api = YouTubeTranscriptApi()
+        transcript_list = youtube_transcript_api.list(video_id)
+
+        try:
+
+            transcript = transcript_list.find_manually_created_transcript(languages)
+            is_auto_generated = False
+        except:
+
+            transcript = transcript_list.find_generated_transcript(languages)
+            is_auto_generated = True
+
+        return {
+            "segments": [
+                {"text": item.text, "start": item.start, "duration": item.duration}
+                for item in transcript.fetch()
+            ],
+            "language": transcript.language_code,
+            "is_auto_generated": is_auto_generated,
+        }
+
+
+class RecordingYouTubeBackend(YouTubeBackend):
+    """
+    Delegates to another backend and records every response, including
+    failures, to JSON fixtures replayable by `ReplayYouTubeBackend`
+    """
+
+    def __init__(self, backend: YouTubeBackend, fixtures_dir: str):
+        self.backend = backend
+        self.fixtures = FixtureStore(fixtures_dir)
+
+    def extract_info(self, video_id: str, metadata_only: bool = True) -> Dict:
+        name = FixtureStore.video_info_name(video_id, metadata_only)
+        start = time.perf_counter()
+
+        try:
+            info = self.backend.extract_info(video_id, metadata_only)
+        except YouTubeError as e:
+            self.fixtures.write("video_info", name, self._error_fixture(e))
+            raise
+
+        elapsed = time.perf_counter() - start
+
+        info = {field: info.get(field) for field in self.INFO_FIELDS}
+        # Only the last (highest resolution) thumbnail is read
+        info["thumbnails"] = (info.get("thumbnails") or [{}])[-1:]
+
+        # Upstream latency, reported by `benchmark_video_info` in replay mode
+        self.fixtures.write(
+            "video_info", name, info | {FixtureStore.ELAPSED_FIELD: elapsed}
+        )
+        return info
+
+    def extract_flat_entries(self, url: str, limit: int) -> List[Dict]:
+        name = FixtureStore.playlist_name(url, limit)
+
+        try:
+            entries = self.backend.extract_flat_entries(url, limit)
+        except YouTubeError as e:
+            self.fixtures.write("playlists", name, self._error_fixture(e))
+            raise
+
+        self.fixtures.write("playlists", name, {"entries": entries})
+        return entries
+
+    def fetch_transcript(self, video_id: str, languages: List[str]) -> Dict:
+        name = FixtureStore.transcript_name(video_id, languages)
+
+        try:
+            transcript = self.backend.fetch_transcript(video_id, languages)
+        except YouTubeError as e:
+            self.fixtures.write("transcripts", name, self._error_fixture(e))
+            raise
+
+        self.fixtures.write("transcripts", name, transcript)
+        return transcript
+
+    @staticmethod
+    def _error_fixture(error: YouTubeError) -> Dict:
+        return {"error": str(error), "error_type": type(error).__name__}
+
+
+class ReplayYouTubeBackend(YouTubeBackend):
+    """
+    Serves recorded fixtures without network access, with configurable
+    latency (mean +/- jitter, seconds) and a random error injection rate
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: str,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.fixtures = FixtureStore(fixtures_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.random = random.Random(seed)
+
+    def extract_info(self, video_id: str, metadata_only: bool = True) -> Dict:
+        return self._replay(
+            "video_info", FixtureStore.video_info_name(video_id, metadata_only)
+        )
+
+    def extract_flat_entries(self, url: str, limit: int) -> List[Dict]:
+        return self._replay("playlists", FixtureStore.playlist_name(url, limit))[
+            "entries"
+        ]
+
+    def fetch_transcript(self, video_id: str, languages: List[str]) -> Dict:
+        return self._replay(
+            "transcripts", FixtureStore.transcript_name(video_id, languages)
+        )
+
+    def _replay(self, kind: str, name: str) -> Dict:
+        delay = self.latency + self.random.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.random.random() < self.error_rate:
+            raise YouTubeTransientError(f"Injected replay failure for {kind}/{name}")
+
+        fixture = self.fixtures.read(kind, name)
+        if fixture is None:
+            raise YouTubeTransientError(f"No recorded fixture for {kind}/{name}")
+
+        if "error" in fixture:
+            error_cls = YOUTUBE_ERRORS.get(
+                fixture.get("error_type"), YouTubeTransientError
+            )
+            raise error_cls(fixture["error"])
+
+        fixture.pop(FixtureStore.ELAPSED_FIELD, None)
+        return fixture
+
+
+class FixtureStore:
+    """JSON fixtures laid out as `<fixtures_dir>/<kind>/<name>.json`"""
+
+    # Seconds the recorded upstream call took
+    ELAPSED_FIELD = "_elapsed"
+
+    def __init__(self, fixtures_dir: str):
+        self.root = Path(fixtures_dir)
+
+    @staticmethod
+    def video_info_name(video_id: str, metadata_only: bool) -> str:
+        # Metadata-only responses keep the plain name of earlier recordings
+        return video_id if metadata_only else f"{video_id}.full"
+
+    @staticmethod
+    def transcript_name(video_id: str, languages: List[str]) -> str:
+        return f"{video_id}.{'-'.join(languages)}"
+
+    @staticmethod
+    def playlist_name(url: str, limit: int) -> str:
+        return f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.{limit}"
+
+    def read(self, kind: str, name: str) -> Optional[Dict]:
+        path = self.root / kind / f"{name}.json"
+
+        if not path.exists():
+            return None
+
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def write(self, kind: str, name: str, data: Dict) -> None:
+        path = self.root / kind / f"{name}.json"
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Error recording YouTube fixture {path}: {str(e)}")
+
+
+@lru_cache(maxsize=None)
+def get_youtube_backend() -> YouTubeBackend:
+    """Return the backend selected by `YOUTUBE_BACKEND['MODE']`"""
+
+    config = settings.YOUTUBE_BACKEND
+    mode = config["MODE"]
+
+    if mode == "live":
+        return LiveYouTubeBackend()
+
+    if mode == "record":
+        return RecordingYouTubeBackend(LiveYouTubeBackend(), config["FIXTURES_DIR"])
+
+    if mode == "replay":
+        return ReplayYouTubeBackend(
+            config["FIXTURES_DIR"],
+            latency=config["REPLAY_LATENCY"],
+            jitter=config["REPLAY_JITTER"],
+            error_rate=config["REPLAY_ERROR_RATE"],
+            seed=config["REPLAY_SEED"],
+        )
+
+    raise ValueError(f"Unknown YouTube backend mode: {mode}")
@@ -0,0 +1,148 @@
+"""
+Pool of reusable yt-dlp extractors
+"""
+
+# Python Imports
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+import logging
+import os
+import threading
+import time
+
+# Django Imports
+from django.conf import settings
+
+# Third Party Imports
+import yt_dlp
+
+
+logger = logging.getLogger(__name__)
+
+
+class YouTubeExtractorPool:
+    """
+    Thread-safe pool of long-lived `yt_dlp.YoutubeDL` instances.
+
+    Building a `YoutubeDL` loads every extractor class and sets up its HTTP
+    handlers, so instances are kept around and reused across calls. Each
+    instance is used by one caller at a time and recycled after `max_uses`
+    extractions to bound its internal state.
+    """
+
+    # Only metadata is needed: skip DASH/HLS manifests and the JS player
+    # (signature deciphering), and don't fail when no formats are resolved.
+    METADATA_OPTIONS = {
+        "quiet": True,
+        "no_warnings": True,
+        "skip_download": True,
+        "check_formats": False,
+        "ignore_no_formats_error": True,
+        "extractor_args": {
+            "youtube": {
+                "skip": ["dash", "hls", "translated_subs"],
+                "player_skip": ["js"],
+            }
+        },
+    }
+
+    def __init__(self, size: int, max_uses: int, options: Optional[Dict] = None):
+        self.size = size
+        self.max_uses = max_uses
+        self.options = options or self.METADATA_OPTIONS
+
+        self._idle = []
+        self._uses = {}
+        # Signalled whenever an extractor is returned or a slot is freed
+        self._available = threading.Condition()
+
+    @contextmanager
+    def extractor(self, timeout: Optional[float] = None) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Borrow an extractor for the duration of the block
+
+        Usage:
+
+            with pool.extractor(timeout=30) as ydl:
+                info = ydl.extract_info(url, download=False)
+
+        Raises:
+        TimeoutError: No extractor became available within `timeout` seconds
+        """
+
+        ydl = self._acquire(timeout)
+        try:
+            yield ydl
+        finally:
+            self._release(ydl)
+
+    def _acquire(self, timeout: Optional[float]) -> yt_dlp.YoutubeDL:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+
+                # A recycled extractor frees its slot without returning one
+                if len(self._uses) < self.size:
+                    ydl = yt_dlp.YoutubeDL(self.options)
+                    self._uses[id(ydl)] = 0
+                    return ydl
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No yt-dlp extractor available in pool")
+
+                self._available.wait(remaining)
+
+    def _release(self, ydl: yt_dlp.YoutubeDL) -> None:
+        with self._available:
+            self._uses[id(ydl)] += 1
+            recycle = self._uses[id(ydl)] >= self.max_uses
+
+            if recycle:
+                del self._uses[id(ydl)]
+            else:
+                self._idle.append(ydl)
+
+            self._available.notify()
+
+        if not recycle:
+            return
+
+        try:
+            ydl.close()
+        except Exception as e:
+            logger.warning(f"Error closing recycled yt-dlp extractor: {str(e)}")
+
+
+_pool: Optional[YouTubeExtractorPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_extractor_pool() -> YouTubeExtractorPool:
+    """Return the process-wide extractor pool, creating it on first use"""
+
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                config = settings.YOUTUBE_EXTRACTOR_POOL
+                _pool = YouTubeExtractorPool(
+                    size=config["SIZE"], max_uses=config["MAX_USES"]
+                )
+
+    return _pool
+
+
+def _reset_pool_after_fork() -> None:
+    # Forked (e.g. Celery prefork) children must not share HTTP sessions
+    global _pool, _pool_lock
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_pool_after_fork)
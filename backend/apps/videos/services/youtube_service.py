@@ -1,15 +1,41 @@
 # Python Imports
-from typing import Dict, Optional, List
+from typing import Dict, Iterator, Optional, List
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from datetime import datetime
 
-# Third Party Imports
-import yt_dlp
-from youtube_transcript_api import YouTubeTranscriptApi
+# Django Imports
+from django.conf import settings
+
+# Project Imports
+from core.circuit_breaker import CircuitBreaker
+from core.single_flight import SingleFlight
+
+# App Imports
+from ..exceptions import YouTubeError
+from ..utils import seconds_to_timestamp
+from .negative_cache_service import NegativeCacheService
+from .video_info_cache_service import VideoInfoCacheService
+from .youtube_backends import get_youtube_backend
 
 
 logger = logging.getLogger(__name__)
 
+# Concurrent fetches of the same video, from any process, share one upstream call
+video_info_flight = SingleFlight("youtube_video_info")
+transcript_flight = SingleFlight("youtube_transcript")
+
+# Fails fast while YouTube keeps throttling or erroring. Permanent errors are
+# valid answers from YouTube, so they don't count as failures. Timeouts of our
+# own rate limit are raised as YouTubeThrottledError and count like a 429.
+youtube_circuit = CircuitBreaker(
+    "youtube",
+    failure_threshold=settings.YOUTUBE_RESILIENCE["CIRCUIT_FAILURE_THRESHOLD"],
+    failure_window=settings.YOUTUBE_RESILIENCE["CIRCUIT_FAILURE_WINDOW"],
+    recovery_timeout=settings.YOUTUBE_RESILIENCE["CIRCUIT_RECOVERY_TIMEOUT"],
+    is_failure=lambda e: not getattr(e, "permanent", False),
+)
+
 
 class YouTubeService:
     """
@@ -17,9 +43,87 @@ class YouTubeService:
     """
 
     @classmethod
-    def fetch_video_info(cls, video_id: str) -> Dict:
+    def fetch_video_info(cls, video_id: str, force_refresh: bool = False) -> Dict:
+        """
+        Fetch YouTube video metadata, served from the shared video info cache
+        when available
+
+        Args:
+        video_id: YouTube Video ID
+        force_refresh: Bypass the cache and re-extract from YouTube
+
+        Returns:
+        See `_extract_video_info`
+
+        Raises:
+        YouTubeError: See `videos.exceptions`, permanent errors are cached
+        CircuitOpenError: YouTube is currently failing, retry later
+        """
+
+        if force_refresh:
+            video_info = cls._coalesced_extract_video_info(video_id)
+            VideoInfoCacheService.set(video_id, video_info)
+            return video_info
+
+        return VideoInfoCacheService.get(video_id, cls._coalesced_extract_video_info)
+
+    @classmethod
+    def fetch_video_info_many(
+        cls, video_ids: List[str], max_workers: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Fetch metadata for many videos with bounded concurrency
+
+        Args:
+        video_ids: YouTube Video IDs, duplicates are fetched once
+        max_workers: Maximum concurrent fetches (default: settings value)
+
+        Returns:
+        One entry per input ID, in input order:
+        [
+            {'video_id': str, 'video_info': dict | None, 'error': str | None},
+        ]
+        """
+
+        unique_ids = list(dict.fromkeys(video_ids))
+        if not unique_ids:
+            return []
+
+        max_workers = max_workers or settings.YOUTUBE_VIDEO_INFO_BATCH["MAX_WORKERS"]
+
+        def fetch(video_id: str) -> Dict:
+            try:
+                return {
+                    "video_id": video_id,
+                    "video_info": cls.fetch_video_info(video_id),
+                    "error": None,
+                }
+            except Exception as e:
+                return {"video_id": video_id, "video_info": None, "error": str(e)}
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_ids))
+        ) as executor:
+            results = dict(zip(unique_ids, executor.map(fetch, unique_ids)))
+
+        return [results[video_id] for video_id in video_ids]
+
+    @classmethod
+    def _coalesced_extract_video_info(cls, video_id: str) -> Dict:
+        NegativeCacheService.check("video_info", video_id)
+
+        return video_info_flight.do(video_id, lambda: cls._extract_video_info(video_id))
+
+    @classmethod
+    def _extract_video_info(cls, video_id: str, metadata_only: bool = True) -> Dict:
         """
-        Fetch YouTube video metadata using yt-dlp
+        Fetch YouTube video metadata through the configured YouTube backend
+        (yt-dlp when live)
+
+        Args:
+        video_id: YouTube Video ID
+        metadata_only: Use a pooled extractor that skips stream format and
+        manifest resolution. When False a fresh extractor resolves every format.
 
         Returns:
         {
@@ -41,42 +145,72 @@ class YouTubeService:
         }
         """
         try:
-            ydl_opts = {"quiet": True, "no_warnings": True, "extract_flat": False}
+            info = youtube_circuit.call(
+                lambda: get_youtube_backend().extract_info(video_id, metadata_only)
+            )
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(
-                    f"https://www.youtube.com/watch?v={video_id}", download=False
-                )
-                return {
-                    "title": info.get("title"),
-                    "description": info.get("description", ""),
-                    "thumbnail": info.get("thumbnail"),
-                    "thumbnail_high_res": info.get("thumbnails", [{}])[-1].get(
-                        "url", ""
-                    ),
-                    "duration": info.get("duration"),
-                    "view_count": info.get("view_count", "Not Available"),
-                    "like_count": info.get("like_count", "Not Available"),
-                    "comment_count": info.get("comment_count", "Not Available"),
-                    "published_at": cls.format_date(
-                        info.get("upload_date", "Not Available")
-                    ),
-                    "channel": {
-                        "id": info.get("channel_id", ""),
-                        "name": info.get("channel", ""),
-                        "thumbnail": info.get("channel_thumbnail_url")
-                        or "/images/default-channel.jpg",
-                        "subscriber_count": cls.humanize_number(
-                            info.get("channel_follower_count", 0)
-                        ),
-                    },
-                }
-        except Exception as e:
+        except YouTubeError as e:
             logger.error(f"Error fetching video info for {video_id}: {str(e)}")
-            raise Exception(f"Failed tp fetch video Info for {video_id}")
+            NegativeCacheService.remember("video_info", video_id, e)
+            raise
 
-    @staticmethod
-    def fetch_transcript(video_id: str, languages: List[str] = None) -> Optional[dict]:
+        return cls._transform_video_info(info)
+
+    @classmethod
+    def fetch_playlist_video_ids(cls, url: str, limit: int) -> List[str]:
+        """
+        Enumerate the videos of a channel or playlist without resolving each
+        one (yt-dlp flat extraction)
+
+        Args:
+        url: Channel videos tab or playlist URL
+        limit: Maximum number of videos, newest first
+
+        Returns:
+        YouTube Video IDs, in playlist order
+
+        Raises:
+        See `fetch_video_info`
+        """
+
+        try:
+            entries = youtube_circuit.call(
+                lambda: get_youtube_backend().extract_flat_entries(url, limit)
+            )
+
+        except YouTubeError as e:
+            logger.error(f"Error listing videos of {url}: {str(e)}")
+            raise
+
+        return list(dict.fromkeys(entry["id"] for entry in entries))
+
+    @classmethod
+    def _transform_video_info(cls, info: Dict) -> Dict:
+        return {
+            "title": info.get("title"),
+            "description": info.get("description", ""),
+            "thumbnail": info.get("thumbnail"),
+            "thumbnail_high_res": info.get("thumbnails", [{}])[-1].get("url", ""),
+            "duration": info.get("duration"),
+            "view_count": info.get("view_count", "Not Available"),
+            "like_count": info.get("like_count", "Not Available"),
+            "comment_count": info.get("comment_count", "Not Available"),
+            "published_at": cls.format_date(info.get("upload_date", "Not Available")),
+            "channel": {
+                "id": info.get("channel_id", ""),
+                "name": info.get("channel", ""),
+                "thumbnail": info.get("channel_thumbnail_url")
+                or "/images/default-channel.jpg",
+                "subscriber_count": cls.humanize_number(
+                    info.get("channel_follower_count", 0)
+                ),
+            },
+        }
+
+    @classmethod
+    def fetch_transcript(
+        cls, video_id: str, languages: List[str] = None
+    ) -> Optional[dict]:
         """
         Fetch video transcript
 
@@ -87,60 +221,84 @@ class YouTubeService:
         Returns:
         {
             'transcript':[
-            {'text':str, 'timestamp':str}, # timestamp in HH:MM:SS format
+            {'text':str, 'timestamp':str, 'start':float, 'duration':float}, # timestamp in HH:MM:SS format
             ],
             'langauge':str,
             'is_auto_generated':bool,
         }
+
+        Raises:
+        See `fetch_video_info`
         """
-        if languages is None:
-            languages = ["en"]
+        key = cls._transcript_key(video_id, languages)
+        NegativeCacheService.check("transcript", key)
 
-        try:
+        return transcript_flight.do(
+            key, lambda: cls._fetch_transcript(video_id, languages)
+        )
 
-            youtube_transcript_api = YouTubeTranscriptApi()
-            transcript_list = youtube_transcript_api.list(video_id)
+    @classmethod
+    def _fetch_transcript(cls, video_id: str, languages: List[str] = None) -> dict:
+        transcript = cls._fetch_raw_transcript(video_id, languages)
 
-            try:
+        return {
+            "transcript": list(cls._iter_segments(transcript["segments"])),
+            "language": transcript["language"],
+            "is_auto_generated": transcript["is_auto_generated"],
+        }
 
-                transcript = transcript_list.find_manually_created_transcript(languages)
-                is_auto_generated = False
-            except:
+    @classmethod
+    def stream_transcript(
+        cls, video_id: str, languages: List[str] = None
+    ) -> Iterator[Dict]:
+        """
+        Fetch video transcript and yield its segments one at a time, so
+        callers can deliver them in chunks. The transcript API has no
+        streaming endpoint: the whole transcript is fetched in one upstream
+        call, shared with concurrent `fetch_transcript` callers, before the
+        first segment is yielded.
+
+        Args:
+        video_id: YouTube Video ID
+        languages: List of language codes (default: ['en'])
 
-                transcript = transcript_list.find_generated_transcript(languages)
-                is_auto_generated = True
+        Yields:
+        {'text':str, 'timestamp':str, 'start':float, 'duration':float}
 
-            raw_transcript = transcript.fetch()
+        Raises:
+        See `fetch_video_info`
+        """
+        yield from cls.fetch_transcript(video_id, languages)["transcript"]
 
-            transformed_transcript = []
-            for item in raw_transcript:
-                timestamp = YouTubeService._seconds_to_timestamp(item.start)
-                transformed_transcript.append(
-                    {"text": item.text, "timestamp": timestamp}
+    @classmethod
+    def _fetch_raw_transcript(cls, video_id: str, languages: List[str] = None) -> Dict:
+        try:
+            return youtube_circuit.call(
+                lambda: get_youtube_backend().fetch_transcript(
+                    video_id, languages or ["en"]
                 )
+            )
 
-            return {
-                "transcript": transformed_transcript,
-                "language": transcript.language_code,
-                "is_auto_generated": is_auto_generated,
-            }
-
-        except Exception as e:
+        except YouTubeError as e:
             logger.error(f"Error fetching transcript for {video_id}: {str(e)}")
-            raise Exception(f"Failed to fetch transcript: {str(e)}")
+            NegativeCacheService.remember(
+                "transcript", cls._transcript_key(video_id, languages), e
+            )
+            raise
 
     @staticmethod
-    def _seconds_to_timestamp(seconds: float) -> str:
-
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+    def _transcript_key(video_id: str, languages: List[str] = None) -> str:
+        return f"{video_id}:{','.join(languages or ['en'])}"
 
-        if hours == 0:
-            if minutes == 0:
-                return f"00:{secs:02d}"
-            return f"{minutes:02d}:{secs:02d}"
-        return f"{hours}:{minutes:02d}:{secs:02d}"
+    @staticmethod
+    def _iter_segments(segments: List[Dict]) -> Iterator[Dict]:
+        for segment in segments:
+            yield {
+                "text": segment["text"],
+                "timestamp": seconds_to_timestamp(segment["start"]),
+                "start": segment["start"],
+                "duration": segment["duration"],
+            }
 
     @staticmethod
     def humanize_number(num: int) -> str:
@@ -3,20 +3,47 @@ Celery task for async video processing
 """
 
 # Python Imports
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 import logging
 
+# Django Imports
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
 # Third Party Imports
-from celery import shared_task
-from channels.layers import get_channel_layer
 from asgiref.sync import async_to_sync
+from celery import shared_task, group
+from channels.layers import get_channel_layer
+from celery.utils.time import get_exponential_backoff_interval
+
+# Project Imports
+from core.circuit_breaker import CircuitOpenError
+from core.progress_publisher import get_progress_publisher
+from core.single_flight import SingleFlight
 
 # App Imports
-from .models import Video, Transcript
-from .services.youtube_service import YouTubeService
+from .models import Video, VideoContent, Transcript
+from .transcript_codec import CompactTranscript
+from .services.youtube_service import YouTubeService, youtube_circuit
+from .services.video_info_cache_service import VideoInfoCacheService
+from .services.ingestion_registry_service import IngestionRegistryService
+from .services.video_import_service import VideoImportService
+from .services.video_service import VideoService
+from .services.transcript_index_service import TranscriptIndexService
 
 
 logger = logging.getLogger(__name__)
 
+# Concurrent ingestions of the same video wait for the one already streaming
+transcript_ingestion_flight = SingleFlight(
+    "transcript_ingestion", lock_timeout=600, wait_timeout=300
+)
+
+# Updates sent without waiting for the progress publisher's coalescing window
+TERMINAL_STATUSES = ("COMPLETED", "FAILURE", "RETRY")
+
 
 @shared_task(bind=True, max_retries=3)
 def fetch_video_info_task(
@@ -36,57 +63,573 @@ def fetch_video_info_task(
     _send_websocket_task_update(task_id, "Starting video data fetch...", "STARTED")
 
     try:
+        video = Video.objects.select_related("content").get(id=video_id)
 
-        video = Video.objects.get(id=video_id)
-        provider_video_id = video.provider_video_id
-
+    except Video.DoesNotExist as e:
         _send_websocket_task_update(
-            task_id, "Fetching video information...", "PROCESSING"
+            task_id, f"Video with id {video_id} does not exist", "FAILURE"
         )
-        video_info = YouTubeService.fetch_video_info(provider_video_id)
-        video_transcript = None
+        logger.error(f"Video with id {video_id} does not exist")
+        raise e
 
-        if fetch_transcript:
-            _send_websocket_task_update(
-                task_id, "Fetching video transcript...", "PROCESSING"
-            )
-            try:
-                video_transcript = Transcript.objects.get(video=video).transcript
+    # Metadata and transcript are independent upstream calls, fetch them at
+    # the same time. Each step persists its own result, so a retry only
+    # repeats the step that failed (the other is served from cache/database).
+    steps = {"video_info": _fetch_video_info_step}
+    if fetch_transcript:
+        steps["transcript"] = _fetch_transcript_step
 
-            except Transcript.DoesNotExist:
+    results, errors = _run_steps(task_id, video, steps)
 
-                video_transcript = YouTubeService.fetch_transcript(
-                    provider_video_id, ["en"]
-                )["transcript"]
-                Transcript.objects.create(video=video, transcript=video_transcript)
+    for error in errors.values():
+        if not getattr(error, "permanent", False):
+            _retry_with_backoff(self, error)
 
-        result = {"video_info": video_info, "video_transcript": video_transcript}
+    if errors and not results:
+        # Private/deleted video, retrying won't help
+        error = next(iter(errors.values()))
+        _send_websocket_task_update(task_id, str(error), "FAILURE")
+        logger.error(f"Permanent error in fetch_video_info_task: {str(error)}")
+        raise error
 
-        _send_websocket_task_update(
-            task_id, "Video data fetched successfully", "COMPLETED", result
+    # The transcript itself is served by the transcript endpoint, it is too
+    # large for channel layer messages and the result backend
+    result = {
+        "video_info": results.get("video_info"),
+        "transcript": results.get("transcript"),
+    }
+    message = "Video data fetched successfully"
+
+    if errors:
+        # e.g. video info is available but the video has no transcript
+        message = "Video data partially fetched: " + "; ".join(
+            str(error) for error in errors.values()
         )
 
-        logger.info(f"Successfully fetched data for video {provider_video_id}")
+    _send_websocket_task_update(task_id, message, "COMPLETED", result)
 
-        return result
+    logger.info(f"Fetched data for video {video.provider_video_id}: {message}")
 
-    except Video.DoesNotExist as e:
-        _send_websocket_task_update(
-            task_id, f"Video with id {video_id} does not exist", "FAILURE"
+    return result
+
+
+@shared_task(ignore_result=True)
+def refresh_video_info_cache_task(provider_video_id: str):
+    """
+    Refresh stale video info cache entries in the background
+
+    Args:
+        provider_video_id: YouTube video ID
+    """
+
+    try:
+        YouTubeService.fetch_video_info(provider_video_id, force_refresh=True)
+        logger.info(f"Refreshed cached video info for {provider_video_id}")
+
+    except Exception as e:
+        logger.error(
+            f"Error refreshing cached video info for {provider_video_id}: {str(e)}"
         )
-        logger.error(f"Video with id {video_id} does not exist")
-        raise e
+
+    finally:
+        VideoInfoCacheService.release_refresh_lock(provider_video_id)
+
+
+@shared_task
+def fetch_video_info_many_task(provider_video_ids: List[str], chunk_size: int = None):
+    """
+    Fan out metadata fetches for many videos in chunks
+
+    Args:
+        provider_video_ids: YouTube video IDs, duplicates are fetched once
+        chunk_size: Number of videos per chunk task (default: settings value)
+
+    Returns:
+        {'group_id': str, 'chunk_count': int, 'video_count': int}
+    """
+
+    provider_video_ids = list(dict.fromkeys(provider_video_ids))
+    chunk_size = chunk_size or settings.YOUTUBE_VIDEO_INFO_BATCH["CHUNK_SIZE"]
+
+    chunks = [
+        provider_video_ids[i : i + chunk_size]
+        for i in range(0, len(provider_video_ids), chunk_size)
+    ]
+
+    group_result = group(fetch_video_info_chunk_task.s(chunk) for chunk in chunks)()
+    group_result.save()
+
+    logger.info(
+        f"Dispatched {len(chunks)} video info chunks for {len(provider_video_ids)} videos"
+    )
+
+    return {
+        "group_id": group_result.id,
+        "chunk_count": len(chunks),
+        "video_count": len(provider_video_ids),
+    }
+
+
+@shared_task
+def fetch_video_info_chunk_task(provider_video_ids: List[str]):
+    """
+    Fetch metadata for one chunk of videos, see `YouTubeService.fetch_video_info_many`
+    """
+
+    return YouTubeService.fetch_video_info_many(provider_video_ids)
+
+
+@shared_task(bind=True, max_retries=3, ignore_result=True)
+def index_transcript_task(self, transcript_id: int):
+    """
+    Chunk and embed a transcript for retrieval
+
+    Args:
+        transcript_id: Transcript model ID
+    """
+
+    try:
+        transcript = Transcript.objects.get(id=transcript_id)
+        TranscriptIndexService.index(transcript)
+
+    except Transcript.DoesNotExist:
+        logger.error(f"Transcript with id {transcript_id} does not exist")
+
+    except Exception as e:
+        logger.error(f"Error indexing transcript {transcript_id}: {str(e)}")
+        raise self.retry(exc=e, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3)
+def import_videos_task(self, import_id: str, url: str, user_id: str, limit: int):
+    """
+    Import the videos of a YouTube channel or playlist: enumerate them,
+    create the user's Video rows and start ingesting them in batches
+
+    Args:
+        import_id: Import ID (also this task's ID)
+        url: Channel videos tab or playlist URL
+        user_id: Importing user's ID
+        limit: Maximum number of videos
+    """
+
+    _update_video_import(import_id, status="STARTED", message="Listing videos...")
+
+    try:
+        provider_video_ids = YouTubeService.fetch_playlist_video_ids(url, limit)
 
     except Exception as e:
-        logger.error(f"Error in fetch_video_info_task: {str(e)}")
+        if getattr(e, "permanent", False) or self.request.retries >= self.max_retries:
+            _update_video_import(import_id, status="FAILURE", message=str(e))
+            logger.error(f"Error importing videos of {url}: {str(e)}")
+            raise e
+
+        _update_video_import(import_id, status="RETRY", message="Retry listing videos")
+        raise self.retry(
+            exc=e,
+            countdown=get_exponential_backoff_interval(
+                factor=settings.YOUTUBE_RESILIENCE["RETRY_BACKOFF_BASE"],
+                retries=self.request.retries,
+                maximum=settings.YOUTUBE_RESILIENCE["RETRY_BACKOFF_MAX"],
+                full_jitter=True,
+            ),
+        )
+
+    video_ids = list(
+        VideoService.bulk_get_or_create_videos(provider_video_ids, user_id).values()
+    )
+
+    if not video_ids:
+        _update_video_import(
+            import_id, status="COMPLETED", message="No videos found", total=0
+        )
+        return
+
+    _update_video_import(
+        import_id,
+        status="PROCESSING",
+        message=f"Importing {len(video_ids)} videos...",
+        total=len(video_ids),
+    )
+
+    dispatch_video_import_batch_task.delay(import_id, video_ids)
+
+    logger.info(f"Importing {len(video_ids)} videos of {url}")
+
+
+@shared_task(ignore_result=True)
+def dispatch_video_import_batch_task(
+    import_id: str, video_ids: List[str], offset: int = 0
+):
+    """
+    Start ingesting the next batch of an import's videos, then schedule the
+    following batch. Only one batch is scheduled at a time, which keeps the
+    upstream request rate at `VIDEO_IMPORT` BATCH_SIZE per BATCH_INTERVAL.
+
+    Args:
+        import_id: Import ID
+        video_ids: Video model IDs of the import
+        offset: Index of the batch's first video
+    """
+
+    config = settings.VIDEO_IMPORT
+    batch = video_ids[offset : offset + config["BATCH_SIZE"]]
+    joined = 0
+    finished = {"completed": 0, "failed": 0}
+
+    for video_id in batch:
+        # Videos already ingesting (e.g. open in a tab) are joined, not
+        # repeated, and counted once the joined task finishes
+        task_id = IngestionRegistryService.get_alive(video_id)
+        if task_id:
+            joined += 1
+            status = IngestionRegistryService.watch(task_id, import_id)
+            if status:
+                finished[_import_outcome(status)] += 1
+            continue
+
+        # Not registered: users opening the video start their own interactive
+        # task instead of waiting behind the bulk queue
+        fetch_video_info_task.apply_async(
+            (video_id,),
+            # Not the interactive route's queue and priority
+            queue="bulk",
+            priority=settings.CELERY_TASK_DEFAULT_PRIORITY,
+            link=record_video_import_result_task.si(import_id, "completed"),
+            link_error=record_video_import_result_task.si(import_id, "failed"),
+        )
+
+    state = VideoImportService.increment(
+        import_id, dispatched=len(batch), joined=joined, **finished
+    )
+    _send_websocket_import_update(import_id, state)
 
-        _send_websocket_task_update(task_id, "Retry fetching video info", "RETRY")
+    if offset + len(batch) < len(video_ids):
+        dispatch_video_import_batch_task.apply_async(
+            (import_id, video_ids, offset + len(batch)),
+            countdown=config["BATCH_INTERVAL"],
+        )
 
-        raise self.retry(exc=0, countdown=60)
+
+@shared_task(ignore_result=True)
+def record_video_import_result_task(import_id: str, outcome: str):
+    """
+    Count a finished ingestion of an import
+
+    Args:
+        import_id: Import ID
+        outcome: "completed" or "failed"
+    """
+
+    state = VideoImportService.increment(import_id, **{outcome: 1})
+    _send_websocket_import_update(import_id, state)
+
+
+def _import_outcome(status: str) -> str:
+    """Import counter of a joined task that finished with `status`"""
+
+    return "completed" if status == "COMPLETED" else "failed"
+
+
+def _update_video_import(import_id: str, **fields):
+    """Update an import's state and send it to the import's Websocket group"""
+
+    VideoImportService.update(import_id, **fields)
+    _send_websocket_import_update(import_id, VideoImportService.get_state(import_id))
+
+
+def _run_steps(
+    task_id: str, video: Video, steps: Dict[str, Callable[[str, Video], Any]]
+) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+    """
+    Run independent ingestion steps concurrently
+
+    Returns:
+        (results, errors), both keyed by step name
+    """
+
+    def run(step: Callable[[str, Video], Any]) -> Any:
+        try:
+            return step(task_id, video)
+        finally:
+            # Worker threads open their own database connections
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+        futures = {name: executor.submit(run, step) for name, step in steps.items()}
+
+    results, errors = {}, {}
+
+    for name, future in futures.items():
+        try:
+            results[name] = future.result()
+        except Exception as e:
+            logger.error(f"Error in {name} step for video {video.id}: {str(e)}")
+            errors[name] = e
+
+    return results, errors
+
+
+def _fetch_video_info_step(task_id: str, video: Video) -> Dict:
+    """Fetch and persist video metadata, reporting progress on the Websocket"""
+
+    _send_websocket_task_update(
+        task_id, "Fetching video information...", "PROCESSING", step="video_info"
+    )
+
+    video_info = YouTubeService.fetch_video_info(video.provider_video_id)
+    VideoContent.objects.filter(id=video.content_id).update(
+        metadata=video_info, updated_at=timezone.now()
+    )
+    _send_video_context_changed(video.content_id)
+
+    _send_websocket_task_update(
+        task_id,
+        "Video information fetched",
+        "PROCESSING",
+        {"video_info": video_info},
+        step="video_info",
+    )
+
+    return video_info
+
+
+def _fetch_transcript_step(task_id: str, video: Video) -> Dict:
+    """
+    Fetch or reuse the video's transcript, reporting progress on the Websocket
+
+    Returns:
+        {
+            'id': int,
+            'language': str,
+            'segment_count': int,
+            'url': str, # paginated transcript endpoint
+        }
+    """
+
+    _send_websocket_task_update(
+        task_id, "Fetching video transcript...", "PROCESSING", step="transcript"
+    )
+
+    transcripts = Transcript.objects.only("id", "language", "segment_count")
+    transcript = transcripts.filter(
+        content_id=video.content_id, language="en", is_complete=True
+    ).first()
+
+    if not transcript:
+        ingested = []
+
+        def ingest() -> int:
+            ingested.append(True)
+            return _ingest_transcript(task_id, video.content)
+
+        transcript_id = transcript_ingestion_flight.do(video.provider_video_id, ingest)
+
+        if ingested:
+            transcript = transcripts.get(id=transcript_id)
+        else:
+            # Joined another task's ingestion, whose chunks went to its own
+            # Websocket group: replay the stored segments to this task's
+            transcript = Transcript.objects.get(id=transcript_id)
+            _send_websocket_transcript_chunks(task_id, transcript.segments)
+
+    _send_websocket_task_update(
+        task_id, "Video transcript fetched", "PROCESSING", step="transcript"
+    )
+
+    return {
+        "id": transcript.id,
+        "language": transcript.language,
+        "segment_count": transcript.segment_count,
+        "url": f"/api/videos/{video.id}/transcript/",
+    }
+
+
+def _retry_with_backoff(task, exc: Exception):
+    """
+    Retry `task` after an exponential backoff with full jitter, never before
+    the YouTube circuit lets calls through again. Reports FAILURE on the
+    Websocket once retries are exhausted.
+    """
+
+    task_id = task.request.id
+    logger.error(f"Error in {task.name}: {str(exc)}")
+
+    if task.request.retries >= task.max_retries:
+        _send_websocket_task_update(task_id, "Failed to fetch video info", "FAILURE")
+        raise exc
+
+    countdown = get_exponential_backoff_interval(
+        factor=settings.YOUTUBE_RESILIENCE["RETRY_BACKOFF_BASE"],
+        retries=task.request.retries,
+        maximum=settings.YOUTUBE_RESILIENCE["RETRY_BACKOFF_MAX"],
+        full_jitter=True,
+    )
+    if isinstance(exc, CircuitOpenError):
+        countdown = max(countdown, youtube_circuit.retry_after())
+
+    _send_websocket_task_update(task_id, "Retry fetching video info", "RETRY")
+
+    raise task.retry(exc=exc, countdown=countdown)
+
+
+def _ingest_transcript(task_id: str, content: VideoContent) -> int:
+    """
+    Stream, persist and schedule indexing of a video's transcript
+
+    Returns:
+        Transcript ID
+    """
+
+    transcript = _stream_transcript(task_id, content)
+    index_transcript_task.delay(transcript.id)
+
+    return transcript.id
+
+
+def _stream_transcript(task_id: str, content: VideoContent) -> Transcript:
+    """
+    Fetch a video's transcript, forwarding it in batches to the Websocket
+    connected to this task, and persist it once complete.
+
+    Nothing is persisted incrementally: the transcript arrives from YouTube
+    in one call and is batched in memory, so a worker dying before the
+    final save loses only that call, which the retry repeats. Until then
+    the Transcript row exists empty with `is_complete=False`.
+
+    Returns:
+        The completed Transcript
+    """
+
+    batch_size = settings.TRANSCRIPT_STREAMING["BATCH_SIZE"]
+
+    transcript, _ = Transcript.objects.update_or_create(
+        content=content, language="en", defaults={"is_complete": False}
+    )
+    segments = CompactTranscript.from_segments([])
+    batch = []
+
+    def flush():
+        batch_segments = CompactTranscript.from_segments(batch)
+        _send_websocket_transcript_chunk(
+            task_id, len(segments), batch_segments.to_list()
+        )
+        segments.extend(batch_segments)
+        batch.clear()
+
+    for segment in YouTubeService.stream_transcript(content.provider_video_id, ["en"]):
+        batch.append(segment)
+
+        if len(batch) >= batch_size:
+            flush()
+
+    if batch:
+        flush()
+
+    # Encoded and written once, rewriting the growing blob per batch is O(n²)
+    transcript.set_segments(segments)
+    transcript.is_complete = True
+    transcript.save(
+        update_fields=[
+            "starts",
+            "durations",
+            "text",
+            "compression",
+            "segment_count",
+            "is_complete",
+            "updated_at",
+        ]
+    )
+
+    return transcript
+
+
+def _send_websocket_transcript_chunks(task_id: str, segments: CompactTranscript):
+    """
+    Send a stored transcript to Websocket connected to this task, in the same
+    batches as a streamed one
+
+    Args:
+        task_id: Celery task ID
+        segments: Transcript segments
+    """
+
+    batch_size = settings.TRANSCRIPT_STREAMING["BATCH_SIZE"]
+
+    for offset in range(0, len(segments), batch_size):
+        _send_websocket_transcript_chunk(
+            task_id, offset, segments[offset : offset + batch_size].to_list()
+        )
+
+
+def _send_websocket_transcript_chunk(task_id: str, offset: int, segments: List[dict]):
+    """
+    Send a batch of transcript segments to Websocket connected to this task
+
+    Args:
+        task_id: Celery task ID
+        offset: Index of the first segment in the batch
+        segments: Transcript segments
+    """
+    # Never coalesced, a batch of chunks would carry the whole transcript
+    get_progress_publisher().publish(
+        f"task_{task_id}",
+        {"type": "transcript_chunk", "offset": offset, "segments": segments},
+        coalesce=False,
+    )
+
+
+def _send_video_context_changed(content_id: int):
+    """
+    Notify chat connections of every video sharing this content that the
+    video context changed, so their agents are rebuilt around it
+
+    Args:
+        content_id: VideoContent ID
+    """
+
+    video_ids = Video.objects.filter(content_id=content_id).values_list(
+        "id", flat=True
+    )
+    channel_layer = get_channel_layer()
+
+    # Sent directly: the progress publisher would coalesce these control
+    # messages into `progress_batch` ones, which ChatConsumer doesn't handle
+    for video_id in video_ids:
+        try:
+            async_to_sync(channel_layer.group_send)(
+                f"video_context_{video_id}",
+                {"type": "video_context_changed", "video_id": str(video_id)},
+            )
+        except Exception as e:
+            logger.warning(f"Error notifying video context change: {str(e)}")
+
+
+def _send_websocket_import_update(import_id: str, state: dict):
+    """
+    Send an import's state to the Websocket group of the import, marking it
+    COMPLETED once every video finished
+
+    Args:
+        import_id: Import ID
+        state: See `VideoImportService`
+    """
+
+    if state["status"] == "PROCESSING" and VideoImportService.is_finished(state):
+        VideoImportService.update(
+            import_id, status="COMPLETED", message="Import completed"
+        )
+        state |= {"status": "COMPLETED", "message": "Import completed"}
+
+    get_progress_publisher().publish(
+        f"video_import_{import_id}",
+        {"type": "import_update", "state": state},
+        flush=state["status"] in TERMINAL_STATUSES,
+    )
 
 
 def _send_websocket_task_update(
-    task_id: str, message: str, status: str, data: dict = None
+    task_id: str, message: str, status: str, data: dict = None, step: str = None
 ):
     """
     Send task updates to Websocket connected to this task
@@ -96,10 +639,24 @@ def _send_websocket_task_update(
         message: Status message
         status: Status string (processing, success, error)
         data: Optional result data
+        step: Optional ingestion step ("video_info", "transcript")
     """
-    channel_layer = get_channel_layer()
+    event = {
+        "type": "task_update",
+        "message": message,
+        "status": status,
+        "data": data,
+        "step": step,
+    }
 
-    async_to_sync(channel_layer.group_send)(
-        f"task_{task_id}",
-        {"type": "task_update", "message": message, "status": status, "data": data},
+    # Replayed to Websockets joining the task later
+    IngestionRegistryService.record_event(task_id, event)
+
+    # Imports that joined this task count it now that it finished
+    if status in IngestionRegistryService.TERMINAL_STATUSES:
+        for import_id in IngestionRegistryService.pop_watchers(task_id):
+            record_video_import_result_task.delay(import_id, _import_outcome(status))
+
+    get_progress_publisher().publish(
+        f"task_{task_id}", event, flush=status in TERMINAL_STATUSES
     )
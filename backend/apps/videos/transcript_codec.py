@@ -0,0 +1,190 @@
+"""
+Compact columnar encoding for video transcripts
+"""
+
+# Python Imports
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import sys
+
+# Third Party Imports
+try:
+    import zstandard
+except ImportError:  # zstd compression is optional
+    zstandard = None
+
+# App Imports
+from .utils import seconds_to_timestamp, timestamp_to_seconds
+
+
+class CompactTranscript:
+    """
+    Transcript held as parallel columns: float32 start offsets and durations
+    (seconds) plus the segment texts.
+
+    Encoded form is three blobs: packed little-endian start offsets, packed
+    durations and the texts joined by a unit separator, optionally zstd
+    compressed. Indexing is O(1) and time lookups are a binary search over
+    the start offsets.
+    """
+
+    DELIMITER = "\x1f"
+    COMPRESSION_ZSTD = "zstd"
+
+    def __init__(self, starts: array, durations: array, texts: List[str]):
+        if not len(starts) == len(durations) == len(texts):
+            raise ValueError("Transcript columns must have the same length")
+
+        self.starts = starts
+        self.durations = durations
+        self.texts = texts
+
+    @classmethod
+    def from_segments(cls, segments: Iterable[Dict]) -> "CompactTranscript":
+        """
+        Build from segment dicts: {'text', 'start', 'duration'} or the legacy
+        {'text', 'timestamp'} form, whose durations are derived from the next
+        segment's start.
+        """
+
+        starts, durations, texts = array("f"), array("f"), []
+        has_durations = True
+
+        for segment in segments:
+            if "start" in segment:
+                starts.append(float(segment["start"]))
+            else:
+                starts.append(timestamp_to_seconds(segment.get("timestamp") or "0"))
+
+            if segment.get("duration") is None:
+                has_durations = False
+                durations.append(0.0)
+            else:
+                durations.append(float(segment["duration"]))
+
+            texts.append((segment.get("text") or "").replace(cls.DELIMITER, " "))
+
+        if not has_durations:
+            for i in range(len(starts) - 1):
+                durations[i] = max(starts[i + 1] - starts[i], 0.0)
+
+        return cls(starts, durations, texts)
+
+    @classmethod
+    def decode(
+        cls,
+        starts: Union[bytes, memoryview],
+        durations: Union[bytes, memoryview],
+        text: Union[bytes, memoryview],
+        compression: str = "",
+    ) -> "CompactTranscript":
+        """Build from the blobs produced by `encode`"""
+
+        starts_column, durations_column = array("f"), array("f")
+        starts_column.frombytes(bytes(starts))
+        durations_column.frombytes(bytes(durations))
+
+        if sys.byteorder == "big":
+            starts_column.byteswap()
+            durations_column.byteswap()
+
+        text = bytes(text)
+        if compression == cls.COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise RuntimeError("zstandard is required to decode this transcript")
+            text = zstandard.ZstdDecompressor().decompress(text)
+
+        texts = text.decode("utf-8").split(cls.DELIMITER) if starts_column else []
+
+        return cls(starts_column, durations_column, texts)
+
+    def encode(
+        self, compression: str = "", level: int = 3, min_size: int = 0
+    ) -> Tuple[bytes, bytes, bytes, str]:
+        """
+        Encode to blobs
+
+        Args:
+        compression: 'zstd' to compress the text blob, '' for none. Falls back
+        to no compression when zstandard isn't installed.
+        level: zstd compression level
+        min_size: Texts smaller than this many bytes are stored uncompressed
+
+        Returns:
+        (starts, durations, text, compression)
+        """
+
+        starts, durations = array("f", self.starts), array("f", self.durations)
+        if sys.byteorder == "big":
+            starts.byteswap()
+            durations.byteswap()
+
+        text = self.DELIMITER.join(self.texts).encode("utf-8")
+
+        if (
+            compression == self.COMPRESSION_ZSTD
+            and zstandard is not None
+            and len(text) >= min_size
+        ):
+            text = zstandard.ZstdCompressor(level=level).compress(text)
+        else:
+            compression = ""
+
+        return starts.tobytes(), durations.tobytes(), text, compression
+
+    def extend(self, other: "CompactTranscript") -> None:
+        """Append the segments of `other` in place"""
+
+        self.starts.extend(other.starts)
+        self.durations.extend(other.durations)
+        self.texts.extend(other.texts)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Dict, "CompactTranscript"]:
+        if isinstance(index, slice):
+            return CompactTranscript(
+                self.starts[index], self.durations[index], self.texts[index]
+            )
+
+        return {
+            "text": self.texts[index],
+            "start": self.starts[index],
+            "duration": self.durations[index],
+        }
+
+    def index_at(self, seconds: float) -> Optional[int]:
+        """Index of the segment playing at `seconds`, None before the first one"""
+
+        index = bisect_right(self.starts, seconds) - 1
+        return index if index >= 0 else None
+
+    def between(self, start: float, end: float) -> "CompactTranscript":
+        """Segments starting within [start, end)"""
+
+        return self[bisect_left(self.starts, start) : bisect_left(self.starts, end)]
+
+    def to_list(self) -> List[Dict]:
+        """Segments as [{'text', 'timestamp', 'start', 'duration'}]"""
+
+        return [
+            {
+                "text": text,
+                "timestamp": seconds_to_timestamp(start),
+                "start": round(start, 3),
+                "duration": round(duration, 3),
+            }
+            for start, duration, text in zip(self.starts, self.durations, self.texts)
+        ]
+
+    def to_text(self) -> str:
+        """Plain text rendering with one '[timestamp] text' line per segment"""
+
+        return "\n".join(
+            f"[{seconds_to_timestamp(start)}] {text}"
+            for start, text in zip(self.starts, self.texts)
+        )
@@ -8,7 +8,12 @@ from rest_framework_simplejwt.views import TokenRefreshView
 from rest_framework.routers import DefaultRouter
 
 # App Imports
-from .views import VideoViewSet, VideoTitlesView, VideoImageView
+from .views import (
+    VideoViewSet,
+    VideoTitlesView,
+    VideoImageView,
+    VideoTranscriptView,
+)
 
 
 router = DefaultRouter()
@@ -18,4 +23,9 @@ urlpatterns = [
     path("", include(router.urls)),
     path("<uuid:video_id>/titles/", VideoTitlesView.as_view(), name="video-title-list"),
     path("<uuid:video_id>/images/", VideoImageView.as_view(), name="video-image-list"),
+    path(
+        "<uuid:video_id>/transcript/",
+        VideoTranscriptView.as_view(),
+        name="video-transcript",
+    ),
 ]
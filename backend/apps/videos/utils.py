@@ -16,6 +16,29 @@ def get_generated_video_image_path(instance: Model, file_name: str) -> str:
         ext = os.path.splitext(file_name)[1]
         timestamp_str = datetime.now(tz=timezone("UTC")).strftime("%Y-%m-%d_%H:%M:%S")
 
-        return f"{instance.video.user.id}/video-thumbnails/{timestamp_str}{ext}"
+        return f"{instance.video.user_id}/video-thumbnails/{timestamp_str}{ext}"
 
     raise TypeError("'instance' arg isn't of type 'videos.Image' model")
+
+
+def seconds_to_timestamp(seconds: float) -> str:
+
+    hours = int(seconds // 3600)
+    minutes = int((seconds % 3600) // 60)
+    secs = int(seconds % 60)
+
+    if hours == 0:
+        if minutes == 0:
+            return f"00:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
+def timestamp_to_seconds(timestamp: str) -> float:
+    """Parse 'SS', 'MM:SS' or 'H:MM:SS' into seconds"""
+
+    seconds = 0.0
+    for part in timestamp.strip().split(":"):
+        seconds = seconds * 60 + float(part)
+
+    return seconds
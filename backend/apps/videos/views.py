@@ -5,14 +5,17 @@ from django.http import HttpRequest
 # REST Framework Imports
 from rest_framework.request import Request
 from rest_framework.viewsets import ViewSet
+from rest_framework.decorators import action
 
 # Project Imports
 from core.response import Response, JsonResponse
 
 # App Imports
 from .services.video_service import VideoService
+from .services.video_import_service import VideoImportService
 from .services.title_service import TitleService
 from .services.image_service import ImageService
+from .services.transcript_service import TranscriptService
 from core.mixins import JWTAuthMixin
 
 
@@ -24,6 +27,10 @@ class VideoViewSet(ViewSet):
     def create(self, request: Request) -> Response:
         return VideoService.create(request)
 
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_videos(self, request: Request) -> Response:
+        return VideoImportService.create(request)
+
 
 class VideoTitlesView(JWTAuthMixin, View):
     async def get(self, request: HttpRequest, video_id) -> JsonResponse:
@@ -33,3 +40,8 @@ class VideoTitlesView(JWTAuthMixin, View):
 class VideoImageView(JWTAuthMixin, View):
     async def get(self, request: HttpRequest, video_id) -> JsonResponse:
         return await ImageService.list(request, video_id)
+
+
+class VideoTranscriptView(JWTAuthMixin, View):
+    async def get(self, request: HttpRequest, video_id) -> JsonResponse:
+        return await TranscriptService.list(request, video_id)
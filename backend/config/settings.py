@@ -190,6 +190,17 @@ CHANNEL_LAYERS = {
 }
 
 
+# Redis connection for locks, coordination and metrics
+REDIS_URL = config("REDIS_URL", default="redis://redis:6379/2")
+
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": config("REDIS_CACHE_URL", default="redis://redis:6379/1"),
+    }
+}
+
 # Celery
 CELERY_BROKER_URL = config("CELERY_BROKER_URL", default="redis://redis:6379/0")
 CELERY_RESULT_BACKEND = config("CELERY_RESULT_BACKEND", default="redis://redis:6379/0")
@@ -197,6 +208,41 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+CELERY_RESULT_EXPIRES = config("CELERY_RESULT_EXPIRES", default=60 * 60, cast=int)
+
+# Queues, each consumed by its own worker pool (see docker-compose.yml):
+# - interactive: ingestion a user is waiting for over a WebSocket
+# - bulk: backfills, batch metadata fetches, transcript indexing
+# - images: image generation
+# - maintenance: cache refreshes and housekeeping
+# Task names are matched as globs since apps are importable both as
+# `apps.<app>` and `<app>`.
+CELERY_TASK_DEFAULT_QUEUE = "interactive"
+CELERY_TASK_ROUTES = {
+    "*.fetch_video_info_task": {"queue": "interactive", "priority": 0},
+    "*.fetch_video_info_many_task": {"queue": "bulk"},
+    "*.fetch_video_info_chunk_task": {"queue": "bulk"},
+    "*.index_transcript_task": {"queue": "bulk"},
+    "*.import_videos_task": {"queue": "bulk"},
+    "*.dispatch_video_import_batch_task": {"queue": "bulk"},
+    "*.record_video_import_result_task": {"queue": "bulk"},
+    "*.generate_image*": {"queue": "images"},
+    "*.refresh_video_info_cache_task": {"queue": "maintenance"},
+    "*.summarize_chat_history_task": {"queue": "maintenance"},
+    "*.persist_chat_messages_task": {"queue": "maintenance"},
+}
+# Redis emulates priorities with one list per step, 0 is the highest
+CELERY_TASK_DEFAULT_PRIORITY = 5
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "priority_steps": list(range(10)),
+    "sep": ":",
+    "queue_order_strategy": "priority",
+}
+# Workers only reserve what they are about to run, so a long bulk backlog is
+# never stuck behind a busy worker. Bulk workers may override it per pool.
+CELERY_WORKER_PREFETCH_MULTIPLIER = config(
+    "CELERY_WORKER_PREFETCH_MULTIPLIER", default=1, cast=int
+)
 
 # Google Generative AI API Key
 GOOGLE_API_KEY = config("GOOGLE_API_KEY")
@@ -204,6 +250,117 @@ GOOGLE_API_KEY = config("GOOGLE_API_KEY")
 # YouTube API Key
 YOUTUBE_API_KEY = config("YOUTUBE_API_KEY")
 
+# YouTube backend: "live", "record" (live + capture fixtures) or "replay"
+# (fixtures only, no network, with injected latency and errors)
+YOUTUBE_BACKEND = {
+    "MODE": config("YOUTUBE_BACKEND_MODE", default="live"),
+    "FIXTURES_DIR": config(
+        "YOUTUBE_FIXTURES_DIR", default=str(BASE_DIR / "fixtures" / "youtube")
+    ),
+    "REPLAY_LATENCY": config("YOUTUBE_REPLAY_LATENCY", default=0.0, cast=float),
+    "REPLAY_JITTER": config("YOUTUBE_REPLAY_JITTER", default=0.0, cast=float),
+    "REPLAY_ERROR_RATE": config("YOUTUBE_REPLAY_ERROR_RATE", default=0.0, cast=float),
+    "REPLAY_SEED": config("YOUTUBE_REPLAY_SEED", default=None),
+}
+
+# YouTube video info cache (seconds)
+YOUTUBE_VIDEO_INFO_CACHE = {
+    "STATIC_TTL": config("YOUTUBE_VIDEO_INFO_STATIC_TTL", default=60 * 60 * 24, cast=int),
+    "VOLATILE_TTL": config("YOUTUBE_VIDEO_INFO_VOLATILE_TTL", default=60 * 5, cast=int),
+    "MAX_STALE": config(
+        "YOUTUBE_VIDEO_INFO_MAX_STALE", default=60 * 60 * 24 * 7, cast=int
+    ),
+    "REFRESH_LOCK_TTL": 60,
+}
+
+# Failing YouTube lookups (seconds)
+YOUTUBE_RESILIENCE = {
+    # Permanent failures (private/deleted video, no transcript) are cached
+    "NEGATIVE_CACHE_TTL": config(
+        "YOUTUBE_NEGATIVE_CACHE_TTL", default=60 * 60 * 6, cast=int
+    ),
+    "CIRCUIT_FAILURE_THRESHOLD": 5,
+    "CIRCUIT_FAILURE_WINDOW": 60,
+    "CIRCUIT_RECOVERY_TIMEOUT": 60,
+    # Exponential backoff with full jitter for transient task failures
+    "RETRY_BACKOFF_BASE": 10,
+    "RETRY_BACKOFF_MAX": 60 * 10,
+}
+
+# Celery to WebSocket progress updates sent within WINDOW seconds of each other
+# are delivered as one batch per group
+PROGRESS_PUBLISHER = {
+    "WINDOW": config("PROGRESS_PUBLISHER_WINDOW", default=0.05, cast=float),
+    "MAX_BATCH": 200,
+}
+
+# Registry of video ingestion tasks joined by WebSocket connections (seconds)
+INGESTION_REGISTRY = {
+    # Must outlive a task including its retries
+    "TTL": config("INGESTION_REGISTRY_TTL", default=60 * 60, cast=int),
+    "MAX_EVENTS": 50,
+    # Seconds a registered task may go without its first update (sent when a
+    # worker picks it up) before it is considered lost and replaced. Must be
+    # longer than the worst expected wait in the interactive queue, or queued
+    # tasks get duplicated.
+    "START_GRACE": config("INGESTION_REGISTRY_START_GRACE", default=10 * 60, cast=int),
+}
+
+# Channel/playlist imports, ingestion is dispatched BATCH_SIZE videos at a
+# time every BATCH_INTERVAL seconds
+VIDEO_IMPORT = {
+    "MAX_VIDEOS": config("VIDEO_IMPORT_MAX_VIDEOS", default=500, cast=int),
+    "BATCH_SIZE": config("VIDEO_IMPORT_BATCH_SIZE", default=10, cast=int),
+    "BATCH_INTERVAL": config("VIDEO_IMPORT_BATCH_INTERVAL", default=30, cast=int),
+    "STATE_TTL": 60 * 60 * 24,
+}
+
+# Batched video info fetches
+YOUTUBE_VIDEO_INFO_BATCH = {
+    "MAX_WORKERS": config("YOUTUBE_VIDEO_INFO_BATCH_MAX_WORKERS", default=4, cast=int),
+    "CHUNK_SIZE": config("YOUTUBE_VIDEO_INFO_BATCH_CHUNK_SIZE", default=25, cast=int),
+}
+
+# Columnar transcript storage
+TRANSCRIPT_STORAGE = {
+    "COMPRESSION": config("TRANSCRIPT_COMPRESSION", default="zstd"),
+    "COMPRESSION_LEVEL": 3,
+    "MIN_COMPRESS_BYTES": 1024,
+}
+
+# Streamed transcript ingestion
+TRANSCRIPT_STREAMING = {
+    "BATCH_SIZE": config("TRANSCRIPT_STREAMING_BATCH_SIZE", default=100, cast=int),
+}
+
+# Paginated transcript endpoint (segments per page)
+TRANSCRIPT_API = {
+    "PAGE_SIZE": 500,
+    "MAX_PAGE_SIZE": 2000,
+    # Decoded transcripts kept per process for paging
+    "DECODE_CACHE_SIZE": config("TRANSCRIPT_DECODE_CACHE_SIZE", default=32, cast=int),
+}
+
+# Transcript chunk embeddings (pgvector)
+TRANSCRIPT_EMBEDDINGS = {
+    # "gemini" or "hash" (deterministic local stand-in, no network)
+    "PROVIDER": config("TRANSCRIPT_EMBEDDING_PROVIDER", default="gemini"),
+    "MODEL": "models/text-embedding-004",
+    "CHUNK_SECONDS": 60,
+    "BATCH_SIZE": 100,
+    "TOP_K": 5,
+    # Seconds before a transcript found unindexed at search time is requeued
+    "INDEX_LOCK_TTL": 300,
+}
+
+# Reusable metadata-only yt-dlp extractors (per process)
+YOUTUBE_EXTRACTOR_POOL = {
+    "SIZE": config("YOUTUBE_EXTRACTOR_POOL_SIZE", default=4, cast=int),
+    "MAX_USES": config("YOUTUBE_EXTRACTOR_POOL_MAX_USES", default=200, cast=int),
+    # Seconds to wait for a free extractor before failing the call
+    "ACQUIRE_TIMEOUT": 30,
+}
+
 STORAGES = {
     "default": {
         "BACKEND": "storages.backends.s3boto3.S3Boto3Storage",
@@ -223,6 +380,53 @@ DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
 STATICFILES_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
 
 
+# Outbound provider budgets shared by every process, keyed "<provider>" or
+# "<provider>:<model>" (see core.rate_limiter). RATE is requests per second,
+# BURST the bucket size and TIMEOUT the longest a caller queues (seconds).
+# Model calls count against both their own and their provider's budget
+RATE_LIMITS = {
+    "youtube": {"RATE": 2, "BURST": 10, "TIMEOUT": 30},
+    "gemini": {"RATE": 6, "BURST": 30, "TIMEOUT": 30},
+    "gemini:gemini-2.5-flash": {"RATE": 1, "BURST": 10, "TIMEOUT": 30},
+    "gemini:models/text-embedding-004": {"RATE": 5, "BURST": 20, "TIMEOUT": 60},
+    "groq": {"RATE": 0.5, "BURST": 5, "TIMEOUT": 30},
+    "huggingface": {"RATE": 0.2, "BURST": 2, "TIMEOUT": 60},
+}
+
+# Chat history sent to the agent: the latest messages within TOKEN_BUDGET
+# (estimated tokens), older ones are folded into the session's summary
+CHAT_HISTORY = {
+    "TOKEN_BUDGET": 3000,
+    "MAX_MESSAGES": 100,
+    # Conversation cache (see ConversationCacheService), kept while active
+    "CACHE_TTL": 60 * 60 * 24,
+    "SUMMARY_MODEL": "llama-3.1-8b-instant",
+    "SUMMARY_MAX_TOKENS": 500,
+    "SUMMARY_LOCK_TTL": 300,
+}
+
+# Agent tool results reused per video and arguments (see
+# ToolResultCacheService), TTL in seconds per tool. Tools not listed, such as
+# title and image generation, always run
+AGENT_TOOL_CACHE = {
+    "TTL": {
+        "get_video_info": 60 * 5,
+        "get_transcript": 60 * 60,
+        "search_transcript": 60 * 60,
+    },
+}
+
+# Title generation (see TitleGenerationService). Lengths are in characters,
+# EXTRA_CANDIDATES are requested on top of the count to replace rejected ones
+TITLE_GENERATION = {
+    "MODEL": "llama-3.3-70b-versatile",
+    "MAX_COUNT": 10,
+    "EXTRA_CANDIDATES": 3,
+    "MIN_LENGTH": 15,
+    "MAX_LENGTH": 100,
+    "IDEAL_LENGTH": (50, 60),
+}
+
 # AI
 HUGGINGFACE_API_KEY = config("HUGGINGFACE_API_KEY", default=None)
 GROQ_API_KEY = config("GROQ_API_KEY", default=None)
@@ -18,7 +18,11 @@ const VideoAnalysisPage = () => {
 
   const newVideoAnalysis = searchParams.get("isNew") === "true";
 
-  const videoStatus = useVideoAnalysisTask(videoId).taskStatus;
+  const {
+    taskStatus: videoStatus,
+    videoInfo,
+    transcript,
+  } = useVideoAnalysisTask(videoId);
 
   const videoIsLoading =
     videoStatus?.status == "STARTED" || videoStatus?.status == "PROCESSING";
@@ -64,8 +68,8 @@ const VideoAnalysisPage = () => {
 
           {/** Youtube video Details Section */}
           <YoutubeVideoDetails
-            videoInfo={videoStatus?.data?.video_info}
-            isLoading={videoIsLoading}
+            videoInfo={videoInfo}
+            isLoading={videoIsLoading && !videoInfo}
           />
           {/** Thumbnail Generation Section */}
           <ThumbnailGeneration videoId={videoId} />
@@ -73,7 +77,7 @@ const VideoAnalysisPage = () => {
           <TitleGeneration videoId={videoId} />
           {/**  Transcription Section */}
           <Transcription
-            transcript={videoStatus?.data?.video_transcript}
+            transcript={transcript}
             isLoading={videoIsLoading}
           />
         </div>
@@ -21,16 +21,22 @@ const ZAIAgentFormSchema = z.object({
 
 export type TAIAgentFormSchema = z.infer<typeof ZAIAgentFormSchema>;
 
-const TOOL_NAME_MAPPINGS = {
-  "tool-fetchTranscript": "Fetch Transcript",
+const TOOL_NAME_MAPPINGS: Record<string, string> = {
+  get_video_info: "Fetching video info",
+  get_transcript: "Reading transcript",
+  search_transcript: "Searching transcript",
+  generate_image: "Generating thumbnail",
+  generate_title: "Generating title",
+  generate_titles: "Generating titles",
 };
 
 export const AIAgentChat = ({ videoId }: { videoId: string }) => {
   const bottomRef = useRef<HTMLDivElement>(null);
   const messageContentRef = useRef<HTMLDivElement>(null);
-  const { messages, sendMessage, status } = useAIChat({
-    videoId,
-  });
+  const { messages, sendMessage, status, streamingContent, activeTool } =
+    useAIChat({
+      videoId,
+    });
 
   const [toastId, setToastId] = useState<number | string | undefined>(
     undefined
@@ -48,10 +54,15 @@ export const AIAgentChat = ({ videoId }: { videoId: string }) => {
 
       case "streaming":
         setToastId(
-          toast.info("Agent is replying...", {
-            id: toastId,
-            icon: <BotIcon className="w-4 h-4" />,
-          })
+          toast.info(
+            activeTool
+              ? `${TOOL_NAME_MAPPINGS[activeTool] ?? activeTool}...`
+              : "Agent is replying...",
+            {
+              id: toastId,
+              icon: <BotIcon className="w-4 h-4" />,
+            }
+          )
         );
         break;
 
@@ -69,14 +80,14 @@ export const AIAgentChat = ({ videoId }: { videoId: string }) => {
         setToastId(undefined);
         break;
     }
-  }, [status]);
+  }, [status, activeTool]);
 
   useEffect(() => {
     if (messageContentRef.current && bottomRef.current) {
       messageContentRef.current.scrollTop =
         messageContentRef.current.scrollHeight;
     }
-  }, [messages]);
+  }, [messages, streamingContent]);
 
   const form = useForm<TAIAgentFormSchema>({
     values: {
@@ -159,6 +170,15 @@ export const AIAgentChat = ({ videoId }: { videoId: string }) => {
                 </div>
               </div>
             ))}
+            {streamingContent && (
+              <div className="flex justify-start">
+                <div className="max-w-[85%] bg-[#3e3e68] [&_*]:text-gray-200 rounded-2xl px-4 py-3">
+                  <div className="prose prose-sm max-w-none  [&_*]:text-wrap">
+                    <ReactMarkdown>{streamingContent}</ReactMarkdown>
+                  </div>
+                </div>
+              </div>
+            )}
             <div ref={bottomRef} />
           </div>
         </div>
@@ -4,7 +4,7 @@ import { useCallback, useEffect, useState } from "react";
 
 import { Usage } from "./usage";
 
-import type { VideoAnalysisTaskData } from "@/lib/websocket/video-analysis-task-websocket";
+import type { TranscriptSegment } from "@/lib/websocket/video-analysis-task-websocket";
 
 interface TranscriptEntry {
   id: number;
@@ -16,7 +16,7 @@ export const Transcription = ({
   transcript,
   isLoading = true,
 }: {
-  transcript: VideoAnalysisTaskData["video_transcript"] | undefined;
+  transcript: TranscriptSegment[] | undefined;
   isLoading: boolean;
 }) => {
   const featureUsageExceeded = false;
@@ -6,6 +6,8 @@ import type {
   GetVideoTitlesResponse,
   GetVideoImagesPayload,
   GetVideoImagesResponse,
+  GetVideoTranscriptPayload,
+  GetVideoTranscriptResponse,
 } from "./types";
 
 export const createVideo = async ({
@@ -37,3 +39,16 @@ export const getVideoImages = async ({
 
   return response.data;
 };
+
+export const getVideoTranscript = async ({
+  videoId,
+  offset = 0,
+  limit,
+}: GetVideoTranscriptPayload): Promise<GetVideoTranscriptResponse> => {
+  const response = await api.get<GetVideoTranscriptResponse>(
+    `/videos/${videoId}/transcript/`,
+    { params: { offset, limit } }
+  );
+
+  return response.data;
+};
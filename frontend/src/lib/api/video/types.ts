@@ -1,3 +1,5 @@
+import type { TranscriptSegment } from "@/lib/websocket/video-analysis-task-websocket";
+
 export type CreateVideoPayload = {
   url: string;
 };
@@ -56,3 +58,19 @@ export type VideoImage = {
 export type GetVideoImagesPayload = GetVideoTitlesPayload;
 
 export type GetVideoImagesResponse = VideoImage[];
+
+export type GetVideoTranscriptPayload = {
+  videoId: string;
+  offset?: number;
+  limit?: number;
+};
+
+export type GetVideoTranscriptResponse = {
+  segments: TranscriptSegment[];
+  language: string;
+  is_complete: boolean;
+  offset: number;
+  limit: number;
+  total: number;
+  next_offset: number | null;
+};
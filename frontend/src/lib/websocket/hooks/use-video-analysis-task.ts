@@ -1,14 +1,36 @@
 import { useState, useEffect } from "react";
 
+import { getVideoTranscript } from "@/lib/api/video/fetchers";
 import {
   VideoAnalysisTaskWebSocket,
   type VideoAnalysisTaskEventPayload,
+  type TranscriptSegment,
+  type VideoInfo,
 } from "../video-analysis-task-websocket";
 
 export const useVideoAnalysisTask = (taskId: string | null) => {
   const [taskStatus, setTaskStatus] =
     useState<VideoAnalysisTaskEventPayload | null>(null);
   const [isConnected, setIsConnected] = useState(false);
+  const [transcript, setTranscript] = useState<TranscriptSegment[] | undefined>(
+    undefined
+  );
+  const [videoInfo, setVideoInfo] = useState<VideoInfo | undefined>(undefined);
+
+  const loadTranscript = async (videoId: string, segmentCount: number) => {
+    const segments: TranscriptSegment[] = [];
+    let offset: number | null = 0;
+
+    while (offset !== null) {
+      const page = await getVideoTranscript({ videoId, offset });
+      segments.push(...page.segments);
+      offset = page.next_offset;
+    }
+
+    setTranscript((prev) =>
+      prev && prev.length >= segmentCount ? prev : segments
+    );
+  };
 
   useEffect(() => {
     if (!taskId) return;
@@ -20,11 +42,30 @@ export const useVideoAnalysisTask = (taskId: string | null) => {
         type: data.type,
         status: data.status,
         message: data.message,
+        step: data.step,
         data: data?.data,
         error: data?.error,
       });
+
+      // Video info arrives as soon as its step is done, before the transcript
+      if (data.data?.video_info) {
+        setVideoInfo(data.data.video_info);
+      }
+
+      // Completed tasks only reference the transcript, load whatever
+      // wasn't streamed to this connection
+      const reference = data.data?.transcript;
+      if (data.status === "COMPLETED" && reference) {
+        loadTranscript(taskId, reference.segment_count).catch((err) =>
+          console.error("❌ Failed to load transcript:", err)
+        );
+      }
     });
 
+    const transcriptUnsubscriber = ws.onTranscriptChunk(({ offset, segments }) =>
+      setTranscript((prev) => [...(prev ?? []).slice(0, offset), ...segments])
+    );
+
     ws.connect()
       .then(() => setIsConnected(true))
       .catch((err) => {
@@ -38,6 +79,7 @@ export const useVideoAnalysisTask = (taskId: string | null) => {
 
     return () => {
       unsubscriber();
+      transcriptUnsubscriber();
       ws.disconnect();
     };
   }, [taskId]);
@@ -45,5 +87,7 @@ export const useVideoAnalysisTask = (taskId: string | null) => {
   return {
     isConnected,
     taskStatus,
+    videoInfo,
+    transcript,
   };
 };
@@ -16,6 +16,8 @@ export const useAIChat = ({ videoId }: { videoId: string }) => {
   const wsRef = useRef<WebSocket | null>(null);
   const [sessionID, setSessionID] = useState<string | null>(null);
   const currentResponseRef = useRef<string>("");
+  const [streamingContent, setStreamingContent] = useState<string>("");
+  const [activeTool, setActiveTool] = useState<string | null>(null);
 
   const { mutateAsync } = useMutation({
     mutationKey: ["chat-session", "create"],
@@ -57,9 +59,19 @@ export const useAIChat = ({ videoId }: { videoId: string }) => {
         switch (data.type) {
           case "message_chunk":
             currentResponseRef.current += data.content;
+            setStreamingContent(currentResponseRef.current);
             setStatus("streaming");
             break;
 
+          case "tool_start":
+            setActiveTool(data.tool);
+            setStatus("streaming");
+            break;
+
+          case "tool_end":
+            setActiveTool(null);
+            break;
+
           case "message_complete":
             const content = currentResponseRef.current as string;
             setMessages((prev) => [
@@ -73,11 +85,16 @@ export const useAIChat = ({ videoId }: { videoId: string }) => {
               },
             ]);
             currentResponseRef.current = "";
+            setStreamingContent("");
+            setActiveTool(null);
             setStatus("ready");
             break;
 
           case "error":
             console.error("💬❌ Chat error:", data.message);
+            currentResponseRef.current = "";
+            setStreamingContent("");
+            setActiveTool(null);
             setStatus("error");
             break;
         }
@@ -119,5 +136,7 @@ export const useAIChat = ({ videoId }: { videoId: string }) => {
     sendMessage,
     status,
     currentResponseRef,
+    streamingContent,
+    activeTool,
   };
 };
@@ -5,41 +5,70 @@ interface VideoAnalysisTaskStatusCallback {
   (data: VideoAnalysisTaskEventPayload): void;
 }
 
-export interface VideoAnalysisTaskData {
-  video_info: {
-    title: string;
-    description: string;
+interface TranscriptChunkCallback {
+  (data: TranscriptChunkEventPayload): void;
+}
+
+export interface VideoInfo {
+  title: string;
+  description: string;
+  thumbnail: string;
+  thumbnail_high_res: string;
+  duration: number; // seconds
+  view_count: number;
+  like_count: number;
+  comment_count: number;
+  published_at: string; // ISO format
+  channel: {
+    id: string;
+    name: string;
+    subscriber_count: number;
     thumbnail: string;
-    thumbnail_high_res: string;
-    duration: number; // seconds
-    view_count: number;
-    like_count: number;
-    comment_count: number;
-    published_at: string; // ISO format
-    channel: {
-      id: string;
-      name: string;
-      subscriber_count: number;
-      thumbnail: string;
-    };
   };
-  video_transcript: {
-    text: string;
-    timestamp: string;
-  }[];
 }
+
+// Reference to the stored transcript, fetched from `url` page by page
+export interface TranscriptReference {
+  id: number;
+  language: string;
+  segment_count: number;
+  url: string;
+}
+
+export interface VideoAnalysisTaskData {
+  video_info: VideoInfo | null;
+  transcript: TranscriptReference | null;
+}
+
+export interface TranscriptSegment {
+  text: string;
+  timestamp: string;
+  start?: number; // seconds
+  duration?: number; // seconds
+}
+
 export interface VideoAnalysisTaskEventPayload {
   type: string;
   message: string;
   status: "STARTED" | "PROCESSING" | "COMPLETED" | "RETRY" | "FAILURE";
-  data?: VideoAnalysisTaskData;
+  // Metadata and transcript are fetched concurrently, PROCESSING events
+  // name the step they belong to and may carry that step's partial data
+  step?: "video_info" | "transcript" | null;
+  data?: Partial<VideoAnalysisTaskData> | null;
   error?: any;
 }
 
+export interface TranscriptChunkEventPayload {
+  type: "transcript_chunk";
+  offset: number;
+  segments: TranscriptSegment[];
+}
+
 export class VideoAnalysisTaskWebSocket {
   private ws: WebSocket | null = null;
   private videoId: string;
   private callbacks: VideoAnalysisTaskStatusCallback[] = [];
+  private transcriptCallbacks: TranscriptChunkCallback[] = [];
   private reconnectAttempts: number = 0;
   private maxReconnectAttempts: number = 5;
   private reconnectDelay: number = 2000;
@@ -67,14 +96,16 @@ export class VideoAnalysisTaskWebSocket {
 
       this.ws.onmessage = (event) => {
         try {
-          const data: VideoAnalysisTaskEventPayload = JSON.parse(event.data);
+          const data = JSON.parse(event.data);
           console.log("📩 Received WebSocket message:", data);
 
-          this.callbacks.forEach((callback) => callback(data));
-
-          if (data.status === "COMPLETED" || data.status === "FAILURE") {
-            setTimeout(() => this.disconnect(), 1000);
+          // Updates sent close together arrive as one batch frame
+          if (data.type === "batch") {
+            data.events.forEach(this.handleMessage);
+            return;
           }
+
+          this.handleMessage(data);
         } catch (err) {
           console.error("❌ Error parsing WebSocket message:", err);
         }
@@ -104,6 +135,19 @@ export class VideoAnalysisTaskWebSocket {
     });
   };
 
+  private handleMessage = (data: any): void => {
+    if (data.type === "transcript_chunk") {
+      this.transcriptCallbacks.forEach((callback) => callback(data));
+      return;
+    }
+
+    this.callbacks.forEach((callback) => callback(data));
+
+    if (data.status === "COMPLETED" || data.status === "FAILURE") {
+      setTimeout(() => this.disconnect(), 1000);
+    }
+  };
+
   onStatusUpdate = (
     callback: VideoAnalysisTaskStatusCallback
   ): (() => void) => {
@@ -114,6 +158,16 @@ export class VideoAnalysisTaskWebSocket {
     };
   };
 
+  onTranscriptChunk = (callback: TranscriptChunkCallback): (() => void) => {
+    this.transcriptCallbacks.push(callback);
+
+    return () => {
+      this.transcriptCallbacks = this.transcriptCallbacks.filter(
+        (cb) => cb !== callback
+      );
+    };
+  };
+
   disconnect = (): void => {
     if (this.ws) {
       this.ws.close(1000, "Clinet disconnected");